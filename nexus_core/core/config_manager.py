@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import pathlib
 from copy import deepcopy
@@ -68,9 +69,11 @@ class ConfigSchema(BaseModel):
     # Event bus configuration
     event_bus: Dict[str, Any] = Field(
         default_factory=lambda: {
+            "mode": "threaded",  # sync, threaded, async
             "thread_pool_size": 4,
+            "worker_idle_timeout": 30.0,
             "max_queue_size": 1000,
-            "publish_timeout": 5.0,
+            "event_pool_size": 0,
             "external": {
                 "enabled": False,
                 "type": "rabbitmq",
@@ -147,6 +150,7 @@ class ConfigSchema(BaseModel):
         default_factory=lambda: {
             "directory": "plugins",
             "autoload": True,
+            "lazy": False,
             "enabled": [],
             "disabled": [],
         },
@@ -178,6 +182,7 @@ class ConfigSchema(BaseModel):
                 "disk_percent": 90,
             },
             "metrics_interval_seconds": 10,
+            "metrics_batch_size": 1,
         },
         description="Monitoring settings",
     )
@@ -267,6 +272,10 @@ class ConfigManager(NexusManager):
         self._env_vars_applied: Set[str] = set()
         self._listeners: Dict[str, List[Callable[[str, Any], None]]] = {}
 
+        # The Logging Manager depends on configuration, so use the standard
+        # logging module here; its handlers are attached once logging starts.
+        self._logger = logging.getLogger("config_manager")
+
     def initialize(self) -> None:
         """Initialize the Configuration Manager.
 
@@ -544,7 +553,10 @@ class ConfigManager(NexusManager):
 
         except Exception as e:
             # Log the error but don't raise - config is still valid in memory
-            print(f"Error saving configuration to {self._config_path}: {str(e)}")
+            self._logger.error(
+                f"Error saving configuration to {self._config_path}: {str(e)}",
+                exc_info=True,
+            )
 
     def _merge_config(
         self, from_config: Dict[str, Any], to_config: Optional[Dict[str, Any]] = None
@@ -618,7 +630,10 @@ class ConfigManager(NexusManager):
                         callback(key, value)
                     except Exception as e:
                         # Log the error but continue
-                        print(f"Error in config listener for {key}: {str(e)}")
+                        self._logger.error(
+                            f"Error in config listener for {key}: {str(e)}",
+                            exc_info=True,
+                        )
 
             # Prefix match (e.g., "database" should match "database.host")
             elif key.startswith(f"{listener_key}."):
@@ -627,7 +642,10 @@ class ConfigManager(NexusManager):
                         callback(key, value)
                     except Exception as e:
                         # Log the error but continue
-                        print(f"Error in config listener for {key}: {str(e)}")
+                        self._logger.error(
+                            f"Error in config listener for {key}: {str(e)}",
+                            exc_info=True,
+                        )
 
     def shutdown(self) -> None:
         """Shut down the Configuration Manager.
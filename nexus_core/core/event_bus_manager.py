@@ -1,14 +1,59 @@
 from __future__ import annotations
 
-import concurrent.futures
-import queue
+import asyncio
+import collections
+import dataclasses
+import inspect
+import itertools
 import threading
-import uuid
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+import time
+from typing import Any, Callable, Counter, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import EventBusError, ManagerInitializationError, ManagerShutdownError
-from nexus_core.core.event_model import Event, EventSubscription
+from nexus_core.core.event_model import (
+    EMPTY_PAYLOAD,
+    Event,
+    EventFilter,
+    EventSubscription,
+    generate_id,
+)
+
+# Filtered subscriptions grouped by their shared filter
+FilterGroup = Tuple[EventFilter, Tuple[EventSubscription, ...]]
+
+# Cached subscriptions for one event type: (filterless, filter groups)
+SubscriptionCacheEntry = Tuple[Tuple[EventSubscription, ...], Tuple[FilterGroup, ...]]
+
+# A queued event and the subscriptions it should be delivered to
+QueuedEvent = Tuple[Event, Sequence[EventSubscription]]
+
+_EMPTY_CACHE_ENTRY: SubscriptionCacheEntry = ((), ())
+
+# Maximum number of events a worker takes from its queue per pass
+_WORKER_BATCH_SIZE = 32
+
+# Queue depth at which publish starts another worker, up to thread_pool_size
+_WORKER_SPAWN_DEPTH = _WORKER_BATCH_SIZE
+
+# Number of independently locked shards the subscriptions are spread across
+_SUBSCRIPTION_SHARDS = 16
+
+# A lock and the subscriptions (event type -> subscriber ID -> subscription) it guards
+SubscriptionShard = Tuple[threading.Lock, Dict[str, Dict[str, EventSubscription]]]
+
+
+@dataclasses.dataclass(slots=True, eq=False)
+class _EventWorker:
+    """A worker thread and the event queue it delivers from.
+    
+    A None entry in the queue tells the worker to exit once it reaches it.
+    """
+    
+    queue: Deque[Optional[QueuedEvent]] = dataclasses.field(default_factory=collections.deque)
+    waker: threading.Event = dataclasses.field(default_factory=threading.Event)
+    thread: Optional[threading.Thread] = None
+    retired: bool = False
 
 
 class EventBusManager(NexusManager):
@@ -19,7 +64,12 @@ class EventBusManager(NexusManager):
     events and subscribe to events they're interested in without direct coupling.
     
     This implementation provides both synchronous and asynchronous event delivery,
-    with configurable thread pools for handling event processing.
+    with configurable thread pools for handling event processing. Setting
+    ``event_bus.mode`` to ``async`` replaces the worker threads with an asyncio
+    event loop, which also allows coroutine functions to be used as callbacks.
+    Setting it to ``sync`` delivers every event in the publishing thread with no
+    workers at all, which suits low event rates; callbacks must then be quick
+    and non-blocking since they hold up the publisher.
     """
     
     def __init__(self, config_manager: Any, logger_manager: Any) -> None:
@@ -34,20 +84,44 @@ class EventBusManager(NexusManager):
         self._logger_manager = logger_manager
         self._logger = logger_manager.get_logger("event_bus")
         
-        # Thread pool for asynchronous event processing
-        self._thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
         self._max_queue_size = 1000
-        self._publish_timeout = 5.0
-        
-        # Event subscriptions
-        self._subscriptions: Dict[str, Dict[str, EventSubscription]] = {}
-        self._subscription_lock = threading.RLock()
         
-        # Event queue for asynchronous processing
-        self._event_queue: Optional[queue.Queue] = None
-        self._worker_threads: List[threading.Thread] = []
+        # Recycled Event instances (disabled unless event_pool_size > 0)
+        self._event_pool: Deque[Event] = collections.deque(maxlen=0)
+        
+        # Event subscriptions, sharded by event type so that changes to
+        # unrelated event types don't contend on one lock
+        self._shards: List[SubscriptionShard] = [
+            (threading.Lock(), {}) for _ in range(_SUBSCRIPTION_SHARDS)
+        ]
+        
+        # Running subscription counts so status() needn't scan the shards
+        self._total_subscriptions = 0
+        self._subscriber_counts: Counter[str] = collections.Counter()
+        self._counts_lock = threading.Lock()
+        
+        # Immutable per-event-type snapshots read by publish without locking,
+        # rebuilt under the shard lock whenever subscriptions change
+        self._sub_cache: Dict[str, SubscriptionCacheEntry] = {}
+        
+        # One event queue and wake-up flag per worker thread, so publishers and
+        # workers don't all contend on a single queue lock. Workers are started
+        # on demand and retire when idle; the tuple is replaced, never mutated,
+        # so publish can read it without locking.
+        self._workers: Tuple[_EventWorker, ...] = ()
+        self._worker_lock = threading.Lock()
+        self._max_workers = 4
+        self._worker_idle_timeout = 30.0
+        self._worker_capacity = self._max_queue_size
+        self._caller_runs = 0
+        self._next_worker = itertools.count()
+        self._worker_ids = itertools.count()
         self._running = False
-        self._stop_event = threading.Event()
+        
+        # Dispatch mode and, in async mode, the event loop and its thread
+        self._mode = "threaded"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
     
     def initialize(self) -> None:
         """Initialize the Event Bus Manager.
@@ -62,28 +136,29 @@ class EventBusManager(NexusManager):
             # Get configuration
             event_bus_config = self._config_manager.get("event_bus", {})
             thread_pool_size = event_bus_config.get("thread_pool_size", 4)
+            self._worker_idle_timeout = event_bus_config.get("worker_idle_timeout", 30.0)
             self._max_queue_size = event_bus_config.get("max_queue_size", 1000)
-            self._publish_timeout = event_bus_config.get("publish_timeout", 5.0)
-            
-            # Create thread pool
-            self._thread_pool = concurrent.futures.ThreadPoolExecutor(
-                max_workers=thread_pool_size,
-                thread_name_prefix="event-worker",
-            )
+            if "publish_timeout" in event_bus_config:
+                # A full queue makes the publisher deliver the event itself
+                # instead of waiting, so there is no timeout to apply
+                self._logger.warning(
+                    "event_bus.publish_timeout is deprecated and ignored",
+                )
             
-            # Create event queue for asynchronous processing
-            self._event_queue = queue.Queue(maxsize=self._max_queue_size)
+            # Pooled events are reused once their callbacks return, so this is
+            # only safe when subscribers do not keep references to events
+            event_pool_size = event_bus_config.get("event_pool_size", 0)
+            self._event_pool = collections.deque(maxlen=event_pool_size)
             
-            # Start worker threads
+            self._mode = event_bus_config.get("mode", "threaded")
             self._running = True
-            for i in range(thread_pool_size):
-                worker = threading.Thread(
-                    target=self._event_worker,
-                    name=f"event-worker-{i}",
-                    daemon=True,
-                )
-                worker.start()
-                self._worker_threads.append(worker)
+            
+            if self._mode == "async":
+                self._start_event_loop()
+            elif self._mode == "threaded":
+                self._start_workers(thread_pool_size)
+            elif self._mode != "sync":
+                raise EventBusError(f"Unknown event bus mode: {self._mode}")
             
             # Register for config changes
             self._config_manager.register_listener("event_bus", self._on_config_changed)
@@ -99,39 +174,134 @@ class EventBusManager(NexusManager):
                 manager_name=self.name,
             ) from e
     
-    def _event_worker(self) -> None:
-        """Worker thread function for processing events from the queue."""
-        while self._running and not self._stop_event.is_set():
+    def _start_workers(self, thread_pool_size: int) -> None:
+        """Prepare threaded mode and start its first worker thread.
+        
+        Further workers are started by publish as queues back up.
+        
+        Args:
+            thread_pool_size: The maximum number of worker threads.
+        """
+        # Split the queue capacity evenly across the largest number of workers
+        self._max_workers = max(1, thread_pool_size)
+        self._worker_capacity = max(1, -(-self._max_queue_size // self._max_workers))
+        
+        self._spawn_worker()
+    
+    def _spawn_worker(self) -> None:
+        """Start another worker thread if the pool is not already at its maximum."""
+        with self._worker_lock:
+            if not self._running or len(self._workers) >= self._max_workers:
+                return
+            
+            worker = _EventWorker()
+            worker.thread = threading.Thread(
+                target=self._event_worker,
+                args=(worker,),
+                name=f"event-worker-{next(self._worker_ids)}",
+                daemon=True,
+            )
+            worker.thread.start()
+            self._workers = self._workers + (worker,)
+        
+        self._logger.debug(f"Started event worker, {len(self._workers)} running")
+    
+    def _retire_worker(self, worker: _EventWorker) -> bool:
+        """Remove an idle worker from the pool, always keeping at least one.
+        
+        Args:
+            worker: The worker that has been idle for the idle timeout.
+        
+        Returns:
+            bool: True if the worker was removed and should exit.
+        """
+        with self._worker_lock:
+            if not self._running or len(self._workers) <= 1:
+                return False
+            
+            self._workers = tuple(w for w in self._workers if w is not worker)
+            worker.retired = True
+        
+        self._logger.debug(f"Retired idle event worker, {len(self._workers)} running")
+        return True
+    
+    def _drain_worker_queue(self, worker: _EventWorker) -> None:
+        """Deliver whatever is left in a retired worker's queue.
+        
+        Run by the retiring worker itself, and by any publisher that raced it
+        and appended to its queue afterwards.
+        
+        Args:
+            worker: The retired worker whose queue should be emptied.
+        """
+        while True:
+            try:
+                item = worker.queue.popleft()
+            except IndexError:
+                return
+            
+            if item is not None:
+                event, subscriptions = item
+                self._process_event_sync(event, subscriptions)
+                self._release_event(event)
+    
+    def _start_event_loop(self) -> None:
+        """Start the event loop thread used in async mode."""
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="event-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
+    
+    def _event_worker(self, worker: _EventWorker) -> None:
+        """Worker thread function for processing events from its own queue.
+        
+        Args:
+            worker: The worker record owned by this thread.
+        """
+        event_queue = worker.queue
+        waker = worker.waker
+        popleft = event_queue.popleft
+        process_event = self._process_event_sync
+        release_event = self._release_event
+        
+        while True:
+            # Drain a batch in queue order, so events stay ordered per worker
+            batch: List[Optional[QueuedEvent]] = []
             try:
-                # Get next event from queue with timeout
-                event, subscriptions = self._event_queue.get(timeout=0.1)
+                while len(batch) < _WORKER_BATCH_SIZE:
+                    batch.append(popleft())
+            except IndexError:
+                pass
+            
+            if not batch:
+                # Clear before re-checking so a concurrent publish is never missed
+                waker.clear()
+                if not event_queue and not waker.wait(timeout=self._worker_idle_timeout):
+                    if self._retire_worker(worker):
+                        self._drain_worker_queue(worker)
+                        return
+                continue
+            
+            for item in batch:
+                if item is None:
+                    # Shutdown sentinel; everything queued before it has been delivered
+                    return
+                
+                event, subscriptions = item
                 
                 try:
                     # Process event (call all subscriber callbacks)
-                    for subscription in subscriptions:
-                        try:
-                            subscription.callback(event)
-                        except Exception as e:
-                            self._logger.error(
-                                f"Error in event handler for {event.event_type}: {str(e)}",
-                                extra={
-                                    "event_id": event.event_id,
-                                    "subscription_id": subscription.subscriber_id,
-                                    "error": str(e),
-                                },
-                            )
+                    process_event(event, subscriptions)
+                
+                except Exception as e:
+                    # Log any unexpected errors but keep the worker running
+                    self._logger.error(f"Unexpected error in event worker: {str(e)}")
                 
                 finally:
-                    # Mark task as done
-                    self._event_queue.task_done()
-            
-            except queue.Empty:
-                # No events to process, just continue waiting
-                continue
-            
-            except Exception as e:
-                # Log any unexpected errors but keep the worker running
-                self._logger.error(f"Unexpected error in event worker: {str(e)}")
+                    release_event(event)
     
     def publish(
         self,
@@ -150,6 +320,8 @@ class EventBusManager(NexusManager):
             correlation_id: Optional ID for tracking related events.
             synchronous: If True, process the event synchronously (blocking).
                          If False, queue the event for asynchronous processing.
+                         If the worker queue is full, the event is processed
+                         in the calling thread instead.
         
         Returns:
             str: The ID of the published event.
@@ -163,66 +335,233 @@ class EventBusManager(NexusManager):
                 event_type=event_type,
             )
         
+        if not self._has_subscribers(event_type):
+            # Nothing can receive this event, so don't build one
+            event_id = generate_id()
+            self._logger.debug(
+                f"No subscribers for event {event_type}",
+                extra={"event_id": event_id},
+            )
+            return event_id
+        
         # Create the event
-        event = Event.create(
-            event_type=event_type,
-            source=source,
-            payload=payload or {},
-            correlation_id=correlation_id,
-        )
+        event = self._acquire_event(event_type, source, payload, correlation_id)
+        event_id = event.event_id
         
         # Find matching subscriptions
         matching_subs = self._get_matching_subscriptions(event)
         
         if not matching_subs:
-            # No subscribers for this event
+            # No subscriber filters matched this event
             self._logger.debug(
                 f"No subscribers for event {event_type}",
-                extra={"event_id": event.event_id},
+                extra={"event_id": event_id},
             )
-            return event.event_id
+            self._release_event(event)
+            return event_id
         
-        if synchronous:
+        if self._loop is not None:
+            # Deliver on the event loop, waiting for completion if synchronous
+            if synchronous and threading.current_thread() is self._loop_thread:
+                self._release_event(event)
+                raise EventBusError(
+                    "Cannot publish synchronously from the event loop thread, "
+                    "use publish_async instead",
+                    event_type=event_type,
+                )
+            
+            future = asyncio.run_coroutine_threadsafe(
+                self._deliver_async(event, matching_subs), self._loop
+            )
+            if synchronous:
+                future.result()
+        elif synchronous or self._mode == "sync":
             # Process event synchronously
             self._process_event_sync(event, matching_subs)
+            self._release_event(event)
         else:
-            # Queue event for asynchronous processing
-            try:
-                if self._event_queue is None:
-                    raise EventBusError(
-                        "Event queue is not initialized",
-                        event_type=event_type,
-                    )
-                
-                self._event_queue.put(
-                    (event, matching_subs),
-                    block=True,
-                    timeout=self._publish_timeout,
-                )
-            
-            except queue.Full:
-                self._logger.error(
-                    f"Event queue is full, cannot publish event {event_type}",
-                    extra={"event_id": event.event_id},
-                )
+            # Queue event for asynchronous processing on the next worker
+            workers = self._workers
+            if not workers:
+                self._release_event(event)
                 raise EventBusError(
-                    f"Event queue is full, cannot publish event {event_type}",
+                    "Event queue is not initialized",
                     event_type=event_type,
                 )
+            
+            worker = workers[next(self._next_worker) % len(workers)]
+            depth = len(worker.queue)
+            
+            if depth >= self._worker_capacity:
+                # Apply backpressure by delivering in the publishing thread
+                self._caller_runs += 1
+                self._logger.warning(
+                    f"Event queue is full, delivering event {event_type} in the publishing thread",
+                    extra={"event_id": event_id},
+                )
+                self._process_event_sync(event, matching_subs)
+                self._release_event(event)
+            else:
+                worker.queue.append((event, matching_subs))
+                worker.waker.set()
+                
+                if worker.retired:
+                    # The worker retired after we picked it and may already
+                    # have drained its queue, so deliver what it left behind
+                    self._drain_worker_queue(worker)
+                elif depth >= _WORKER_SPAWN_DEPTH and len(workers) < self._max_workers:
+                    self._spawn_worker()
         
         self._logger.debug(
             f"Published event {event_type}",
             extra={
-                "event_id": event.event_id,
+                "event_id": event_id,
                 "source": source,
                 "subscribers": len(matching_subs),
                 "synchronous": synchronous,
             },
         )
         
-        return event.event_id
+        return event_id
     
-    def _process_event_sync(self, event: Event, subscriptions: List[EventSubscription]) -> None:
+    async def publish_async(
+        self,
+        event_type: str,
+        source: str,
+        payload: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None,
+    ) -> str:
+        """Publish an event and wait until every subscriber has handled it.
+        
+        In async mode the event is delivered on the event bus loop, and this
+        coroutine may be awaited from that loop or any other. In threaded mode
+        the event is queued for the worker threads as with ``publish``.
+        
+        Args:
+            event_type: The type of event being published.
+            source: The source component that is publishing the event.
+            payload: Optional data associated with the event.
+            correlation_id: Optional ID for tracking related events.
+        
+        Returns:
+            str: The ID of the published event.
+            
+        Raises:
+            EventBusError: If the event cannot be published.
+        """
+        if self._loop is None:
+            return self.publish(event_type, source, payload, correlation_id)
+        
+        if not self._initialized:
+            raise EventBusError(
+                "Cannot publish events before initialization",
+                event_type=event_type,
+            )
+        
+        if not self._has_subscribers(event_type):
+            return generate_id()
+        
+        event = self._acquire_event(event_type, source, payload, correlation_id)
+        event_id = event.event_id
+        
+        matching_subs = self._get_matching_subscriptions(event)
+        if not matching_subs:
+            self._release_event(event)
+            return event_id
+        
+        delivery = self._deliver_async(event, matching_subs)
+        if asyncio.get_running_loop() is self._loop:
+            await delivery
+        else:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(delivery, self._loop)
+            )
+        
+        return event_id
+    
+    async def _deliver_async(
+        self, event: Event, subscriptions: Sequence[EventSubscription]
+    ) -> None:
+        """Deliver an event to its subscribers on the event loop.
+        
+        Coroutine callbacks run as tasks on the loop; regular callbacks run in
+        the loop's default executor so they cannot block it.
+        
+        Args:
+            event: The event to deliver.
+            subscriptions: The subscriptions that match the event.
+        """
+        loop = asyncio.get_running_loop()
+        pending = [
+            subscription.callback(event)
+            if inspect.iscoroutinefunction(subscription.callback)
+            else loop.run_in_executor(None, subscription.callback, event)
+            for subscription in subscriptions
+        ]
+        
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for subscription, result in zip(subscriptions, results):
+            if isinstance(result, Exception):
+                self._log_callback_error(event, subscription, result)
+        
+        self._release_event(event)
+    
+    async def _drain_async(self) -> None:
+        """Wait for all in-flight deliveries on the event loop to finish."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _acquire_event(
+        self,
+        event_type: str,
+        source: str,
+        payload: Optional[Dict[str, Any]],
+        correlation_id: Optional[str],
+    ) -> Event:
+        """Get an event from the pool, or create one if the pool is empty.
+        
+        Args:
+            event_type: The type of event being published.
+            source: The source component that is publishing the event.
+            payload: Optional data associated with the event.
+            correlation_id: Optional ID for tracking related events.
+        
+        Returns:
+            Event: An event populated with the given values and a fresh ID and timestamp.
+        """
+        try:
+            event = self._event_pool.pop()
+        except IndexError:
+            return Event.create(
+                event_type=event_type,
+                source=source,
+                payload=payload,
+                correlation_id=correlation_id,
+            )
+        
+        event.event_type = event_type
+        event.event_id = generate_id()
+        event.timestamp_ns = time.time_ns()
+        event.source = source
+        event.payload = payload if payload else EMPTY_PAYLOAD
+        event.correlation_id = correlation_id
+        return event
+    
+    def _release_event(self, event: Event) -> None:
+        """Return an event to the pool once all of its callbacks have run.
+        
+        Args:
+            event: The event to recycle.
+        """
+        if self._event_pool.maxlen:
+            # Drop the payload reference so the pool doesn't keep it alive
+            event.payload = EMPTY_PAYLOAD
+            event.correlation_id = None
+            self._event_pool.append(event)
+    
+    def _process_event_sync(self, event: Event, subscriptions: Sequence[EventSubscription]) -> None:
         """Process an event synchronously.
         
         Args:
@@ -233,14 +572,28 @@ class EventBusManager(NexusManager):
             try:
                 subscription.callback(event)
             except Exception as e:
-                self._logger.error(
-                    f"Error in event handler for {event.event_type}: {str(e)}",
-                    extra={
-                        "event_id": event.event_id,
-                        "subscription_id": subscription.subscriber_id,
-                        "error": str(e),
-                    },
-                )
+                self._log_callback_error(event, subscription, e)
+    
+    def _log_callback_error(
+        self, event: Event, subscription: EventSubscription, error: Exception
+    ) -> None:
+        """Log an exception raised by a subscriber callback.
+        
+        Kept out of the dispatch loops so they stay small on the common path.
+        
+        Args:
+            event: The event being delivered.
+            subscription: The subscription whose callback failed.
+            error: The exception raised by the callback.
+        """
+        self._logger.error(
+            f"Error in event handler for {event.event_type}: {str(error)}",
+            extra={
+                "event_id": event.event_id,
+                "subscription_id": subscription.subscriber_id,
+                "error": str(error),
+            },
+        )
     
     def subscribe(
         self,
@@ -254,7 +607,7 @@ class EventBusManager(NexusManager):
         Args:
             event_type: The type of events to subscribe to. Use "*" for all events.
             callback: A function to call when matching events are published.
-            subscriber_id: Optional ID for the subscriber. If not provided, a UUID is generated.
+            subscriber_id: Optional ID for the subscriber. If not provided, a random ID is generated.
             filter_criteria: Optional criteria for filtering events beyond their type.
                              A dict where keys are payload fields and values are the required values.
         
@@ -272,7 +625,7 @@ class EventBusManager(NexusManager):
         
         # Generate subscriber ID if not provided
         if subscriber_id is None:
-            subscriber_id = str(uuid.uuid4())
+            subscriber_id = generate_id()
         
         # Create subscription
         subscription = EventSubscription(
@@ -283,11 +636,17 @@ class EventBusManager(NexusManager):
         )
         
         # Add to subscriptions
-        with self._subscription_lock:
-            if event_type not in self._subscriptions:
-                self._subscriptions[event_type] = {}
+        lock, subscriptions = self._shard_for(event_type)
+        with lock:
+            if event_type not in subscriptions:
+                subscriptions[event_type] = {}
             
-            self._subscriptions[event_type][subscriber_id] = subscription
+            is_new = subscriber_id not in subscriptions[event_type]
+            subscriptions[event_type][subscriber_id] = subscription
+            self._rebuild_subscription_cache(event_type, subscriptions)
+        
+        if is_new:
+            self._count_subscription(subscriber_id, 1)
         
         self._logger.debug(
             f"Subscription added for {event_type}",
@@ -299,6 +658,69 @@ class EventBusManager(NexusManager):
         
         return subscriber_id
     
+    def subscribe_many(
+        self,
+        subscriptions: Iterable[Tuple[str, Callable[[Event], None]]],
+        subscriber_id: Optional[str] = None,
+    ) -> str:
+        """Subscribe one subscriber to several event types at once.
+        
+        Equivalent to calling subscribe for each pair, but each subscription
+        shard is locked once and the subscription counts are updated once.
+        
+        Args:
+            subscriptions: (event_type, callback) pairs to subscribe.
+            subscriber_id: Optional ID for the subscriber. If not provided, a random ID is generated.
+        
+        Returns:
+            str: The subscriber ID, which can be used to unsubscribe.
+            
+        Raises:
+            EventBusError: If the subscriptions cannot be created.
+        """
+        if not self._initialized:
+            raise EventBusError("Cannot subscribe to events before initialization")
+        
+        # Generate subscriber ID if not provided
+        if subscriber_id is None:
+            subscriber_id = generate_id()
+        
+        # Group the new subscriptions by the shard that holds their event type
+        by_shard: Dict[int, List[EventSubscription]] = {}
+        for event_type, callback in subscriptions:
+            subscription = EventSubscription(
+                subscriber_id=subscriber_id,
+                event_type=event_type,
+                callback=callback,
+            )
+            by_shard.setdefault(
+                hash(event_type) % _SUBSCRIPTION_SHARDS, []
+            ).append(subscription)
+        
+        added = 0
+        for index, shard_new in by_shard.items():
+            lock, shard_subscriptions = self._shards[index]
+            with lock:
+                for subscription in shard_new:
+                    event_type = subscription.event_type
+                    if event_type not in shard_subscriptions:
+                        shard_subscriptions[event_type] = {}
+                    
+                    if subscriber_id not in shard_subscriptions[event_type]:
+                        added += 1
+                    shard_subscriptions[event_type][subscriber_id] = subscription
+                    self._rebuild_subscription_cache(event_type, shard_subscriptions)
+        
+        if added:
+            self._count_subscription(subscriber_id, added)
+        
+        self._logger.debug(
+            f"Subscriptions added for {sum(map(len, by_shard.values()))} event types",
+            extra={"subscriber_id": subscriber_id},
+        )
+        
+        return subscriber_id
+    
     def unsubscribe(self, subscriber_id: str, event_type: Optional[str] = None) -> bool:
         """Unsubscribe from events.
         
@@ -315,26 +737,27 @@ class EventBusManager(NexusManager):
         
         removed = False
         
-        with self._subscription_lock:
-            if event_type is not None:
-                # Unsubscribe from specific event type
-                if event_type in self._subscriptions and subscriber_id in self._subscriptions[event_type]:
-                    del self._subscriptions[event_type][subscriber_id]
-                    removed = True
-                    
-                    # Clean up empty event type dictionaries
-                    if not self._subscriptions[event_type]:
-                        del self._subscriptions[event_type]
-            else:
-                # Unsubscribe from all event types
-                for evt_type in list(self._subscriptions.keys()):
-                    if subscriber_id in self._subscriptions[evt_type]:
-                        del self._subscriptions[evt_type][subscriber_id]
+        if event_type is not None:
+            # Unsubscribe from specific event type
+            shards = [self._shard_for(event_type)]
+        else:
+            # Unsubscribe from all event types
+            shards = self._shards
+        
+        for lock, subscriptions in shards:
+            with lock:
+                evt_types = [event_type] if event_type is not None else list(subscriptions)
+                for evt_type in evt_types:
+                    if evt_type in subscriptions and subscriber_id in subscriptions[evt_type]:
+                        del subscriptions[evt_type][subscriber_id]
+                        self._count_subscription(subscriber_id, -1)
                         removed = True
                         
                         # Clean up empty event type dictionaries
-                        if not self._subscriptions[evt_type]:
-                            del self._subscriptions[evt_type]
+                        if not subscriptions[evt_type]:
+                            del subscriptions[evt_type]
+                        
+                        self._rebuild_subscription_cache(evt_type, subscriptions)
         
         if removed:
             self._logger.debug(
@@ -343,30 +766,103 @@ class EventBusManager(NexusManager):
         
         return removed
     
-    def _get_matching_subscriptions(self, event: Event) -> List[EventSubscription]:
+    def _count_subscription(self, subscriber_id: str, delta: int) -> None:
+        """Update the running subscription counts reported by status().
+        
+        Args:
+            subscriber_id: The subscriber that gained or lost a subscription.
+            delta: 1 for an added subscription, -1 for a removed one.
+        """
+        with self._counts_lock:
+            self._total_subscriptions += delta
+            remaining = self._subscriber_counts[subscriber_id] + delta
+            if remaining > 0:
+                self._subscriber_counts[subscriber_id] = remaining
+            else:
+                del self._subscriber_counts[subscriber_id]
+    
+    def _shard_for(self, event_type: str) -> SubscriptionShard:
+        """Get the subscription shard responsible for an event type.
+        
+        Args:
+            event_type: The event type to look up.
+        
+        Returns:
+            SubscriptionShard: The lock and subscriptions for the event type's shard.
+        """
+        return self._shards[hash(event_type) % _SUBSCRIPTION_SHARDS]
+    
+    def _rebuild_subscription_cache(
+        self,
+        event_type: str,
+        shard_subscriptions: Dict[str, Dict[str, EventSubscription]],
+    ) -> None:
+        """Rebuild the cached subscription snapshot for an event type.
+        
+        Must be called with the event type's shard lock held.
+        
+        Args:
+            event_type: The event type whose subscriptions changed.
+            shard_subscriptions: The subscriptions held by the event type's shard.
+        """
+        subscriptions = shard_subscriptions.get(event_type)
+        if not subscriptions:
+            self._sub_cache.pop(event_type, None)
+            return
+        
+        plain: List[EventSubscription] = []
+        groups: Dict[EventFilter, List[EventSubscription]] = {}
+        for sub in subscriptions.values():
+            if sub.event_filter is None:
+                plain.append(sub)
+            else:
+                groups.setdefault(sub.event_filter, []).append(sub)
+        
+        self._sub_cache[event_type] = (
+            tuple(plain),
+            tuple((event_filter, tuple(subs)) for event_filter, subs in groups.items()),
+        )
+    
+    def _has_subscribers(self, event_type: str) -> bool:
+        """Check whether any subscription could receive an event type.
+        
+        Args:
+            event_type: The event type being published.
+        
+        Returns:
+            bool: True if there are subscriptions for the type or for all events.
+        """
+        sub_cache = self._sub_cache
+        return event_type in sub_cache or "*" in sub_cache
+    
+    def _get_matching_subscriptions(self, event: Event) -> Sequence[EventSubscription]:
         """Get subscriptions that match an event.
         
+        Reads the cached snapshots without taking the subscription lock. Filterless
+        subscriptions are returned as-is; each distinct filter is checked against
+        the event payload once for all of the subscriptions sharing it.
+        
         Args:
             event: The event to match against subscriptions.
         
         Returns:
-            List[EventSubscription]: The matching subscriptions.
+            Sequence[EventSubscription]: The matching subscriptions.
         """
-        matching: List[EventSubscription] = []
-        
-        with self._subscription_lock:
-            # Check specific event type subscriptions
-            if event.event_type in self._subscriptions:
-                for subscription in self._subscriptions[event.event_type].values():
-                    if subscription.matches_event(event):
-                        matching.append(subscription)
-            
-            # Check wildcard subscriptions (if any)
-            if "*" in self._subscriptions:
-                for subscription in self._subscriptions["*"].values():
-                    if subscription.matches_event(event):
-                        matching.append(subscription)
-        
+        plain, filtered = self._sub_cache.get(event.event_type, _EMPTY_CACHE_ENTRY)
+        any_plain, any_filtered = self._sub_cache.get("*", _EMPTY_CACHE_ENTRY)
+        
+        if not (filtered or any_plain or any_filtered):
+            return plain
+        
+        payload = event.payload
+        matching: List[EventSubscription] = list(plain)
+        for event_filter, subs in filtered:
+            if event_filter.matches(payload):
+                matching.extend(subs)
+        matching.extend(any_plain)
+        for event_filter, subs in any_filtered:
+            if event_filter.matches(payload):
+                matching.extend(subs)
         return matching
     
     def _on_config_changed(self, key: str, value: Any) -> None:
@@ -384,17 +880,15 @@ class EventBusManager(NexusManager):
             )
         
         elif key == "event_bus.publish_timeout":
-            # Update publish timeout
-            self._publish_timeout = float(value)
-            self._logger.info(
-                f"Updated event publish timeout to {self._publish_timeout} seconds",
+            self._logger.warning(
+                "event_bus.publish_timeout is deprecated and ignored",
             )
         
         elif key == "event_bus.thread_pool_size":
             # Can't easily change thread pool size at runtime, log a warning
             self._logger.warning(
                 "Cannot change thread pool size at runtime, restart required",
-                extra={"current_size": len(self._worker_threads), "new_size": value},
+                extra={"current_size": self._max_workers, "new_size": value},
             )
     
     def shutdown(self) -> None:
@@ -411,25 +905,48 @@ class EventBusManager(NexusManager):
         try:
             self._logger.info("Shutting down Event Bus Manager")
             
-            # Signal threads to stop
-            self._running = False
-            self._stop_event.set()
+            # Signal threads to stop once they have drained their queues
+            with self._worker_lock:
+                self._running = False
+                workers = self._workers
+                self._workers = ()
             
-            # Wait for queue to be processed
-            if self._event_queue is not None:
-                try:
-                    self._event_queue.join(timeout=5.0)
-                except:
-                    # Continue with shutdown even if join times out
-                    pass
+            for worker in workers:
+                worker.queue.append(None)
+                worker.waker.set()
             
-            # Shut down thread pool
-            if self._thread_pool is not None:
-                self._thread_pool.shutdown(wait=True, cancel_futures=True)
+            for worker in workers:
+                if worker.thread is not None:
+                    worker.thread.join(timeout=5.0)
+            
+            # Let in-flight deliveries finish, then stop the event loop
+            if self._loop is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self._drain_async(), self._loop
+                    ).result(timeout=5.0)
+                finally:
+                    self._loop.call_soon_threadsafe(self._loop.stop)
+                    if self._loop_thread is not None:
+                        self._loop_thread.join(timeout=5.0)
+                    
+                    # A callback still running after the join keeps the loop
+                    # busy, and it cannot be closed from this thread
+                    if not self._loop.is_running():
+                        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+                        self._loop.close()
+                    self._loop = None
+                    self._loop_thread = None
             
             # Clear subscriptions
-            with self._subscription_lock:
-                self._subscriptions.clear()
+            for lock, subscriptions in self._shards:
+                with lock:
+                    subscriptions.clear()
+            self._sub_cache.clear()
+            
+            with self._counts_lock:
+                self._total_subscriptions = 0
+                self._subscriber_counts.clear()
             
             # Unregister config listener
             self._config_manager.unregister_listener("event_bus", self._on_config_changed)
@@ -455,30 +972,27 @@ class EventBusManager(NexusManager):
         status = super().status()
         
         if self._initialized:
-            with self._subscription_lock:
-                # Count total subscriptions and unique subscribers
-                total_subscriptions = sum(len(subs) for subs in self._subscriptions.values())
-                unique_subscribers: Set[str] = set()
-                for subs in self._subscriptions.values():
-                    unique_subscribers.update(subs.keys())
-            
             # Get queue size and worker thread status
-            queue_size = self._event_queue.qsize() if self._event_queue else 0
-            queue_full = (queue_size >= self._max_queue_size) if self._event_queue else False
+            workers = self._workers
+            queue_size = sum(len(worker.queue) for worker in workers)
+            queue_full = queue_size >= self._max_queue_size
             
             status.update({
                 "subscriptions": {
-                    "total": total_subscriptions,
-                    "unique_subscribers": len(unique_subscribers),
-                    "event_types": len(self._subscriptions),
+                    "total": self._total_subscriptions,
+                    "unique_subscribers": len(self._subscriber_counts),
+                    "event_types": len(self._sub_cache),
                 },
                 "queue": {
                     "size": queue_size,
                     "capacity": self._max_queue_size,
                     "full": queue_full,
+                    "caller_runs": self._caller_runs,
                 },
                 "threads": {
-                    "worker_count": len(self._worker_threads),
+                    "mode": self._mode,
+                    "worker_count": len(workers),
+                    "max_workers": self._max_workers,
                     "running": self._running,
                 },
             })
@@ -2,35 +2,99 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import json
+import os
+import threading
+import time
+import types
+import weakref
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder when orjson is not installed
+    orjson = None
 
+# Marks a payload key that is absent, distinct from any real value
+_MISSING = object()
 
-class Event(BaseModel):
+# Shared read-only payload for events published without one
+EMPTY_PAYLOAD: Mapping[str, Any] = types.MappingProxyType({})
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively, for the stdlib fallback.
+    
+    Args:
+        value: A value the JSON encoder does not know how to serialize.
+        
+    Returns:
+        Any: A JSON-serializable representation of the value.
+        
+    Raises:
+        TypeError: If the value's type is not supported.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Random bytes handed out by generate_id, refilled 256 IDs at a time per thread
+_ID_BUFFER_SIZE = 16 * 256
+_id_state = threading.local()
+
+
+def _reset_id_state() -> None:
+    """Discard buffered random bytes so a forked child never repeats parent IDs."""
+    global _id_state
+    _id_state = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_id_state)
+
+
+def generate_id() -> str:
+    """Generate a random 128-bit identifier.
+    
+    Random bytes are read from ``os.urandom`` in batches and handed out per
+    thread, which is several times cheaper than ``str(uuid.uuid4())``.
+    
+    Returns:
+        str: The identifier as 32 hex digits in the 8-4-4-4-12 UUID layout.
+    """
+    state = _id_state
+    offset = getattr(state, "offset", _ID_BUFFER_SIZE)
+    if offset >= _ID_BUFFER_SIZE:
+        state.buffer = os.urandom(_ID_BUFFER_SIZE)
+        offset = 0
+    state.offset = offset + 16
+    
+    digits = state.buffer[offset:offset + 16].hex()
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class Event:
     """Represents an event in the Nexus Core event bus system.
     
     Events are the primary means of communication between different components
     in the Nexus Core system. Each event has a type, which is used for routing,
     and optional payload data, which contains the event's context and content.
-    """
     
-    event_type: str = Field(..., description="The type of the event, used for routing")
-    event_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique identifier for the event")
-    timestamp: datetime.datetime = Field(default_factory=datetime.datetime.now, description="When the event was created")
-    source: str = Field(..., description="The source component that generated the event")
-    payload: Dict[str, Any] = Field(default_factory=dict, description="The event data")
-    correlation_id: Optional[str] = Field(None, description="ID for tracking related events")
+    Events are constructed on every publish from trusted internal code, so this
+    is a plain slotted dataclass rather than a validating model. Instances are
+    mutable so the event bus can recycle them when event pooling is enabled.
+    """
     
-    class Config:
-        """Pydantic model configuration."""
-        
-        arbitrary_types_allowed = True
-        json_encoders = {
-            datetime.datetime: lambda dt: dt.isoformat(),
-            uuid.UUID: lambda id: str(id),
-        }
+    event_type: str
+    event_id: str = dataclasses.field(default_factory=generate_id)
+    timestamp_ns: int = dataclasses.field(default_factory=time.time_ns)
+    source: str
+    payload: Mapping[str, Any] = dataclasses.field(default_factory=lambda: EMPTY_PAYLOAD)
+    correlation_id: Optional[str] = None
     
     @classmethod
     def create(
@@ -45,7 +109,8 @@ class Event(BaseModel):
         Args:
             event_type: The type of the event, used for routing.
             source: The source component that generated the event.
-            payload: Optional data associated with the event.
+            payload: Optional data associated with the event. Events without
+                one share a single empty, read-only payload.
             correlation_id: Optional ID for tracking related events.
             
         Returns:
@@ -53,18 +118,59 @@ class Event(BaseModel):
         """
         return cls(
             event_type=event_type,
+            event_id=generate_id(),
+            timestamp_ns=time.time_ns(),
             source=source,
-            payload=payload or {},
+            payload=payload if payload else EMPTY_PAYLOAD,
             correlation_id=correlation_id,
         )
     
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Get when the event was created as a local datetime.
+        
+        Returns:
+            datetime.datetime: The creation time, built from ``timestamp_ns``.
+        """
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.datetime.fromtimestamp(seconds).replace(
+            microsecond=nanoseconds // 1000
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the event to a dictionary.
         
+        A dict payload is not copied, so the result shares it with the event.
+        Read-only payloads are copied into a dict so every encoder accepts them.
+        
+        Returns:
+            Dict[str, Any]: The event as a dictionary, with the timestamp as an
+                ISO 8601 string.
+        """
+        return {
+            "event_type": self.event_type,
+            "event_id": self.event_id,
+            "timestamp": self.timestamp.isoformat(),
+            "source": self.source,
+            "payload": (
+                self.payload if type(self.payload) is dict
+                else dict(self.payload) if self.payload
+                else {}
+            ),
+            "correlation_id": self.correlation_id,
+        }
+    
+    def to_json(self) -> bytes:
+        """Serialize the event to JSON for logging or shipping to other systems.
+        
+        Uses orjson when it is installed, and the standard library otherwise.
+        
         Returns:
-            Dict[str, Any]: The event as a dictionary.
+            bytes: The UTF-8 encoded JSON form of ``to_dict()``.
         """
-        return self.dict()
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict(), default=_json_default).encode("utf-8")
     
     def __str__(self) -> str:
         """Get a string representation of the event.
@@ -75,6 +181,70 @@ class Event(BaseModel):
         return f"Event(type={self.event_type}, id={self.event_id}, source={self.source})"
 
 
+class EventFilter:
+    """A set of payload criteria shared by every subscription that uses it.
+    
+    Subscriptions with equal filter criteria share one interned instance, so
+    the event bus can evaluate each distinct filter once per event.
+    """
+    
+    __slots__ = ("items", "__weakref__")
+    
+    def __init__(self, items: Tuple[Tuple[str, Any], ...]) -> None:
+        """Initialize the filter.
+        
+        Args:
+            items: The (key, value) pairs an event payload must contain.
+        """
+        self.items = items
+    
+    def matches(self, payload: Mapping[str, Any]) -> bool:
+        """Check if a payload satisfies every criterion of this filter.
+        
+        Args:
+            payload: The event payload to check.
+            
+        Returns:
+            bool: True if every key is present with the required value.
+        """
+        for key, value in self.items:
+            if payload.get(key, _MISSING) != value:
+                return False
+        
+        return True
+
+
+# Canonical filters keyed by their criteria, kept only while in use
+_filter_intern: weakref.WeakValueDictionary[FrozenSet[Tuple[str, Any]], EventFilter] = (
+    weakref.WeakValueDictionary()
+)
+_filter_intern_lock = threading.Lock()
+
+
+def intern_filter(filter_criteria: Dict[str, Any]) -> EventFilter:
+    """Get the shared filter for a set of criteria.
+    
+    Args:
+        filter_criteria: The payload fields and the values they must have.
+        
+    Returns:
+        EventFilter: The canonical filter for these criteria. Criteria with
+            unhashable values cannot be interned and get a private filter.
+    """
+    items = tuple(filter_criteria.items())
+    try:
+        key = frozenset(items)
+    except TypeError:
+        return EventFilter(items)
+    
+    with _filter_intern_lock:
+        event_filter = _filter_intern.get(key)
+        if event_filter is None:
+            event_filter = EventFilter(items)
+            _filter_intern[key] = event_filter
+        return event_filter
+
+
 @dataclasses.dataclass
 class EventSubscription:
     """Represents a subscription to events on the event bus.
@@ -88,9 +258,20 @@ class EventSubscription:
     event_type: str
     callback: Any  # Callable[[Event], None] but avoid circular imports
     filter_criteria: Optional[Dict[str, Any]] = None
+    event_filter: Optional[EventFilter] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-    def matches_event(self, event: Event) -> bool:
-        """Check if an event matches this subscription's criteria.
+    def __post_init__(self) -> None:
+        """Look up the shared filter for this subscription's criteria."""
+        if self.filter_criteria:
+            self.event_filter = intern_filter(self.filter_criteria)
+    
+    def matches_filter(self, event: Event) -> bool:
+        """Check if an event's payload matches this subscription's filter criteria.
+        
+        The event type is not checked: the event bus only evaluates
+        subscriptions registered for the event's type or for "*".
         
         Args:
             event: The event to check against this subscription.
@@ -98,15 +279,4 @@ class EventSubscription:
         Returns:
             bool: True if the event should be delivered to this subscription.
         """
-        if event.event_type != self.event_type and self.event_type != "*":
-            return False
-            
-        if not self.filter_criteria:
-            return True
-            
-        # Check if payload matches filter criteria
-        for key, value in self.filter_criteria.items():
-            if key not in event.payload or event.payload[key] != value:
-                return False
-                
-        return True
+        return self.event_filter is None or self.event_filter.matches(event.payload)
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import errno
+import fnmatch
 import hashlib
+import itertools
 import os
 import pathlib
+import re
+import secrets
 import shutil
+import stat
 import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, List, Optional, Set, Tuple, Union, cast
 
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import FileError, ManagerInitializationError, ManagerShutdownError
@@ -31,9 +39,13 @@ class FileType(Enum):
     BACKUP = "backup"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
-    """Information about a file."""
+    """Information about a file.
+    
+    Listings can create thousands of these, so the class uses slots and leaves
+    metadata as None rather than allocating an empty dict per file.
+    """
     
     path: str  # Path to the file
     name: str  # Name of the file (without path)
@@ -43,7 +55,182 @@ class FileInfo:
     file_type: FileType  # Type of file
     is_directory: bool  # Whether the file is a directory
     content_hash: Optional[str] = None  # SHA-256 hash of the file content
-    metadata: Dict[str, Any] = None  # Additional metadata
+    metadata: Optional[Dict[str, Any]] = None  # Additional metadata, if any
+
+
+# Map of lowercase file extensions (without the dot) to file types
+_FILE_TYPES_BY_EXTENSION: Dict[str, FileType] = {
+    # Text files
+    "txt": FileType.TEXT,
+    "md": FileType.TEXT,
+    "csv": FileType.TEXT,
+    "json": FileType.TEXT,
+    "xml": FileType.TEXT,
+    "html": FileType.TEXT,
+    "htm": FileType.TEXT,
+    "css": FileType.TEXT,
+    "js": FileType.TEXT,
+    "py": FileType.TEXT,
+    
+    # Config files
+    "yaml": FileType.CONFIG,
+    "yml": FileType.CONFIG,
+    "ini": FileType.CONFIG,
+    "conf": FileType.CONFIG,
+    "cfg": FileType.CONFIG,
+    "toml": FileType.CONFIG,
+    
+    # Log files
+    "log": FileType.LOG,
+    
+    # Data files
+    "db": FileType.DATA,
+    "sqlite": FileType.DATA,
+    "sqlite3": FileType.DATA,
+    "parquet": FileType.DATA,
+    "avro": FileType.DATA,
+    
+    # Image files
+    "jpg": FileType.IMAGE,
+    "jpeg": FileType.IMAGE,
+    "png": FileType.IMAGE,
+    "gif": FileType.IMAGE,
+    "bmp": FileType.IMAGE,
+    "svg": FileType.IMAGE,
+    "webp": FileType.IMAGE,
+    
+    # Document files
+    "pdf": FileType.DOCUMENT,
+    "doc": FileType.DOCUMENT,
+    "docx": FileType.DOCUMENT,
+    "xls": FileType.DOCUMENT,
+    "xlsx": FileType.DOCUMENT,
+    "ppt": FileType.DOCUMENT,
+    "pptx": FileType.DOCUMENT,
+    "odt": FileType.DOCUMENT,
+    "ods": FileType.DOCUMENT,
+    
+    # Audio files
+    "mp3": FileType.AUDIO,
+    "wav": FileType.AUDIO,
+    "flac": FileType.AUDIO,
+    "ogg": FileType.AUDIO,
+    "aac": FileType.AUDIO,
+    
+    # Video files
+    "mp4": FileType.VIDEO,
+    "avi": FileType.VIDEO,
+    "mkv": FileType.VIDEO,
+    "mov": FileType.VIDEO,
+    "webm": FileType.VIDEO,
+}
+
+
+# Linux flag for creating an unnamed file in a directory, 0 where unsupported
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+
+# Errors from opening an O_TMPFILE that mean the file system does not support it
+_O_TMPFILE_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL})
+
+# Errors from linking through /proc that mean it is unavailable or cannot cross the mount
+_PROC_LINK_UNSUPPORTED = frozenset({errno.ENOENT, errno.EXDEV})
+
+# Most bytes requested from a single copy_file_range call
+_COPY_CHUNK_SIZE = 1 << 30
+
+# Errors meaning copy_file_range cannot be used for a pair of files
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EBADF)
+)
+
+
+def _copy_file(source: str, dest: str) -> str:
+    """Copy a file's contents and metadata, letting the kernel move the data.
+    
+    On Linux, os.copy_file_range copies within the kernel, and file systems
+    such as Btrfs and XFS can clone the data without copying it at all. Where
+    it is unavailable, or copies nothing, this falls back to shutil.copy2.
+    
+    Args:
+        source: The path to the source file.
+        dest: The path to the destination file.
+    
+    Returns:
+        str: The destination path, as shutil.copytree expects of a copy function.
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            copied = 0
+            try:
+                while True:
+                    count = os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK_SIZE)
+                    if not count:
+                        break
+                    copied += count
+            except OSError as e:
+                if copied or e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                    raise
+            else:
+                # Pseudo and some network file systems report no data at all,
+                # so a copy that got nothing falls back to reading the file
+                if copied:
+                    shutil.copystat(source, dest)
+                    return dest
+    
+    shutil.copy2(source, dest)
+    return dest
+
+
+def _compile_glob(pattern: str) -> Tuple[Optional[Callable[[str], Any]], ...]:
+    """Compile a "/"-separated glob pattern one segment at a time.
+    
+    Args:
+        pattern: The glob pattern.
+    
+    Returns:
+        Tuple[Optional[Callable[[str], Any]], ...]: A regex match function for
+            each segment, or None for a "**" segment.
+    """
+    return tuple(
+        None if segment == "**" else re.compile(fnmatch.translate(segment)).match
+        for segment in pattern.split("/")
+        if segment
+    )
+
+
+def _glob_matches(
+    segments: Tuple[Optional[Callable[[str], Any]], ...], parts: Tuple[str, ...]
+) -> bool:
+    """Check whether the parts of a relative path match a compiled glob pattern.
+    
+    Args:
+        segments: The pattern compiled by _compile_glob.
+        parts: The names making up the path, outermost first.
+    
+    Returns:
+        bool: True if every part is matched, with "**" spanning zero or more parts.
+    """
+    if not segments:
+        return not parts
+    
+    matches = segments[0]
+    if matches is None:
+        return any(_glob_matches(segments[1:], parts[i:]) for i in range(len(parts) + 1))
+    
+    return bool(parts) and matches(parts[0]) is not None and _glob_matches(segments[1:], parts[1:])
+
+
+# Flags for creating a new temporary file that must not already exist
+_TEMP_FILE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_RDWR | getattr(os, "O_BINARY", 0)
+
+# Write buffer size for temporary files
+_TEMP_FILE_BUFFER_SIZE = 1024 * 1024
+
+# Seconds a disk usage reading is reused by status()
+_DISK_USAGE_TTL = 5.0
+
+# Number of file lock stripes; a power of two so a hash can be masked
+_FILE_LOCK_STRIPES = 64
 
 
 class FileManager(NexusManager):
@@ -67,81 +254,31 @@ class FileManager(NexusManager):
         self._logger = logger_manager.get_logger("file_manager")
         
         # File paths
-        self._base_directory: Optional[pathlib.Path] = None
-        self._temp_directory: Optional[pathlib.Path] = None
-        self._plugin_data_directory: Optional[pathlib.Path] = None
-        self._backup_directory: Optional[pathlib.Path] = None
-        
-        # Map of file extensions to file types
-        self._file_type_mapping: Dict[str, FileType] = {
-            # Text files
-            ".txt": FileType.TEXT,
-            ".md": FileType.TEXT,
-            ".csv": FileType.TEXT,
-            ".json": FileType.TEXT,
-            ".xml": FileType.TEXT,
-            ".html": FileType.TEXT,
-            ".htm": FileType.TEXT,
-            ".css": FileType.TEXT,
-            ".js": FileType.TEXT,
-            ".py": FileType.TEXT,
-            
-            # Config files
-            ".yaml": FileType.CONFIG,
-            ".yml": FileType.CONFIG,
-            ".ini": FileType.CONFIG,
-            ".conf": FileType.CONFIG,
-            ".cfg": FileType.CONFIG,
-            ".toml": FileType.CONFIG,
-            
-            # Log files
-            ".log": FileType.LOG,
-            
-            # Data files
-            ".db": FileType.DATA,
-            ".sqlite": FileType.DATA,
-            ".sqlite3": FileType.DATA,
-            ".parquet": FileType.DATA,
-            ".avro": FileType.DATA,
-            
-            # Image files
-            ".jpg": FileType.IMAGE,
-            ".jpeg": FileType.IMAGE,
-            ".png": FileType.IMAGE,
-            ".gif": FileType.IMAGE,
-            ".bmp": FileType.IMAGE,
-            ".svg": FileType.IMAGE,
-            ".webp": FileType.IMAGE,
-            
-            # Document files
-            ".pdf": FileType.DOCUMENT,
-            ".doc": FileType.DOCUMENT,
-            ".docx": FileType.DOCUMENT,
-            ".xls": FileType.DOCUMENT,
-            ".xlsx": FileType.DOCUMENT,
-            ".ppt": FileType.DOCUMENT,
-            ".pptx": FileType.DOCUMENT,
-            ".odt": FileType.DOCUMENT,
-            ".ods": FileType.DOCUMENT,
-            
-            # Audio files
-            ".mp3": FileType.AUDIO,
-            ".wav": FileType.AUDIO,
-            ".flac": FileType.AUDIO,
-            ".ogg": FileType.AUDIO,
-            ".aac": FileType.AUDIO,
-            
-            # Video files
-            ".mp4": FileType.VIDEO,
-            ".avi": FileType.VIDEO,
-            ".mkv": FileType.VIDEO,
-            ".mov": FileType.VIDEO,
-            ".webm": FileType.VIDEO,
-        }
-        
-        # File locks for thread safety
-        self._file_locks: Dict[str, threading.RLock] = {}
-        self._locks_lock = threading.RLock()
+        self._base_directory: Optional[str] = None
+        self._temp_directory: Optional[str] = None
+        self._plugin_data_directory: Optional[str] = None
+        self._backup_directory: Optional[str] = None
+        
+        # Base directory for each directory type, and the prefixes an absolute
+        # path must start with, precomputed for _resolve_path
+        self._directories: Dict[str, str] = {}
+        self._allowed_prefixes: Tuple[str, ...] = ()
+        
+        # File locks for thread safety, striped by path hash so lookups need
+        # no shared dictionary and memory stays constant
+        self._lock_stripes: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(_FILE_LOCK_STRIPES)
+        )
+        
+        # Last disk usage reading for status(), as (time.monotonic(), usage)
+        self._disk_usage_cache: Tuple[float, Optional[Tuple[int, int, int]]] = (0.0, None)
+        
+        # Temp file names combine a counter with a random per-manager salt
+        self._temp_counter = itertools.count(int(time.time() * 1000))
+        self._temp_salt = secrets.token_hex(4)
+        
+        # Cleared once the file system refuses unnamed O_TMPFILE writes
+        self._unnamed_temp_files = bool(_O_TMPFILE)
     
     def initialize(self) -> None:
         """Initialize the File Manager.
@@ -160,16 +297,31 @@ class FileManager(NexusManager):
             backup_dir = file_config.get("backup_directory", "data/backups")
             
             # Convert to absolute paths if not already
-            self._base_directory = pathlib.Path(base_dir).absolute()
-            self._temp_directory = pathlib.Path(temp_dir).absolute()
-            self._plugin_data_directory = pathlib.Path(plugin_data_dir).absolute()
-            self._backup_directory = pathlib.Path(backup_dir).absolute()
-            
-            # Create directories if they don't exist
-            os.makedirs(self._base_directory, exist_ok=True)
-            os.makedirs(self._temp_directory, exist_ok=True)
-            os.makedirs(self._plugin_data_directory, exist_ok=True)
-            os.makedirs(self._backup_directory, exist_ok=True)
+            self._base_directory = os.path.abspath(base_dir)
+            self._temp_directory = os.path.abspath(temp_dir)
+            self._plugin_data_directory = os.path.abspath(plugin_data_dir)
+            self._backup_directory = os.path.abspath(backup_dir)
+            
+            self._directories = {
+                "base": self._base_directory,
+                "temp": self._temp_directory,
+                "plugin_data": self._plugin_data_directory,
+                "backup": self._backup_directory,
+            }
+            
+            # Create directories if they don't exist. They are independent, so
+            # on network file systems the round trips can overlap
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(self._directories),
+                thread_name_prefix="file_init",
+            ) as executor:
+                list(executor.map(
+                    lambda directory: os.makedirs(directory, exist_ok=True),
+                    self._directories.values(),
+                ))
+            self._allowed_prefixes = tuple(
+                os.path.join(directory, "") for directory in self._directories.values()
+            )
             
             # Register for config changes
             self._config_manager.register_listener("files", self._on_config_changed)
@@ -201,6 +353,25 @@ class FileManager(NexusManager):
         Raises:
             FileError: If the directory type is invalid or the manager is not initialized.
         """
+        return pathlib.Path(self._resolve_path(path, directory_type))
+    
+    def _resolve_path(self, path: str, directory_type: str = "base") -> str:
+        """Get the absolute path for a file as a string.
+        
+        File operations work on path strings, which the os functions take
+        directly, and only build Path objects for callers that ask for one.
+        
+        Args:
+            path: The path to the file, relative to the specified directory.
+            directory_type: The type of directory to use as the base.
+        
+        Returns:
+            str: The normalized absolute path to the file.
+            
+        Raises:
+            FileError: If the directory type is invalid, the path is outside the
+                allowed directories or the manager is not initialized.
+        """
         if not self._initialized:
             raise FileError(
                 "File Manager not initialized",
@@ -208,40 +379,26 @@ class FileManager(NexusManager):
             )
         
         # Get the base directory for the specified type
-        if directory_type == "base":
-            base_dir = self._base_directory
-        elif directory_type == "temp":
-            base_dir = self._temp_directory
-        elif directory_type == "plugin_data":
-            base_dir = self._plugin_data_directory
-        elif directory_type == "backup":
-            base_dir = self._backup_directory
-        else:
+        base_dir = self._directories.get(directory_type)
+        if base_dir is None:
             raise FileError(
                 f"Invalid directory type: {directory_type}",
                 file_path=path,
             )
         
-        # Convert the path to an absolute path
-        path_obj = pathlib.Path(path)
-        if path_obj.is_absolute():
-            # Check if the path is within the allowed directories
-            for allowed_dir in [
-                self._base_directory,
-                self._temp_directory,
-                self._plugin_data_directory,
-                self._backup_directory,
-            ]:
-                if str(path_obj).startswith(str(allowed_dir)):
-                    return path_obj
-            
-            raise FileError(
-                f"Path is outside of allowed directories: {path}",
-                file_path=path,
-            )
+        if not path:
+            return base_dir
+        
+        # Join relative paths with the base directory, then check that the
+        # result, after resolving any "..", is within the allowed directories
+        normalized = os.path.normpath(os.path.join(base_dir, path))
+        if os.path.join(normalized, "").startswith(self._allowed_prefixes):
+            return normalized
         
-        # Join the path with the base directory
-        return base_dir / path
+        raise FileError(
+            f"Path is outside of allowed directories: {path}",
+            file_path=path,
+        )
     
     def ensure_directory(self, path: str, directory_type: str = "base") -> pathlib.Path:
         """Ensure that a directory exists, creating it if necessary.
@@ -258,9 +415,9 @@ class FileManager(NexusManager):
             FileError: If the directory cannot be created.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             os.makedirs(full_path, exist_ok=True)
-            return full_path
+            return pathlib.Path(full_path)
         
         except Exception as e:
             raise FileError(
@@ -282,19 +439,29 @@ class FileManager(NexusManager):
             FileError: If the file cannot be read.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    return f.read()
+                # One read and one C-level decode, skipping TextIOWrapper's
+                # incremental decoder
+                with open(full_path, "rb", buffering=0) as f:
+                    data = f.read()
+            
+            text = data.decode("utf-8")
+            
+            # Translate newlines as text mode would
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            
+            return text
         
         except Exception as e:
             raise FileError(
                 f"Failed to read text file: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def write_text(
@@ -316,28 +483,22 @@ class FileManager(NexusManager):
             FileError: If the file cannot be written.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
             # Create parent directories if needed
             if create_dirs:
-                os.makedirs(full_path.parent, exist_ok=True)
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                # Write to a temporary file, then rename to ensure atomic write
-                temp_path = str(full_path) + '.tmp'
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                
-                # Rename the temporary file to the target file
-                os.replace(temp_path, full_path)
+                self._atomic_write(full_path, content.encode("utf-8"))
         
         except Exception as e:
             raise FileError(
                 f"Failed to write text file: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def read_binary(self, path: str, directory_type: str = "base") -> bytes:
@@ -354,19 +515,21 @@ class FileManager(NexusManager):
             FileError: If the file cannot be read.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                with open(full_path, "rb") as f:
+                # Unbuffered FileIO sizes its result from fstat and reads straight
+                # into it, skipping the buffered reader's intermediate copy
+                with open(full_path, "rb", buffering=0) as f:
                     return f.read()
         
         except Exception as e:
             raise FileError(
                 f"Failed to read binary file: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def write_binary(
@@ -388,28 +551,22 @@ class FileManager(NexusManager):
             FileError: If the file cannot be written.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
             # Create parent directories if needed
             if create_dirs:
-                os.makedirs(full_path.parent, exist_ok=True)
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                # Write to a temporary file, then rename to ensure atomic write
-                temp_path = str(full_path) + '.tmp'
-                with open(temp_path, "wb") as f:
-                    f.write(content)
-                
-                # Rename the temporary file to the target file
-                os.replace(temp_path, full_path)
+                self._atomic_write(full_path, content)
         
         except Exception as e:
             raise FileError(
                 f"Failed to write binary file: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def list_files(
@@ -427,7 +584,11 @@ class FileManager(NexusManager):
             directory_type: The type of directory to use as the base.
             recursive: Whether to list files in subdirectories recursively.
             include_dirs: Whether to include directories in the results.
-            pattern: Optional glob pattern to filter files by name.
+            pattern: Optional glob pattern to filter files by name. A pattern
+                     without "/" is matched against entry names, at every level
+                     when listing recursively. A pattern with "/" is matched
+                     against the path below the listed directory, where "**"
+                     matches any number of directories.
         
         Returns:
             List[FileInfo]: Information about the files in the directory.
@@ -436,56 +597,88 @@ class FileManager(NexusManager):
             FileError: If the directory cannot be listed.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
-            if not full_path.is_dir():
+            st = self._stat(full_path)
+            if st is None or not stat.S_ISDIR(st.st_mode):
                 raise FileError(
                     f"Path is not a directory: {full_path}",
-                    file_path=str(full_path),
+                    file_path=full_path,
                 )
             
             result: List[FileInfo] = []
             
-            # Function to process a single file or directory
-            def process_path(p: pathlib.Path) -> None:
+            # Function to process a single directory entry or path
+            def process_entry(entry: os.DirEntry) -> None:
                 try:
-                    stat = p.stat()
-                    is_dir = p.is_dir()
+                    st = entry.stat()
+                    is_dir = stat.S_ISDIR(st.st_mode)
                     
                     if is_dir and not include_dirs:
                         return
                     
+                    name = entry.name
                     file_info = FileInfo(
-                        path=str(p),
-                        name=p.name,
-                        size=stat.st_size,
-                        created_at=stat.st_ctime,
-                        modified_at=stat.st_mtime,
-                        file_type=self._get_file_type(p),
+                        path=os.fspath(entry),
+                        name=name,
+                        size=st.st_size,
+                        created_at=st.st_ctime,
+                        modified_at=st.st_mtime,
+                        file_type=self._get_file_type(name, is_dir),
                         is_directory=is_dir,
-                        metadata={},
                     )
                     
                     result.append(file_info)
                 
                 except Exception as e:
                     self._logger.warning(
-                        f"Failed to get info for {p}: {str(e)}",
-                        extra={"file_path": str(p)},
+                        f"Failed to get info for {os.fspath(entry)}: {str(e)}",
+                        extra={"file_path": os.fspath(entry)},
                     )
             
-            # List the directory
-            if recursive:
-                # Use pathlib.Path.glob with recursive option
-                pattern_to_use = pattern or "**/*"
-                for p in full_path.glob(pattern_to_use):
-                    process_path(p)
-            else:
-                # Use pathlib.Path.iterdir for non-recursive listing
-                for p in full_path.iterdir():
-                    if pattern and not p.match(pattern):
-                        continue
-                    process_path(p)
+            # Compile the pattern once. A single segment is matched against
+            # entry names; a longer one against the path below the listed directory
+            segments = _compile_glob(pattern) if pattern else ()
+            name_matches = segments[0] if len(segments) == 1 else None
+            path_segments = segments if len(segments) > 1 or name_matches is None else ()
+            
+            # Without "**", a path pattern never matches below its own depth
+            max_depth = len(path_segments) if path_segments and None not in path_segments else 0
+            
+            # Walk the tree with os.scandir, whose entries know their type from
+            # the directory read, so non-matching entries cost no extra syscalls
+            root = full_path
+            directories: List[Tuple[str, Tuple[str, ...]]] = [(root, ())]
+            while directories:
+                directory, parts = directories.pop()
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            entry_parts = parts + (entry.name,) if path_segments else parts
+                            
+                            if (
+                                recursive
+                                and (not max_depth or len(entry_parts) < max_depth)
+                                and entry.is_dir(follow_symlinks=False)
+                            ):
+                                directories.append((entry.path, entry_parts))
+                            
+                            if path_segments:
+                                if not _glob_matches(path_segments, entry_parts):
+                                    continue
+                            elif name_matches is not None and not name_matches(entry.name):
+                                continue
+                            
+                            process_entry(entry)
+                
+                except OSError as e:
+                    if directory == root:
+                        raise
+                    
+                    self._logger.warning(
+                        f"Failed to list {directory}: {str(e)}",
+                        extra={"file_path": directory},
+                    )
             
             return result
         
@@ -496,7 +689,7 @@ class FileManager(NexusManager):
         except Exception as e:
             raise FileError(
                 f"Failed to list directory: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def get_file_info(self, path: str, directory_type: str = "base") -> FileInfo:
@@ -513,25 +706,26 @@ class FileManager(NexusManager):
             FileError: If the file information cannot be retrieved.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
-            if not full_path.exists():
+            st = self._stat(full_path)
+            if st is None:
                 raise FileError(
                     f"File does not exist: {full_path}",
-                    file_path=str(full_path),
+                    file_path=full_path,
                 )
             
-            stat = full_path.stat()
+            is_dir = stat.S_ISDIR(st.st_mode)
+            name = os.path.basename(full_path)
             
             return FileInfo(
-                path=str(full_path),
-                name=full_path.name,
-                size=stat.st_size,
-                created_at=stat.st_ctime,
-                modified_at=stat.st_mtime,
-                file_type=self._get_file_type(full_path),
-                is_directory=full_path.is_dir(),
-                metadata={},
+                path=full_path,
+                name=name,
+                size=st.st_size,
+                created_at=st.st_ctime,
+                modified_at=st.st_mtime,
+                file_type=self._get_file_type(name, is_dir),
+                is_directory=is_dir,
             )
         
         except FileError:
@@ -541,7 +735,7 @@ class FileManager(NexusManager):
         except Exception as e:
             raise FileError(
                 f"Failed to get file info: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def delete_file(self, path: str, directory_type: str = "base") -> None:
@@ -555,25 +749,23 @@ class FileManager(NexusManager):
             FileError: If the file cannot be deleted.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
-            if not full_path.exists():
+            st = self._stat(full_path)
+            if st is None:
                 raise FileError(
                     f"File does not exist: {full_path}",
-                    file_path=str(full_path),
+                    file_path=full_path,
                 )
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                if full_path.is_dir():
+                if stat.S_ISDIR(st.st_mode):
                     shutil.rmtree(full_path)
                 else:
                     os.remove(full_path)
-            
-            # Release the lock
-            self._release_file_lock(str(full_path))
         
         except FileError:
             # Re-raise FileError exceptions
@@ -582,7 +774,7 @@ class FileManager(NexusManager):
         except Exception as e:
             raise FileError(
                 f"Failed to delete file: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
     def copy_file(
@@ -606,37 +798,41 @@ class FileManager(NexusManager):
             FileError: If the file cannot be copied.
         """
         try:
-            source_full_path = self.get_file_path(source_path, source_dir_type)
-            dest_full_path = self.get_file_path(dest_path, dest_dir_type)
+            source_full_path = self._resolve_path(source_path, source_dir_type)
+            dest_full_path = self._resolve_path(dest_path, dest_dir_type)
             
-            if not source_full_path.exists():
+            source_stat = self._stat(source_full_path)
+            if source_stat is None:
                 raise FileError(
                     f"Source file does not exist: {source_full_path}",
-                    file_path=str(source_full_path),
+                    file_path=source_full_path,
                 )
             
-            if dest_full_path.exists() and not overwrite:
+            if not overwrite and self._stat(dest_full_path) is not None:
                 raise FileError(
                     f"Destination file already exists: {dest_full_path}",
-                    file_path=str(dest_full_path),
+                    file_path=dest_full_path,
                 )
             
             # Create parent directories if needed
-            os.makedirs(dest_full_path.parent, exist_ok=True)
-            
-            # Get locks for both files
-            source_lock = self._get_file_lock(str(source_full_path))
-            dest_lock = self._get_file_lock(str(dest_full_path))
+            os.makedirs(os.path.dirname(dest_full_path), exist_ok=True)
             
-            # Acquire locks in a consistent order to avoid deadlocks
-            first_lock, second_lock = sorted([source_lock, dest_lock], key=id)
+            # Get locks for both files, in a consistent order to avoid deadlocks
+            first_lock, second_lock = self._get_file_lock_pair(
+                source_full_path, dest_full_path
+            )
             
             with first_lock:
                 with second_lock:
-                    if source_full_path.is_dir():
-                        shutil.copytree(source_full_path, dest_full_path, dirs_exist_ok=overwrite)
+                    if stat.S_ISDIR(source_stat.st_mode):
+                        shutil.copytree(
+                            source_full_path,
+                            dest_full_path,
+                            copy_function=_copy_file,
+                            dirs_exist_ok=overwrite,
+                        )
                     else:
-                        shutil.copy2(source_full_path, dest_full_path)
+                        _copy_file(source_full_path, dest_full_path)
         
         except FileError:
             # Re-raise FileError exceptions
@@ -669,39 +865,34 @@ class FileManager(NexusManager):
             FileError: If the file cannot be moved.
         """
         try:
-            source_full_path = self.get_file_path(source_path, source_dir_type)
-            dest_full_path = self.get_file_path(dest_path, dest_dir_type)
+            source_full_path = self._resolve_path(source_path, source_dir_type)
+            dest_full_path = self._resolve_path(dest_path, dest_dir_type)
             
-            if not source_full_path.exists():
+            source_stat = self._stat(source_full_path)
+            if source_stat is None:
                 raise FileError(
                     f"Source file does not exist: {source_full_path}",
-                    file_path=str(source_full_path),
+                    file_path=source_full_path,
                 )
             
-            if dest_full_path.exists() and not overwrite:
+            if not overwrite and self._stat(dest_full_path) is not None:
                 raise FileError(
                     f"Destination file already exists: {dest_full_path}",
-                    file_path=str(dest_full_path),
+                    file_path=dest_full_path,
                 )
             
             # Create parent directories if needed
-            os.makedirs(dest_full_path.parent, exist_ok=True)
-            
-            # Get locks for both files
-            source_lock = self._get_file_lock(str(source_full_path))
-            dest_lock = self._get_file_lock(str(dest_full_path))
+            os.makedirs(os.path.dirname(dest_full_path), exist_ok=True)
             
-            # Acquire locks in a consistent order to avoid deadlocks
-            first_lock, second_lock = sorted([source_lock, dest_lock], key=id)
+            # Get locks for both files, in a consistent order to avoid deadlocks
+            first_lock, second_lock = self._get_file_lock_pair(
+                source_full_path, dest_full_path
+            )
             
             with first_lock:
                 with second_lock:
                     # Use shutil.move for both files and directories
                     shutil.move(source_full_path, dest_full_path)
-            
-            # Release locks
-            self._release_file_lock(str(source_full_path))
-            self._release_file_lock(str(dest_full_path))
         
         except FileError:
             # Re-raise FileError exceptions
@@ -727,33 +918,32 @@ class FileManager(NexusManager):
             FileError: If the backup cannot be created.
         """
         try:
-            source_full_path = self.get_file_path(path, directory_type)
+            source_full_path = self._resolve_path(path, directory_type)
             
-            if not source_full_path.exists():
+            # Backup subdirectory structure mirrors the original path relative to the base
+            base_prefix = os.path.join(self._directories[directory_type], "")
+            if not source_full_path.startswith(base_prefix):
                 raise FileError(
-                    f"Source file does not exist: {source_full_path}",
-                    file_path=str(source_full_path),
+                    f"File is not inside the {directory_type} directory: {source_full_path}",
+                    file_path=source_full_path,
                 )
+            rel_dir, file_name = os.path.split(source_full_path[len(base_prefix):])
             
             # Generate a backup filename with timestamp
-            backup_name = (
-                f"{source_full_path.stem}_{int(time.time())}{source_full_path.suffix}"
-            )
+            stem, extension = os.path.splitext(file_name)
+            backup_path = os.path.join(rel_dir, f"{stem}_{int(time.time())}{extension}")
             
-            # Backup subdirectory structure mirrors the original path relative to the base
-            rel_path = source_full_path.relative_to(self.get_file_path("", directory_type))
-            backup_path = rel_path.parent / backup_name
-            
-            # Copy the file to the backup location
+            # Copy the file to the backup location; this also fails if the
+            # source does not exist, so it is not checked separately
             self.copy_file(
-                source_path=str(source_full_path),
-                dest_path=str(backup_path),
+                source_path=source_full_path,
+                dest_path=backup_path,
                 source_dir_type=directory_type,
                 dest_dir_type="backup",
                 overwrite=True,
             )
             
-            return str(backup_path)
+            return backup_path
         
         except FileError:
             # Re-raise FileError exceptions
@@ -779,17 +969,28 @@ class FileManager(NexusManager):
             FileError: If the temporary file cannot be created.
         """
         try:
-            # Generate a unique filename
-            temp_name = f"{prefix}{int(time.time())}_{os.urandom(4).hex()}{suffix}"
-            temp_path = self.get_file_path(temp_name, "temp")
-            
-            # Create parent directory if needed
-            os.makedirs(temp_path.parent, exist_ok=True)
+            while True:
+                # Generate a unique filename
+                temp_name = f"{prefix}{next(self._temp_counter):x}_{self._temp_salt}{suffix}"
+                temp_path = self._resolve_path(temp_name, "temp")
+                
+                # Create the file exclusively, readable only by this user
+                try:
+                    fd = os.open(temp_path, _TEMP_FILE_FLAGS, 0o600)
+                except FileNotFoundError:
+                    # Create parent directory if needed
+                    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+                    fd = os.open(temp_path, _TEMP_FILE_FLAGS, 0o600)
+                except FileExistsError:
+                    # Another process with the same salt got there first
+                    continue
+                
+                break
             
             # Open the file
-            file_obj = open(temp_path, "wb+")
+            file_obj = os.fdopen(fd, "wb+", buffering=_TEMP_FILE_BUFFER_SIZE)
             
-            return str(temp_path), file_obj
+            return temp_path, file_obj
         
         except Exception as e:
             raise FileError(
@@ -811,25 +1012,22 @@ class FileManager(NexusManager):
             FileError: If the hash cannot be computed.
         """
         try:
-            full_path = self.get_file_path(path, directory_type)
+            full_path = self._resolve_path(path, directory_type)
             
-            if not full_path.exists() or full_path.is_dir():
+            st = self._stat(full_path)
+            if st is None or stat.S_ISDIR(st.st_mode):
                 raise FileError(
                     f"Cannot compute hash for non-existent or directory: {full_path}",
-                    file_path=str(full_path),
+                    file_path=full_path,
                 )
             
             # Get a lock for this file
-            lock = self._get_file_lock(str(full_path))
+            lock = self._get_file_lock(full_path)
             
             with lock:
-                # Compute the hash in chunks to handle large files
-                hasher = hashlib.sha256()
+                # file_digest feeds the file to OpenSSL in a C-level readinto loop
                 with open(full_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(65536), b""):
-                        hasher.update(chunk)
-                
-                return hasher.hexdigest()
+                    return hashlib.file_digest(f, "sha256").hexdigest()
         
         except FileError:
             # Re-raise FileError exceptions
@@ -838,51 +1036,175 @@ class FileManager(NexusManager):
         except Exception as e:
             raise FileError(
                 f"Failed to compute file hash: {str(e)}",
-                file_path=str(full_path) if 'full_path' in locals() else path,
+                file_path=full_path if 'full_path' in locals() else path,
             ) from e
     
-    def _get_file_type(self, path: pathlib.Path) -> FileType:
+    def compute_file_hashes(
+        self, paths: List[str], directory_type: str = "base"
+    ) -> Dict[str, str]:
+        """Compute the SHA-256 hashes of several files in parallel.
+        
+        hashlib releases the GIL while hashing, so the files are hashed on a
+        pool of threads, one per CPU at most.
+        
+        Args:
+            paths: The paths to the files.
+            directory_type: The type of directory to use as the base.
+        
+        Returns:
+            Dict[str, str]: The hexadecimal hash of each file, keyed by its path
+                as given.
+            
+        Raises:
+            FileError: If the hash of any of the files cannot be computed.
+        """
+        if len(paths) < 2:
+            return {path: self.compute_file_hash(path, directory_type) for path in paths}
+        
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(paths), os.cpu_count() or 1),
+            thread_name_prefix="file_hash",
+        ) as executor:
+            digests = executor.map(
+                lambda path: self.compute_file_hash(path, directory_type), paths
+            )
+            return dict(zip(paths, digests))
+    
+    def _stat(self, full_path: str) -> Optional[os.stat_result]:
+        """Get the status of a path, doubling as the existence check.
+        
+        Args:
+            full_path: The absolute path to the file.
+        
+        Returns:
+            Optional[os.stat_result]: The file's status, or None if it does not exist.
+        """
+        try:
+            return os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+    
+    def _get_file_type(self, name: str, is_directory: bool = False) -> FileType:
         """Determine the type of a file based on its extension.
         
         Args:
-            path: The path to the file.
+            name: The name of the file, without its directory.
+            is_directory: Whether the file is a directory.
         
         Returns:
             FileType: The type of the file.
         """
-        if path.is_dir():
+        if is_directory:
             return FileType.UNKNOWN
         
-        extension = path.suffix.lower()
-        return self._file_type_mapping.get(extension, FileType.UNKNOWN)
+        # Same rule as PurePath.suffix: a leading dot does not start an extension
+        stem, dot, extension = name.rpartition(".")
+        if not stem:
+            return FileType.UNKNOWN
+        
+        return _FILE_TYPES_BY_EXTENSION.get(extension.lower(), FileType.UNKNOWN)
     
-    def _get_file_lock(self, path: str) -> threading.RLock:
-        """Get a lock for a file path, creating one if it doesn't exist.
+    def _atomic_write(self, full_path: str, data: bytes) -> None:
+        """Write a file so that readers never see partial content.
+        
+        The caller must hold the file's lock.
         
         Args:
-            path: The absolute path to the file.
+            full_path: The absolute path to the file.
+            data: The content to write.
+        """
+        if self._unnamed_temp_files and self._write_unnamed(full_path, data):
+            return
+        
+        # Write to a temporary file, then rename to ensure atomic write
+        temp_path = full_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        
+        # Rename the temporary file to the target file
+        os.replace(temp_path, full_path)
+    
+    def _write_unnamed(self, full_path: str, data: bytes) -> bool:
+        """Write a file through an unnamed O_TMPFILE inode linked into place.
+        
+        This skips creating and renaming a named temporary file when the target
+        does not exist yet, and never leaves a visible partial file behind.
+        
+        Args:
+            full_path: The absolute path to the file.
+            data: The content to write.
         
         Returns:
-            threading.RLock: A lock for the file.
+            bool: True if the file was written, False if nothing was written
+                and the caller should fall back to a named temporary file.
+                Unnamed writes are turned off only for errors meaning the file
+                system does not support them; other errors, such as a missing
+                directory or a full disk, only affect this call.
         """
-        with self._locks_lock:
-            if path not in self._file_locks:
-                self._file_locks[path] = threading.RLock()
+        try:
+            fd = os.open(os.path.dirname(full_path), _O_TMPFILE | os.O_WRONLY, 0o666)
+        except OSError as e:
+            if e.errno in _O_TMPFILE_UNSUPPORTED:
+                self._unnamed_temp_files = False
+            return False
+        
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
             
-            return self._file_locks[path]
+            inode_path = f"/proc/self/fd/{fd}"
+            try:
+                os.link(inode_path, full_path)
+            except FileExistsError:
+                # Links cannot replace a file, so link a temporary name and rename it
+                temp_path = full_path + ".tmp"
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp_path)
+                os.link(inode_path, temp_path)
+                os.replace(temp_path, full_path)
+            except OSError as e:
+                if e.errno in _PROC_LINK_UNSUPPORTED:
+                    # /proc is unavailable or cannot link across this mount
+                    self._unnamed_temp_files = False
+                return False
+            
+            return True
+        
+        finally:
+            os.close(fd)
     
-    def _release_file_lock(self, path: str) -> None:
-        """Release a file lock if it exists and is not currently held.
+    def _get_file_lock(self, path: str) -> threading.Lock:
+        """Get the lock for a file path.
         
         Args:
             path: The absolute path to the file.
+        
+        Returns:
+            threading.Lock: The lock stripe that guards the file.
         """
-        with self._locks_lock:
-            if path in self._file_locks:
-                # We can't easily check if a lock is held, so we'll just remove it
-                # from the dictionary if the file no longer exists
-                if not os.path.exists(path):
-                    del self._file_locks[path]
+        return self._lock_stripes[hash(path) & (_FILE_LOCK_STRIPES - 1)]
+    
+    def _get_file_lock_pair(
+        self, first_path: str, second_path: str
+    ) -> Tuple[ContextManager[Any], ContextManager[Any]]:
+        """Get the locks guarding two file paths, ordered to avoid deadlocks.
+        
+        Args:
+            first_path: The absolute path to the first file.
+            second_path: The absolute path to the second file.
+        
+        Returns:
+            Tuple[ContextManager[Any], ContextManager[Any]]: The locks to acquire,
+                in order. When both paths share a stripe the second is a no-op.
+        """
+        first = hash(first_path) & (_FILE_LOCK_STRIPES - 1)
+        second = hash(second_path) & (_FILE_LOCK_STRIPES - 1)
+        if first == second:
+            return self._lock_stripes[first], contextlib.nullcontext()
+        
+        first, second = sorted((first, second))
+        return self._lock_stripes[first], self._lock_stripes[second]
     
     def _on_config_changed(self, key: str, value: Any) -> None:
         """Handle configuration changes for the file system.
@@ -900,7 +1222,7 @@ class FileManager(NexusManager):
     def shutdown(self) -> None:
         """Shut down the File Manager.
         
-        Clears file locks and cleans up resources.
+        Cleans up resources.
         
         Raises:
             ManagerShutdownError: If shutdown fails.
@@ -911,10 +1233,6 @@ class FileManager(NexusManager):
         try:
             self._logger.info("Shutting down File Manager")
             
-            # Clear file locks
-            with self._locks_lock:
-                self._file_locks.clear()
-            
             # Unregister config listener
             self._config_manager.unregister_listener("files", self._on_config_changed)
             
@@ -939,24 +1257,26 @@ class FileManager(NexusManager):
         status = super().status()
         
         if self._initialized:
-            # Get disk usage information for the base directory
-            try:
-                total, used, free = shutil.disk_usage(self._base_directory)
-                disk_percent = (used / total) * 100 if total > 0 else 0
-            except:
-                total = used = free = 0
-                disk_percent = 0
+            # Get disk usage information for the base directory, reusing a
+            # recent reading since health checks poll this frequently
+            now = time.monotonic()
+            checked_at, usage = self._disk_usage_cache
+            if usage is None or now - checked_at > _DISK_USAGE_TTL:
+                try:
+                    usage = shutil.disk_usage(self._base_directory)
+                except OSError:
+                    usage = (0, 0, 0)
+                self._disk_usage_cache = (now, usage)
             
-            # Count active locks
-            with self._locks_lock:
-                lock_count = len(self._file_locks)
+            total, used, free = usage
+            disk_percent = (used / total) * 100 if total > 0 else 0
             
             status.update({
                 "directories": {
-                    "base": str(self._base_directory),
-                    "temp": str(self._temp_directory),
-                    "plugin_data": str(self._plugin_data_directory),
-                    "backup": str(self._backup_directory),
+                    "base": self._base_directory,
+                    "temp": self._temp_directory,
+                    "plugin_data": self._plugin_data_directory,
+                    "backup": self._backup_directory,
                 },
                 "disk_usage": {
                     "total_gb": round(total / (1024**3), 2),
@@ -964,7 +1284,7 @@ class FileManager(NexusManager):
                     "free_gb": round(free / (1024**3), 2),
                     "percent_used": round(disk_percent, 2),
                 },
-                "active_locks": lock_count,
+                "lock_stripes": len(self._lock_stripes),
             })
         
         return status
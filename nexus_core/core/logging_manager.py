@@ -1,20 +1,223 @@
 from __future__ import annotations
 
 import atexit
+import io
+import json
 import logging
 import logging.handlers
 import os
 import pathlib
+import queue
 import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
 import structlog
-from pythonjsonlogger import jsonlogger
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder when orjson is not installed
+    orjson = None
 
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import ManagerInitializationError, ManagerShutdownError
 
+# Bytes of log output the file handler collects before writing to disk
+_LOG_FILE_BUFFER_SIZE = 1024 * 1024
+
+# Attributes every LogRecord has, so anything else on a record is an extra field
+_LOG_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"asctime", "message"}
+
+
+def _level_checked(method_name: str, level: int) -> Any:
+    """Wrap a structlog stdlib bound logger method with an early level check.
+    
+    Args:
+        method_name: The name of the logging method to wrap.
+        level: The level the method logs at.
+        
+    Returns:
+        Any: A method that returns at once if the wrapped stdlib logger is not
+            enabled for the level, without building an event dict.
+    """
+    method = getattr(structlog.stdlib.BoundLogger, method_name)
+    
+    def checked(self: Any, event: Optional[str] = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(level):
+            return None
+        return method(self, event, *args, **kw)
+    
+    checked.__name__ = method_name
+    checked.__doc__ = method.__doc__
+    return checked
+
+
+class _LevelCheckingBoundLogger(structlog.stdlib.BoundLogger):
+    """A structlog stdlib bound logger that drops calls below the current level early.
+    
+    The level is read from the wrapped stdlib logger on every call, so a level
+    change also applies to loggers that were already created and cached.
+    """
+    
+    debug = _level_checked("debug", logging.DEBUG)
+    info = _level_checked("info", logging.INFO)
+    warning = _level_checked("warning", logging.WARNING)
+    error = _level_checked("error", logging.ERROR)
+    exception = _level_checked("exception", logging.ERROR)
+    critical = _level_checked("critical", logging.CRITICAL)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects.
+    
+    Each object has the asctime, name, levelname and message fields, followed
+    by any extra fields passed with the record and the formatted exception or
+    stack when present. A record whose message is a dict, as structlog emits,
+    has its items merged in and an empty message. Values JSON cannot represent
+    are written as their string form.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON.
+        
+        Args:
+            record: The log record to format.
+            
+        Returns:
+            str: The record as a JSON object.
+        """
+        if isinstance(record.msg, dict):
+            message = ""
+            message_dict = record.msg
+        else:
+            message = record.getMessage()
+            message_dict = None
+        
+        log_record: Dict[str, Any] = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": message,
+        }
+        
+        if message_dict:
+            log_record.update(message_dict)
+        
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_ATTRIBUTES and not key.startswith("_"):
+                log_record[key] = value
+        
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_record["exc_info"] = record.exc_text
+        
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+        
+        if orjson is not None:
+            return orjson.dumps(
+                log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        return json.dumps(log_record, default=str, ensure_ascii=False)
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """Queues log records for the background listener without formatting them.
+    
+    The stock QueueHandler formats records in the logging thread, which would
+    leave the JSON formatter only a flattened message. This one just merges the
+    message arguments, so that formatting happens in the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queuing.
+        
+        Args:
+            record: The log record to queue.
+            
+        Returns:
+            logging.LogRecord: The record, with its message arguments merged.
+        """
+        if record.args and not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _LogQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry.
+    
+    Handlers can then buffer writes while records arrive in bursts, without
+    holding records back once logging goes quiet.
+    """
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Get the next record from the queue.
+        
+        Args:
+            block: Whether to wait for a record.
+            
+        Returns:
+            logging.LogRecord: The next record, or the stop sentinel.
+        """
+        if block:
+            try:
+                return self.queue.get_nowait()
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+        
+        return self.queue.get(block)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes through a large buffer.
+    
+    Records are encoded once and collected in a buffer of
+    _LOG_FILE_BUFFER_SIZE bytes rather than flushed one at a time. The buffer
+    is written when it fills, when the queue listener goes idle, before the
+    file is rotated, and when the handler is closed. The file size is tracked
+    as records are written, so no seek or second format is needed to decide
+    when to rotate.
+    """
+    
+    def _open(self) -> io.BufferedWriter:
+        """Open the log file for appending through the write buffer.
+        
+        Returns:
+            io.BufferedWriter: The buffered log file.
+        """
+        stream = open(self.baseFilename, self.mode + "b", buffering=_LOG_FILE_BUFFER_SIZE)
+        self._stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record to the buffer, rotating the file when full.
+        
+        Args:
+            record: The log record to write.
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            
+            if self.stream is None:
+                self.stream = self._open()
+            
+            if self.maxBytes > 0 and self._stream_size + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(data)
+            self._stream_size += len(data)
+        
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 class LoggingManager(NexusManager):
     """Manages application logging configuration and access.
@@ -50,6 +253,13 @@ class LoggingManager(NexusManager):
         self._log_directory: Optional[pathlib.Path] = None
         self._enable_structlog = False
         self._handlers: List[logging.Handler] = []
+        
+        # The root logger only queues records; a listener thread formats and
+        # writes them with whichever handlers are currently enabled
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler: Optional[logging.Handler] = None
+        self._listener: Optional[_LogQueueListener] = None
+        self._active_handlers: List[logging.Handler] = []
     
     def initialize(self) -> None:
         """Initialize the Logging Manager.
@@ -97,7 +307,7 @@ class LoggingManager(NexusManager):
                 self._console_handler = logging.StreamHandler(sys.stdout)
                 self._console_handler.setLevel(console_level)
                 self._console_handler.setFormatter(formatter)
-                self._root_logger.addHandler(self._console_handler)
+                self._active_handlers.append(self._console_handler)
                 self._handlers.append(self._console_handler)
             
             # Add file handler if enabled
@@ -118,14 +328,15 @@ class LoggingManager(NexusManager):
                 else:
                     backup_count = 30  # Default: 30 days
                 
-                self._file_handler = logging.handlers.RotatingFileHandler(
+                self._file_handler = _BufferedRotatingFileHandler(
                     file_path,
                     maxBytes=max_bytes,
                     backupCount=backup_count,
+                    encoding="utf-8",
                 )
                 self._file_handler.setLevel(log_level)
                 self._file_handler.setFormatter(formatter)
-                self._root_logger.addHandler(self._file_handler)
+                self._active_handlers.append(self._file_handler)
                 self._handlers.append(self._file_handler)
             
             # Add database handler if enabled (this is a placeholder)
@@ -142,6 +353,11 @@ class LoggingManager(NexusManager):
                 # For now, we'll just note that it's not implemented
                 pass
             
+            # Route the root logger through the queue to the listener thread
+            self._queue_handler = _LogQueueHandler(self._log_queue)
+            self._root_logger.addHandler(self._queue_handler)
+            self._restart_listener()
+            
             # Configure structlog if enabled
             if self._enable_structlog:
                 self._configure_structlog()
@@ -173,14 +389,14 @@ class LoggingManager(NexusManager):
         Returns:
             logging.Formatter: A formatter that outputs logs in JSON format.
         """
-        return jsonlogger.JsonFormatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S%z",
-            json_ensure_ascii=False,
-        )
+        return JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z")
     
     def _configure_structlog(self) -> None:
-        """Configure structlog for structured logging."""
+        """Configure structlog for structured logging.
+        
+        Calls below the stdlib logger's level return before an event dict is
+        built or any processor runs.
+        """
         structlog.configure(
             processors=[
                 structlog.stdlib.filter_by_level,
@@ -194,7 +410,7 @@ class LoggingManager(NexusManager):
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=_LevelCheckingBoundLogger,
             cache_logger_on_first_use=True,
         )
     
@@ -250,10 +466,7 @@ class LoggingManager(NexusManager):
             
             elif sub_key.endswith(".enabled"):
                 # Enable/disable console handler
-                if not value and self._console_handler in self._root_logger.handlers:
-                    self._root_logger.removeHandler(self._console_handler)
-                elif value and self._console_handler not in self._root_logger.handlers:
-                    self._root_logger.addHandler(self._console_handler)
+                self._set_handler_enabled(self._console_handler, bool(value))
         
         elif sub_key.startswith("file.") and self._file_handler:
             if sub_key.endswith(".level"):
@@ -264,14 +477,44 @@ class LoggingManager(NexusManager):
             
             elif sub_key.endswith(".enabled"):
                 # Enable/disable file handler
-                if not value and self._file_handler in self._root_logger.handlers:
-                    self._root_logger.removeHandler(self._file_handler)
-                elif value and self._file_handler not in self._root_logger.handlers:
-                    self._root_logger.addHandler(self._file_handler)
+                self._set_handler_enabled(self._file_handler, bool(value))
         
         # In a more complete implementation, we'd handle database and ELK handler
         # configuration changes as well
     
+    def _set_handler_enabled(self, handler: logging.Handler, enabled: bool) -> None:
+        """Enable or disable a handler on the background listener.
+        
+        Args:
+            handler: The handler to enable or disable.
+            enabled: Whether the handler should receive log records.
+        """
+        if enabled == (handler in self._active_handlers):
+            return
+        
+        if enabled:
+            self._active_handlers.append(handler)
+        else:
+            self._active_handlers.remove(handler)
+        
+        self._restart_listener()
+    
+    def _restart_listener(self) -> None:
+        """Start a queue listener that writes to the currently enabled handlers.
+        
+        Any running listener is stopped first, which writes out the records it
+        has already queued.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+        
+        self._listener = _LogQueueListener(
+            self._log_queue,
+            *self._active_handlers,
+            respect_handler_level=True,
+        )
+        self._listener.start()
+    
     def shutdown(self) -> None:
         """Shut down the Logging Manager.
         
@@ -291,6 +534,13 @@ class LoggingManager(NexusManager):
                     extra={"manager": "LoggingManager", "event": "shutdown"},
                 )
             
+            # Write out queued records and stop queuing new ones
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            if self._root_logger and self._queue_handler:
+                self._root_logger.removeHandler(self._queue_handler)
+            
             # Close all handlers
             for handler in self._handlers:
                 try:
@@ -299,6 +549,8 @@ class LoggingManager(NexusManager):
                 except Exception:
                     # Just continue if a handler fails to close
                     pass
+            self._handlers.clear()
+            self._active_handlers.clear()
             
             # Unregister config listener
             self._config_manager.unregister_listener("logging", self._on_config_changed)
@@ -328,11 +580,9 @@ class LoggingManager(NexusManager):
                 "log_directory": str(self._log_directory) if self._log_directory else None,
                 "handlers": {
                     "console": self._console_handler is not None and
-                              self._console_handler in self._root_logger.handlers
-                              if self._root_logger else False,
+                              self._console_handler in self._active_handlers,
                     "file": self._file_handler is not None and
-                           self._file_handler in self._root_logger.handlers
-                           if self._root_logger else False,
+                           self._file_handler in self._active_handlers,
                     "database": self._database_handler is not None,
                     "elk": self._elk_handler is not None,
                 },
@@ -1,19 +1,91 @@
 from __future__ import annotations
 
 import datetime
+import itertools
+import json
+import os
+import queue
+import sys
 import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 import psutil
 from prometheus_client import Counter, Gauge, Histogram, Summary, start_http_server
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder when orjson is not installed
+    orjson = None
+
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import ManagerInitializationError, ManagerShutdownError
 
+# Number of alert lock stripes; a power of two so a hash can be masked
+_ALERT_LOCK_STRIPES = 16
+
+
+def _read_cpu_times() -> Tuple[int, int]:
+    """Read the aggregate CPU times from /proc/stat.
+    
+    Returns:
+        Tuple[int, int]: The busy and total CPU time in clock ticks. As in
+            psutil, idle and iowait count as not busy and guest time is
+            excluded from the total, since it is already part of user time.
+    """
+    with open("/proc/stat", "rb") as f:
+        fields = f.readline().split()
+    
+    # user, nice, system, idle, iowait, irq, softirq, steal
+    times = [int(value) for value in fields[1:9]]
+    total = sum(times)
+    return total - times[3] - times[4], total
+
+
+def _read_memory_percent() -> float:
+    """Read the share of memory in use from /proc/meminfo.
+    
+    Returns:
+        float: The percentage of memory that is not available, as psutil's
+            virtual_memory().percent computes it.
+            
+    Raises:
+        ValueError: If the kernel does not report MemAvailable.
+    """
+    total = available = None
+    with open("/proc/meminfo", "rb") as f:
+        for line in f:
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1])
+                break
+    
+    if not total or available is None:
+        raise ValueError("/proc/meminfo does not report MemAvailable")
+    return round((total - available) / total * 100, 1)
+
+
+def _read_disk_percent(path: str) -> float:
+    """Read the share of a file system in use with a single statvfs call.
+    
+    Args:
+        path: A path on the file system.
+        
+    Returns:
+        float: The percentage of space in use, as psutil's disk_usage().percent
+            computes it, excluding blocks reserved for the superuser.
+    """
+    st = os.statvfs(path)
+    used = st.f_blocks - st.f_bfree
+    usable = used + st.f_bavail
+    return round(used / usable * 100, 1) if usable else 0.0
+
 
 class AlertLevel(Enum):
     """Alert severity levels."""
@@ -24,7 +96,21 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as a local ISO 8601 string.
+    
+    Args:
+        timestamp: Seconds since the epoch, or None.
+        
+    Returns:
+        Optional[str]: The formatted timestamp, or None if none was given.
+    """
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp).isoformat()
+
+
+@dataclass(slots=True)
 class Alert:
     """Represents a monitoring alert."""
     
@@ -32,13 +118,58 @@ class Alert:
     level: AlertLevel  # Severity level
     message: str  # Alert message
     source: str  # Component that generated the alert
-    timestamp: datetime.datetime  # When the alert was created
+    timestamp: float  # When the alert was last raised, in seconds since the epoch
     metric_name: Optional[str] = None  # Name of the metric that triggered the alert
     metric_value: Optional[float] = None  # Value of the metric that triggered the alert
     threshold: Optional[float] = None  # Threshold that was exceeded
     resolved: bool = False  # Whether the alert has been resolved
-    resolved_at: Optional[datetime.datetime] = None  # When the alert was resolved
+    resolved_at: Optional[float] = None  # When the alert was resolved, in seconds since the epoch
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional metadata
+    _as_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Cached to_dict() result, cleared whenever the alert changes
+    
+    def refresh(self, metric_value: Optional[float]) -> None:
+        """Record that the alert was raised again.
+        
+        Args:
+            metric_value: The latest value of the metric.
+        """
+        self.timestamp = time.time()
+        self.metric_value = metric_value
+        self._as_dict = None
+    
+    def resolve(self) -> None:
+        """Mark the alert as resolved now."""
+        self.resolved = True
+        self.resolved_at = time.time()
+        self._as_dict = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the alert to a dictionary.
+        
+        The result is cached until the alert next changes and is shared
+        between callers, so it must not be modified. Callers must hold the
+        lock that guards changes to the alert.
+        
+        Returns:
+            Dict[str, Any]: The alert, with timestamps as ISO 8601 strings.
+        """
+        if self._as_dict is None:
+            self._as_dict = {
+                "id": self.id,
+                "level": self.level.value,
+                "message": self.message,
+                "source": self.source,
+                "timestamp": _iso(self.timestamp),
+                "metric_name": self.metric_name,
+                "metric_value": self.metric_value,
+                "threshold": self.threshold,
+                "resolved": self.resolved,
+                "resolved_at": _iso(self.resolved_at),
+                "metadata": self.metadata,
+            }
+        return self._as_dict
 
 
 class ResourceMonitoringManager(NexusManager):
@@ -73,6 +204,10 @@ class ResourceMonitoringManager(NexusManager):
         
         # Prometheus metrics
         self._metrics: Dict[str, Any] = {}  # name -> prometheus metric object
+        
+        # Labelled events_total children, keyed by (event_type, source)
+        self._events_total_cache: Dict[Tuple[str, str], Any] = {}
+        self._subscribed_to_events = False
         self._prometheus_server_port: Optional[int] = None
         
         # System resource metrics
@@ -90,13 +225,66 @@ class ResourceMonitoringManager(NexusManager):
         # Active alerts
         self._alerts: Dict[str, Alert] = {}
         self._resolved_alerts: deque = deque(maxlen=100)  # Keep last 100 resolved alerts
-        self._alerts_lock = threading.RLock()
+        self._alert_index: Dict[Tuple[str, AlertLevel], str] = {}  # (metric, level) -> alert_id
+        self._alert_ids = itertools.count(1)  # Source of alert ID numbers
+        
+        # Bumped after every change to an alert, to invalidate the cached
+        # get_alerts_json() output, which is kept as (version, arguments, json)
+        self._alert_versions = itertools.count(1)
+        self._alerts_version = 0
+        self._alerts_json_cache: Optional[Tuple[int, Tuple[Any, ...], bytes]] = None
+        self._last_alert_levels: Dict[str, Optional[AlertLevel]] = {}  # metric -> level at last check
+        
+        # Threshold alert messages per metric, as (critical, warning) format strings
+        self._alert_messages: Dict[str, Tuple[str, str]] = {}
+        self._build_alert_messages()
+        
+        # Log method for each alert level
+        self._alert_log_methods: Dict[AlertLevel, Callable[..., None]] = {
+            AlertLevel.INFO: self._logger.info,
+            AlertLevel.WARNING: self._logger.warning,
+            AlertLevel.ERROR: self._logger.error,
+            AlertLevel.CRITICAL: self._logger.critical,
+        }
+        
+        # Alert locks, striped by metric name so unrelated metrics never contend.
+        # The alert dictionaries themselves are only changed by single operations.
+        self._alert_locks: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(_ALERT_LOCK_STRIPES)
+        )
         
         # Metrics collection interval
         self._metrics_interval_seconds = 10
         
+        # Samples waiting to be published together, as
+        # (timestamp, cpu_percent, memory_percent, disk_percent) tuples
+        self._metrics_batch_size = 1
+        self._metrics_batch: List[Tuple[float, float, float, float]] = []
+        
         # Collection tasks
         self._collection_tasks: Dict[str, str] = {}  # metric_name -> task_id
+        
+        # Alert events are published from a dedicated thread, so slow
+        # subscribers never hold up metric collection. None stops the thread.
+        self._publish_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._publish_thread: Optional[threading.Thread] = None
+        
+        # This process, kept so CPU usage is measured between successive samples
+        self._process: Optional[psutil.Process] = None
+        
+        # When the process started, on the time.monotonic() clock, so uptime
+        # is unaffected by wall clock changes
+        self._process_start_monotonic: Optional[float] = None
+        
+        # System samples are read straight from /proc where available, with
+        # the CPU times of the previous sample kept to measure usage between them
+        self._read_proc = sys.platform.startswith("linux")
+        self._prev_cpu_times: Tuple[int, int] = (0, 0)
+        
+        # Most recent system sample, as (time.monotonic(), (cpu, memory, disk)),
+        # shared with status() and diagnostic reports
+        self._sample_cache: Tuple[float, Optional[Tuple[float, float, float]]] = (0.0, None)
+        self._sample_lock = threading.Lock()
     
     def initialize(self) -> None:
         """Initialize the Resource Monitoring Manager.
@@ -107,6 +295,19 @@ class ResourceMonitoringManager(NexusManager):
             ManagerInitializationError: If initialization fails.
         """
         try:
+            # Prime the CPU counters so later non-blocking samples have a baseline
+            psutil.cpu_percent(interval=None)
+            if self._read_proc:
+                try:
+                    self._prev_cpu_times = _read_cpu_times()
+                except (OSError, ValueError, IndexError):
+                    self._read_proc = False
+            self._process = psutil.Process()
+            self._process.cpu_percent(interval=None)
+            self._process_start_monotonic = time.monotonic() - (
+                time.time() - self._process.create_time()
+            )
+            
             # Get configuration
             monitoring_config = self._config_manager.get("monitoring", {})
             enabled = monitoring_config.get("enabled", True)
@@ -124,9 +325,11 @@ class ResourceMonitoringManager(NexusManager):
             # Alert thresholds
             alert_thresholds = monitoring_config.get("alert_thresholds", {})
             self._alert_thresholds.update(alert_thresholds)
+            self._build_alert_messages()
             
             # Metrics interval
             self._metrics_interval_seconds = monitoring_config.get("metrics_interval_seconds", 10)
+            self._metrics_batch_size = max(1, monitoring_config.get("metrics_batch_size", 1))
             
             # Set up Prometheus metrics
             if prometheus_enabled:
@@ -156,6 +359,16 @@ class ResourceMonitoringManager(NexusManager):
                     ["event_type"]
                 )
                 
+                # Counters for the events this manager publishes itself
+                for event_type in (
+                    "monitoring/initialized",
+                    "monitoring/metrics",
+                    "monitoring/metrics_batch",
+                    "monitoring/alert",
+                    "monitoring/alert_resolved",
+                ):
+                    self.register_event_type(event_type, "monitoring_manager")
+                
                 # Start Prometheus HTTP server
                 start_http_server(prometheus_port)
                 self._prometheus_server_port = prometheus_port
@@ -164,18 +377,29 @@ class ResourceMonitoringManager(NexusManager):
                     f"Started Prometheus metrics server on port {prometheus_port}"
                 )
             
-            # Subscribe to events for monitoring
-            self._event_bus.subscribe(
-                event_type="*",  # All events
-                callback=self._on_event,
-                subscriber_id="monitoring_manager"
-            )
+            # Subscribe to events for monitoring. Events are only counted for
+            # Prometheus, so without it there is nothing to do for each event.
+            if prometheus_enabled:
+                self._event_bus.subscribe(
+                    event_type="*",  # All events
+                    callback=self._on_event,
+                    subscriber_id="monitoring_manager"
+                )
+                self._subscribed_to_events = True
             
             # Register for config changes
             self._config_manager.register_listener(
                 "monitoring", self._on_config_changed
             )
             
+            # Start publishing alert events before anything can raise them
+            self._publish_thread = threading.Thread(
+                target=self._drain_publish_queue,
+                name="monitoring-publisher",
+                daemon=True,
+            )
+            self._publish_thread.start()
+            
             # Schedule metric collection tasks
             self._schedule_metric_collection()
             
@@ -219,20 +443,12 @@ class ResourceMonitoringManager(NexusManager):
     def _collect_system_metrics(self) -> None:
         """Collect system resource metrics (CPU, memory, disk)."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent, memory_percent, disk_percent = self._cached_sample(max_age=0.0)
+            
             if self._cpu_percent_gauge:
                 self._cpu_percent_gauge.set(cpu_percent)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
             if self._memory_percent_gauge:
                 self._memory_percent_gauge.set(memory_percent)
-            
-            # Disk usage (for the root/system partition)
-            disk = psutil.disk_usage("/")
-            disk_percent = disk.percent
             if self._disk_percent_gauge:
                 self._disk_percent_gauge.set(disk_percent)
             
@@ -242,26 +458,126 @@ class ResourceMonitoringManager(NexusManager):
             self._check_threshold("disk_percent", disk_percent)
             
             # Publish metrics event
-            self._event_bus.publish(
-                event_type="monitoring/metrics",
-                source="monitoring_manager",
-                payload={
-                    "cpu_percent": cpu_percent,
-                    "memory_percent": memory_percent,
-                    "disk_percent": disk_percent,
-                    "timestamp": time.time(),
-                },
-            )
+            if self._metrics_batch_size == 1:
+                self._event_bus.publish(
+                    event_type="monitoring/metrics",
+                    source="monitoring_manager",
+                    payload={
+                        "cpu_percent": cpu_percent,
+                        "memory_percent": memory_percent,
+                        "disk_percent": disk_percent,
+                        "timestamp": time.time(),
+                    },
+                )
+            else:
+                self._publish_metrics_batch(
+                    (time.time(), cpu_percent, memory_percent, disk_percent)
+                )
         
         except Exception as e:
             self._logger.error(f"Error collecting system metrics: {str(e)}")
     
+    def _sample_system(self) -> Tuple[float, float, float]:
+        """Sample system CPU, memory and disk usage.
+        
+        On Linux the values are read directly from /proc and statvfs, which
+        takes one small read or system call apiece. Elsewhere, or if those
+        reads fail, psutil is used instead.
+        
+        Returns:
+            Tuple[float, float, float]: CPU usage since the previous sample,
+                memory usage, and usage of the root partition, as percentages.
+        """
+        if self._read_proc:
+            try:
+                busy, total = _read_cpu_times()
+                prev_busy, prev_total = self._prev_cpu_times
+                self._prev_cpu_times = (busy, total)
+                
+                elapsed = total - prev_total
+                cpu_percent = (
+                    round(max(0.0, (busy - prev_busy) / elapsed * 100), 1)
+                    if elapsed > 0 else 0.0
+                )
+                
+                return cpu_percent, _read_memory_percent(), _read_disk_percent("/")
+            
+            except (OSError, ValueError, IndexError) as e:
+                self._logger.warning(
+                    f"Falling back to psutil for system metrics: {str(e)}"
+                )
+                self._read_proc = False
+        
+        return (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage("/").percent,
+        )
+    
+    def _publish_metrics_batch(self, sample: Tuple[float, float, float, float]) -> None:
+        """Add a sample to the current batch, publishing the batch once it is full.
+        
+        Args:
+            sample: The sample, as (timestamp, cpu_percent, memory_percent,
+                disk_percent).
+        """
+        self._metrics_batch.append(sample)
+        if len(self._metrics_batch) >= self._metrics_batch_size:
+            self._flush_metrics_batch()
+    
+    def _flush_metrics_batch(self) -> None:
+        """Publish the samples in the current batch, if there are any."""
+        samples, self._metrics_batch = self._metrics_batch, []
+        if not samples:
+            return
+        
+        self._event_bus.publish(
+            event_type="monitoring/metrics_batch",
+            source="monitoring_manager",
+            payload={
+                "fields": ("timestamp", "cpu_percent", "memory_percent", "disk_percent"),
+                "samples": samples,
+            },
+        )
+    
+    def _cached_sample(self, max_age: Optional[float] = None) -> Tuple[float, float, float]:
+        """Get a recent system sample, taking a new one only if the last is too old.
+        
+        Callers that poll at arbitrary rates get the periodic sample or one
+        another took recently, which also keeps them from shortening the
+        window the next periodic CPU sample is measured over.
+        
+        Args:
+            max_age: The oldest sample to accept, in seconds. Defaults to half
+                the metrics interval.
+                
+        Returns:
+            Tuple[float, float, float]: CPU, memory and disk usage percentages,
+                as returned by _sample_system().
+        """
+        if max_age is None:
+            max_age = self._metrics_interval_seconds / 2
+        
+        sampled_at, sample = self._sample_cache
+        if sample is not None and time.monotonic() - sampled_at < max_age:
+            return sample
+        
+        with self._sample_lock:
+            # Another thread may have sampled while this one waited
+            sampled_at, sample = self._sample_cache
+            if sample is None or time.monotonic() - sampled_at >= max_age:
+                sample = self._sample_system()
+                self._sample_cache = (time.monotonic(), sample)
+            return sample
+    
     def _collect_uptime_metrics(self) -> None:
         """Collect application uptime metrics."""
         try:
+            if self._process_start_monotonic is None:
+                return
+            
             # Calculate uptime (time since process started)
-            process = psutil.Process()
-            uptime_seconds = time.time() - process.create_time()
+            uptime_seconds = time.monotonic() - self._process_start_monotonic
             
             # Update Prometheus metric
             if "app_uptime_seconds" in self._metrics:
@@ -284,26 +600,50 @@ class ResourceMonitoringManager(NexusManager):
         
         # Determine alert level based on how far the value exceeds the threshold
         if value >= threshold * 1.25:  # 25% over threshold - critical
-            self._create_alert(
-                level=AlertLevel.CRITICAL,
-                message=f"{metric_name.replace('_', ' ').title()} is critically high: {value:.1f}%",
-                source="monitoring_manager",
-                metric_name=metric_name,
-                metric_value=value,
-                threshold=threshold
-            )
+            level = AlertLevel.CRITICAL
         elif value >= threshold:  # At or over threshold - warning
-            self._create_alert(
-                level=AlertLevel.WARNING,
-                message=f"{metric_name.replace('_', ' ').title()} is high: {value:.1f}%",
-                source="monitoring_manager",
-                metric_name=metric_name,
-                metric_value=value,
-                threshold=threshold
-            )
+            level = AlertLevel.WARNING
         else:
-            # Value is below threshold - resolve any existing alerts
-            self._resolve_alerts_for_metric(metric_name)
+            level = None
+        
+        last_level = self._last_alert_levels.get(metric_name)
+        self._last_alert_levels[metric_name] = level
+        
+        if level is None:
+            # Value is below threshold - resolve any alerts raised since the last check
+            if last_level is not None:
+                self._resolve_alerts_for_metric(metric_name)
+            return
+        
+        if level is last_level:
+            # Still breached at the same level, so just refresh the active alert
+            with self._get_alert_lock(metric_name):
+                alert_id = self._alert_index.get((metric_name, level))
+                if alert_id is not None:
+                    self._alerts[alert_id].refresh(value)
+                    self._alerts_version = next(self._alert_versions)
+                    return
+        
+        critical_message, warning_message = self._alert_messages[metric_name]
+        self._create_alert(
+            level=level,
+            message=(
+                critical_message if level is AlertLevel.CRITICAL else warning_message
+            ).format(value),
+            source="monitoring_manager",
+            metric_name=metric_name,
+            metric_value=value,
+            threshold=threshold
+        )
+    
+    def _build_alert_messages(self) -> None:
+        """Prepare the threshold alert messages for every configured metric."""
+        for metric_name in self._alert_thresholds:
+            title = metric_name.replace("_", " ").title()
+            self._alert_messages[metric_name] = (
+                f"{title} is critically high: {{:.1f}}%",
+                f"{title} is high: {{:.1f}}%",
+            )
     
     def _create_alert(
         self,
@@ -329,29 +669,18 @@ class ResourceMonitoringManager(NexusManager):
         Returns:
             str: The ID of the created alert.
         """
-        # Generate a unique ID for the alert
-        import uuid
-        alert_id = str(uuid.uuid4())
-        
-        # Check if there's already an active alert for this metric
-        if metric_name:
-            with self._alerts_lock:
-                for existing_alert in self._alerts.values():
-                    if (
-                        existing_alert.metric_name == metric_name
-                        and existing_alert.level == level
-                        and not existing_alert.resolved
-                    ):
-                        # Don't create duplicate alerts, just update the existing one
-                        existing_alert.timestamp = datetime.datetime.now()
-                        existing_alert.metric_value = metric_value
-                        
-                        self._logger.debug(
-                            f"Updated existing alert for {metric_name}: {message}",
-                            extra={"alert_id": existing_alert.id, "level": level.value},
-                        )
-                        
-                        return existing_alert.id
+        # Check if there's already an active alert for this metric and level.
+        # The unlocked lookup skips building a new alert in the common case;
+        # the index is checked again under the lock before anything changes.
+        index_key = (metric_name, level) if metric_name else None
+        if index_key is not None and index_key in self._alert_index:
+            with self._get_alert_lock(metric_name):
+                existing_id = self._alert_index.get(index_key)
+                if existing_id is not None:
+                    return self._refresh_alert(existing_id, message, metric_value)
+        
+        # Generate an ID that is unique within this process
+        alert_id = f"alert-{next(self._alert_ids)}"
         
         # Create a new alert
         alert = Alert(
@@ -359,7 +688,7 @@ class ResourceMonitoringManager(NexusManager):
             level=level,
             message=message,
             source=source,
-            timestamp=datetime.datetime.now(),
+            timestamp=time.time(),
             metric_name=metric_name,
             metric_value=metric_value,
             threshold=threshold,
@@ -367,16 +696,20 @@ class ResourceMonitoringManager(NexusManager):
         )
         
         # Store the alert
-        with self._alerts_lock:
+        if index_key is None:
             self._alerts[alert_id] = alert
+        else:
+            with self._get_alert_lock(metric_name):
+                existing_id = self._alert_index.get(index_key)
+                if existing_id is not None:
+                    # Another thread raised the same alert in the meantime
+                    return self._refresh_alert(existing_id, message, metric_value)
+                self._alerts[alert_id] = alert
+                self._alert_index[index_key] = alert_id
+        self._alerts_version = next(self._alert_versions)
         
         # Log the alert
-        log_method = {
-            AlertLevel.INFO: self._logger.info,
-            AlertLevel.WARNING: self._logger.warning,
-            AlertLevel.ERROR: self._logger.error,
-            AlertLevel.CRITICAL: self._logger.critical,
-        }.get(level, self._logger.warning)
+        log_method = self._alert_log_methods.get(level, self._logger.warning)
         
         log_method(
             f"Alert: {message}",
@@ -390,14 +723,13 @@ class ResourceMonitoringManager(NexusManager):
         )
         
         # Publish alert event
-        self._event_bus.publish(
-            event_type="monitoring/alert",
-            source="monitoring_manager",
-            payload={
+        self._publish_alert_event(
+            "monitoring/alert",
+            {
                 "alert_id": alert_id,
                 "level": level.value,
                 "message": message,
-                "timestamp": alert.timestamp.isoformat(),
+                "timestamp": _iso(alert.timestamp),
                 "metric_name": metric_name,
                 "metric_value": metric_value,
                 "threshold": threshold,
@@ -406,38 +738,125 @@ class ResourceMonitoringManager(NexusManager):
         
         return alert_id
     
+    def _refresh_alert(
+        self,
+        alert_id: str,
+        message: str,
+        metric_value: Optional[float],
+    ) -> str:
+        """Update an active alert that was raised again instead of duplicating it.
+        
+        Must be called with the metric's alert lock held.
+        
+        Args:
+            alert_id: The ID of the active alert.
+            message: The message of the repeated alert, for logging.
+            metric_value: The latest value of the metric.
+            
+        Returns:
+            str: The ID of the existing alert.
+        """
+        existing_alert = self._alerts[alert_id]
+        existing_alert.refresh(metric_value)
+        self._alerts_version = next(self._alert_versions)
+        
+        self._logger.debug(
+            f"Updated existing alert for {existing_alert.metric_name}: {message}",
+            extra={"alert_id": alert_id, "level": existing_alert.level.value},
+        )
+        
+        return alert_id
+    
+    def _get_alert_lock(self, metric_name: str) -> threading.Lock:
+        """Get the lock for a metric's alerts.
+        
+        Args:
+            metric_name: The name of the metric.
+            
+        Returns:
+            threading.Lock: The lock stripe that guards the metric's alerts.
+        """
+        return self._alert_locks[hash(metric_name) & (_ALERT_LOCK_STRIPES - 1)]
+    
     def _resolve_alerts_for_metric(self, metric_name: str) -> None:
         """Resolve all active alerts for a specific metric.
         
         Args:
             metric_name: The name of the metric to resolve alerts for.
         """
-        with self._alerts_lock:
-            for alert_id, alert in list(self._alerts.items()):
-                if alert.metric_name == metric_name and not alert.resolved:
-                    # Resolve the alert
-                    alert.resolved = True
-                    alert.resolved_at = datetime.datetime.now()
-                    
-                    # Move to resolved alerts
-                    self._resolved_alerts.append(alert)
-                    del self._alerts[alert_id]
-                    
-                    self._logger.info(
-                        f"Resolved alert for {metric_name}",
-                        extra={"alert_id": alert_id, "level": alert.level.value},
-                    )
-                    
-                    # Publish alert resolved event
-                    self._event_bus.publish(
-                        event_type="monitoring/alert_resolved",
-                        source="monitoring_manager",
-                        payload={
-                            "alert_id": alert_id,
-                            "metric_name": metric_name,
-                            "resolved_at": alert.resolved_at.isoformat(),
-                        },
-                    )
+        resolved = []
+        
+        with self._get_alert_lock(metric_name):
+            # Every active metric alert is indexed, once per level
+            for level in AlertLevel:
+                alert_id = self._alert_index.pop((metric_name, level), None)
+                if alert_id is None:
+                    continue
+                
+                # Resolve the alert. Resolved alerts never change again, so
+                # their dictionary form is built once, here.
+                alert = self._alerts.pop(alert_id)
+                alert.resolve()
+                alert.to_dict()
+                
+                # Move to resolved alerts
+                self._resolved_alerts.append(alert)
+                resolved.append(alert)
+            
+            if resolved:
+                self._alerts_version = next(self._alert_versions)
+        
+        # Log and publish outside the lock, which is not reentrant
+        for alert in resolved:
+            self._logger.info(
+                f"Resolved alert for {metric_name}",
+                extra={"alert_id": alert.id, "level": alert.level.value},
+            )
+            
+            # Publish alert resolved event
+            self._publish_alert_event(
+                "monitoring/alert_resolved",
+                {
+                    "alert_id": alert.id,
+                    "metric_name": metric_name,
+                    "resolved_at": _iso(alert.resolved_at),
+                },
+            )
+    
+    def _publish_alert_event(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """Publish an alert event from the publisher thread.
+        
+        Before the thread is started, the event is published directly.
+        
+        Args:
+            event_type: The type of the event.
+            payload: The event payload.
+        """
+        if self._publish_thread is None:
+            self._event_bus.publish(
+                event_type=event_type,
+                source="monitoring_manager",
+                payload=payload,
+            )
+        else:
+            self._publish_queue.put((event_type, payload))
+    
+    def _drain_publish_queue(self) -> None:
+        """Publish queued alert events until the stop marker is received."""
+        while True:
+            item = self._publish_queue.get()
+            if item is None:
+                return
+            
+            event_type, payload = item
+            try:
+                self._event_bus.publish(
+                    event_type=event_type,
+                    source="monitoring_manager",
+                    payload=payload,
+                )
+            except Exception as e:
+                self._logger.error(f"Error publishing {event_type} event: {str(e)}")
     
     def _on_event(self, event: Any) -> None:
         """Handle events for monitoring purposes.
@@ -446,11 +865,12 @@ class ResourceMonitoringManager(NexusManager):
             event: The event to handle.
         """
         # Increment event counter
-        if "events_total" in self._metrics:
-            self._metrics["events_total"].labels(
-                event_type=event.event_type,
-                source=event.source,
-            ).inc()
+        child = self._events_total_cache.get((event.event_type, event.source))
+        if child is None:
+            child = self.register_event_type(event.event_type, event.source)
+            if child is None:
+                return
+        child.inc()
     
     def _on_config_changed(self, key: str, value: Any) -> None:
         """Handle configuration changes for monitoring.
@@ -493,6 +913,29 @@ class ResourceMonitoringManager(NexusManager):
                 extra={"interval": value},
             )
     
+    def register_event_type(self, event_type: str, source: str) -> Any:
+        """Create the event counter for an event type and source ahead of time.
+        
+        Components can declare the events they publish at startup, so that
+        counting them never has to resolve the counter's labels. Events that
+        were not declared are registered the first time they are seen.
+        
+        Args:
+            event_type: The type of the events.
+            source: The component that publishes them.
+            
+        Returns:
+            Any: The labelled Prometheus counter, or None if Prometheus is disabled.
+        """
+        events_total = self._metrics.get("events_total")
+        if events_total is None:
+            return None
+        
+        # Racing threads get the same child back from labels(), so no lock
+        child = events_total.labels(event_type=event_type, source=source)
+        self._events_total_cache[(event_type, source)] = child
+        return child
+    
     def register_gauge(
         self,
         name: str,
@@ -629,51 +1072,95 @@ class ResourceMonitoringManager(NexusManager):
             metric_name: Optional filter by metric name.
             
         Returns:
-            List[Dict[str, Any]]: List of alert information dictionaries.
+            List[Dict[str, Any]]: List of alert information dictionaries. Each
+                dictionary is a new copy that the caller may modify.
         """
-        result = []
+        return [
+            dict(alert_dict)
+            for alert_dict in self._alert_dicts(include_resolved, level, metric_name)
+        ]
+    
+    def _alert_dicts(
+        self,
+        include_resolved: bool,
+        level: Optional[AlertLevel],
+        metric_name: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Get the cached dictionaries of the alerts matching the filters.
+        
+        Args:
+            include_resolved: Whether to include resolved alerts.
+            level: Optional filter by alert level.
+            metric_name: Optional filter by metric name.
+            
+        Returns:
+            List[Dict[str, Any]]: The alerts' shared ``to_dict()`` results,
+                newest first, which must not be modified.
+        """
+        # Work from snapshots rather than taking every alert lock
+        alerts = list(self._alerts.values())
+        if include_resolved:
+            alerts.extend(self._resolved_alerts)
         
-        with self._alerts_lock:
-            # Add active alerts
-            for alert in self._alerts.values():
-                if (level is None or alert.level == level) and (metric_name is None or alert.metric_name == metric_name):
-                    result.append({
-                        "id": alert.id,
-                        "level": alert.level.value,
-                        "message": alert.message,
-                        "source": alert.source,
-                        "timestamp": alert.timestamp.isoformat(),
-                        "metric_name": alert.metric_name,
-                        "metric_value": alert.metric_value,
-                        "threshold": alert.threshold,
-                        "resolved": alert.resolved,
-                        "resolved_at": alert.resolved_at.isoformat() if alert.resolved_at else None,
-                        "metadata": alert.metadata,
-                    })
-            
-            # Add resolved alerts if requested
-            if include_resolved:
-                for alert in self._resolved_alerts:
-                    if (level is None or alert.level == level) and (metric_name is None or alert.metric_name == metric_name):
-                        result.append({
-                            "id": alert.id,
-                            "level": alert.level.value,
-                            "message": alert.message,
-                            "source": alert.source,
-                            "timestamp": alert.timestamp.isoformat(),
-                            "metric_name": alert.metric_name,
-                            "metric_value": alert.metric_value,
-                            "threshold": alert.threshold,
-                            "resolved": alert.resolved,
-                            "resolved_at": alert.resolved_at.isoformat() if alert.resolved_at else None,
-                            "metadata": alert.metadata,
-                        })
-        
-        # Sort by timestamp (newest first)
-        result.sort(key=lambda x: x["timestamp"], reverse=True)
+        if level is not None or metric_name is not None:
+            alerts = [
+                alert for alert in alerts
+                if (level is None or alert.level == level)
+                and (metric_name is None or alert.metric_name == metric_name)
+            ]
+        
+        # Sort by timestamp (newest first), before formatting the timestamps
+        alerts.sort(key=attrgetter("timestamp"), reverse=True)
+        
+        # Resolved alerts and alerts without a metric are never changed, so
+        # need no lock
+        result = []
+        for alert in alerts:
+            if alert.resolved or alert.metric_name is None:
+                result.append(alert.to_dict())
+            else:
+                with self._get_alert_lock(alert.metric_name):
+                    result.append(alert.to_dict())
         
         return result
     
+    def get_alerts_json(
+        self,
+        include_resolved: bool = False,
+        level: Optional[AlertLevel] = None,
+        metric_name: Optional[str] = None,
+    ) -> bytes:
+        """Get alerts serialized as JSON, for serving over HTTP.
+        
+        The output is cached and reused until an alert changes, so repeated
+        polls with the same filters are not serialized again.
+        
+        Args:
+            include_resolved: Whether to include resolved alerts.
+            level: Optional filter by alert level.
+            metric_name: Optional filter by metric name.
+            
+        Returns:
+            bytes: The UTF-8 encoded JSON form of ``get_alerts()``.
+        """
+        arguments = (include_resolved, level, metric_name)
+        
+        # Read the version before the alerts, so a change made in between
+        # leaves the cached output marked as out of date
+        version = self._alerts_version
+        cached = self._alerts_json_cache
+        if cached is not None and cached[0] == version and cached[1] == arguments:
+            return cached[2]
+        
+        alerts = self._alert_dicts(include_resolved, level, metric_name)
+        if orjson is not None:
+            rendered = orjson.dumps(alerts, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            rendered = json.dumps(alerts, default=str).encode("utf-8")
+        
+        self._alerts_json_cache = (version, arguments, rendered)
+        return rendered
+    
     def generate_diagnostic_report(self) -> Dict[str, Any]:
         """Generate a diagnostic report with system and application metrics.
         
@@ -685,14 +1172,16 @@ class ResourceMonitoringManager(NexusManager):
         
         try:
             # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cached_sample()[0]
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage("/")
             
-            # Get process metrics
-            process = psutil.Process()
-            process_memory = process.memory_info()
-            process_cpu = process.cpu_percent(interval=1)
+            # Get process metrics from a single read of the process's stats
+            process = self._process
+            with process.oneshot():
+                process_memory = process.memory_info()
+                process_cpu = process.cpu_percent(interval=None)
+                process_threads = process.num_threads()
             
             # Create report
             report = {
@@ -718,8 +1207,8 @@ class ResourceMonitoringManager(NexusManager):
                     "pid": process.pid,
                     "cpu_percent": process_cpu,
                     "memory_mb": process_memory.rss / (1024 * 1024),
-                    "uptime_seconds": time.time() - process.create_time(),
-                    "threads": process.num_threads(),
+                    "uptime_seconds": time.monotonic() - self._process_start_monotonic,
+                    "threads": process_threads,
                 },
                 "alerts": {
                     "active": len(self._alerts),
@@ -752,8 +1241,19 @@ class ResourceMonitoringManager(NexusManager):
             for task_id in self._collection_tasks.values():
                 self._thread_manager.cancel_periodic_task(task_id)
             
+            # Publish the samples of a partly filled metrics batch
+            self._flush_metrics_batch()
+            
+            # Publish any alert events still queued, then stop the publisher
+            if self._publish_thread is not None:
+                self._publish_queue.put(None)
+                self._publish_thread.join(timeout=2.0)
+                self._publish_thread = None
+            
             # Unregister from event bus
-            self._event_bus.unsubscribe("monitoring_manager")
+            if self._subscribed_to_events:
+                self._event_bus.unsubscribe("monitoring_manager")
+                self._subscribed_to_events = False
             
             # Unregister config listener
             self._config_manager.unregister_listener("monitoring", self._on_config_changed)
@@ -798,10 +1298,11 @@ class ResourceMonitoringManager(NexusManager):
             
             # Add current system metrics
             try:
+                cpu_percent, memory_percent, disk_percent = self._cached_sample()
                 status["current_metrics"] = {
-                    "cpu_percent": psutil.cpu_percent(interval=None),  # Non-blocking
-                    "memory_percent": psutil.virtual_memory().percent,
-                    "disk_percent": psutil.disk_usage("/").percent,
+                    "cpu_percent": cpu_percent,
+                    "memory_percent": memory_percent,
+                    "disk_percent": disk_percent,
                 }
             except:
                 # Ignore errors getting current metrics
@@ -1,22 +1,111 @@
 from __future__ import annotations
 
+import functools
 import importlib
-import importlib.metadata
-import importlib.util
-import inspect
+import operator
 import os
 import pathlib
-import pkgutil
 import sys
 import time
-from dataclasses import dataclass
+import types
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Type, Union, cast
 
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import ManagerInitializationError, ManagerShutdownError, PluginError
 
 
+# Reads the attributes every plugin class is expected to define
+_required_metadata = operator.attrgetter("name", "version", "description")
+
+
+def _intern_names(names: Iterable[str]) -> List[str]:
+    """Intern plugin names so lookups by name can match on identity.
+    
+    Args:
+        names: The plugin names.
+        
+    Returns:
+        List[str]: A new list of the interned names.
+    """
+    return [sys.intern(name) for name in names]
+
+
+def _source_mtime_ns(module: Any) -> Optional[int]:
+    """Get the modification time of a module's source file.
+    
+    Args:
+        module: The module, or None.
+        
+    Returns:
+        Optional[int]: The mtime in nanoseconds, or None if the module has no
+            readable source file.
+    """
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _eps_for(group: str) -> Tuple[Any, ...]:
+    """Get the installed entry points in a group.
+    
+    Reading entry points scans the metadata of every installed distribution,
+    so the result is cached per group until ``_eps_for.cache_clear()``.
+    
+    Args:
+        group: The entry point group to select.
+        
+    Returns:
+        Tuple[Any, ...]: The entry points in the group.
+    """
+    # Imported here so that importing this module does not load it
+    import importlib.metadata
+    
+    try:
+        return tuple(importlib.metadata.entry_points(group=group))
+    except TypeError:
+        # Python < 3.10 has no selection API and returns a dict of groups
+        return tuple(importlib.metadata.entry_points().get(group, []))
+
+
+def _cached_import(module_name: str, item_name: str) -> Any:
+    """Get an attribute of a module, importing the module only if needed.
+    
+    Args:
+        module_name: The dotted name of the module.
+        item_name: The name of the attribute to get.
+        
+    Returns:
+        Any: The attribute.
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return getattr(modules[module_name], item_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_cache(module_name: str, class_name: str) -> Type:
+    """Get a plugin class, memoized until ``_class_cache.cache_clear()``.
+    
+    Args:
+        module_name: The dotted name of the module defining the class.
+        class_name: The name of the class.
+        
+    Returns:
+        Type: The plugin class.
+    """
+    return _cached_import(module_name, class_name)
+
+
 class PluginState(Enum):
     """Possible states of a plugin."""
     
@@ -28,7 +117,7 @@ class PluginState(Enum):
     DISABLED = "disabled"  # Plugin manually disabled
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """Information about a plugin."""
     
@@ -43,6 +132,15 @@ class PluginInfo:
     error: Optional[str] = None  # Error message if plugin failed to load
     load_time: Optional[float] = None  # When the plugin was loaded
     metadata: Dict[str, Any] = None  # Additional plugin metadata
+    _static_info: Dict[str, Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Info fields that never change, in get_plugin_info key order
+    _loaded_payload: Mapping[str, Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Payload of plugin/loaded events
+    _name_payload: Mapping[str, Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Payload of events that only name the plugin
     
     def __post_init__(self) -> None:
         """Initialize default values for mutable types."""
@@ -51,6 +149,30 @@ class PluginInfo:
         
         if self.metadata is None:
             self.metadata = {}
+        
+        # State fields are placeholders so copies keep the key order
+        self._static_info = {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "author": self.author,
+            "state": None,
+            "dependencies": self.dependencies,
+            "path": self.path,
+            "error": None,
+            "load_time": None,
+            "metadata": self.metadata,
+        }
+        
+        # Event payloads are built once and shared by every publish, as
+        # read-only views so a subscriber cannot change later events
+        self._loaded_payload = types.MappingProxyType({
+            "plugin_name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "author": self.author,
+        })
+        self._name_payload = types.MappingProxyType({"plugin_name": self.name})
 
 
 class PluginManager(NexusManager):
@@ -85,16 +207,42 @@ class PluginManager(NexusManager):
         # Plugin registry
         self._plugins: Dict[str, PluginInfo] = {}
         
+        # Number of registered plugins in each state
+        self._state_counts: Counter[PluginState] = Counter()
+        
+        # Names of active plugins, as an insertion-ordered set
+        self._active: Dict[str, None] = {}
+        
+        # Loaded plugins, keyed by the name of each plugin they depend on
+        self._dependents: Dict[str, Set[str]] = {}
+        
         # Plugin directory path
         self._plugin_dir: Optional[pathlib.Path] = None
         
+        # Whether the plugin directory has been put on sys.path
+        self._sys_path_installed = False
+        
         # Plugin entry points
         self._entry_point_group = "nexus_core.plugins"
         
         # Configuration
         self._auto_load = True  # Automatically load discovered plugins
+        self._lazy = False  # Defer loading until a plugin instance is requested
         self._enabled_plugins: List[str] = []  # List of explicitly enabled plugins
         self._disabled_plugins: List[str] = []  # List of explicitly disabled plugins
+        
+        # Set views of the lists above for membership checks
+        self._enabled_set: FrozenSet[str] = frozenset()
+        self._disabled_set: FrozenSet[str] = frozenset()
+        
+        # Handlers for changes to the plugin configuration, by key
+        self._config_handlers: Dict[str, Callable[[Any], None]] = {
+            "plugins.autoload": self._apply_autoload,
+            "plugins.enabled": self._apply_enabled,
+            "plugins.disabled": self._apply_disabled,
+            "plugins.lazy": self._apply_lazy,
+            "plugins.directory": self._warn_directory_change,
+        }
     
     def initialize(self) -> None:
         """Initialize the Plugin Manager.
@@ -110,36 +258,26 @@ class PluginManager(NexusManager):
             
             plugin_dir = plugin_config.get("directory", "plugins")
             self._plugin_dir = pathlib.Path(plugin_dir)
+            self._sys_path_installed = False
             self._auto_load = plugin_config.get("autoload", True)
-            self._enabled_plugins = plugin_config.get("enabled", [])
-            self._disabled_plugins = plugin_config.get("disabled", [])
+            self._lazy = plugin_config.get("lazy", False)
+            self._enabled_plugins = _intern_names(plugin_config.get("enabled", []))
+            self._disabled_plugins = _intern_names(plugin_config.get("disabled", []))
+            self._enabled_set = frozenset(self._enabled_plugins)
+            self._disabled_set = frozenset(self._disabled_plugins)
             
             # Create plugin directory if it doesn't exist
             os.makedirs(self._plugin_dir, exist_ok=True)
             
             # Subscribe to plugin-related events
-            self._event_bus.subscribe(
-                event_type="plugin/install",
-                callback=self._on_plugin_install_event,
-                subscriber_id="plugin_manager"
-            )
-            
-            self._event_bus.subscribe(
-                event_type="plugin/uninstall",
-                callback=self._on_plugin_uninstall_event,
-                subscriber_id="plugin_manager"
-            )
-            
-            self._event_bus.subscribe(
-                event_type="plugin/enable",
-                callback=self._on_plugin_enable_event,
-                subscriber_id="plugin_manager"
-            )
-            
-            self._event_bus.subscribe(
-                event_type="plugin/disable",
-                callback=self._on_plugin_disable_event,
-                subscriber_id="plugin_manager"
+            self._event_bus.subscribe_many(
+                [
+                    ("plugin/install", self._on_plugin_install_event),
+                    ("plugin/uninstall", self._on_plugin_uninstall_event),
+                    ("plugin/enable", self._on_plugin_enable_event),
+                    ("plugin/disable", self._on_plugin_disable_event),
+                ],
+                subscriber_id="plugin_manager",
             )
             
             # Discover plugins from entry points
@@ -151,8 +289,8 @@ class PluginManager(NexusManager):
             # Register for config changes
             self._config_manager.register_listener("plugins", self._on_config_changed)
             
-            # Load enabled plugins
-            if self._auto_load:
+            # Load enabled plugins, unless they are loaded on first use
+            if self._auto_load and not self._lazy:
                 self._load_enabled_plugins()
             
             self._logger.info(
@@ -182,7 +320,7 @@ class PluginManager(NexusManager):
         """
         try:
             # Get entry points for plugins
-            entry_points = importlib.metadata.entry_points().get(self._entry_point_group, [])
+            entry_points = _eps_for(self._entry_point_group)
             
             for entry_point in entry_points:
                 try:
@@ -197,7 +335,7 @@ class PluginManager(NexusManager):
                     )
                     
                     # Add to registry
-                    self._plugins[plugin_info.name] = plugin_info
+                    self._register_plugin(plugin_info)
                     
                     self._logger.debug(
                         f"Discovered plugin '{plugin_info.name}' from entry point",
@@ -213,6 +351,13 @@ class PluginManager(NexusManager):
         except Exception as e:
             self._logger.error(f"Failed to discover entry point plugins: {str(e)}")
     
+    def invalidate_entry_point_cache(self) -> None:
+        """Forget cached entry points so the next discovery rereads package metadata.
+        
+        Call this after installing or removing plugin packages at runtime.
+        """
+        _eps_for.cache_clear()
+    
     def _discover_directory_plugins(self) -> None:
         """Discover plugins from the plugin directory.
         
@@ -223,41 +368,47 @@ class PluginManager(NexusManager):
             return
         
         # Add plugin directory to Python path if not already there
-        plugin_dir_str = str(self._plugin_dir.absolute())
-        if plugin_dir_str not in sys.path:
-            sys.path.insert(0, plugin_dir_str)
+        if not self._sys_path_installed:
+            plugin_dir_str = str(self._plugin_dir.absolute())
+            if plugin_dir_str not in sys.path:
+                sys.path.insert(0, plugin_dir_str)
+            self._sys_path_installed = True
         
         try:
             # Iterate through directories in the plugin directory
-            for item in self._plugin_dir.iterdir():
-                if not item.is_dir():
-                    continue
-                
-                # Check if this is a potential plugin package
-                init_file = item / "__init__.py"
-                plugin_file = item / "plugin.py"
-                
-                if init_file.exists() or plugin_file.exists():
+            with os.scandir(self._plugin_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    
+                    # Check if this is a potential plugin package
+                    plugin_file = os.path.join(entry.path, "plugin.py")
+                    has_init = os.path.isfile(os.path.join(entry.path, "__init__.py"))
+                    has_plugin = not has_init and os.path.isfile(plugin_file)
+                    
+                    if not (has_init or has_plugin):
+                        continue
+                    
                     try:
                         # Try to import the plugin module
-                        module_name = item.name
+                        module_name = entry.name
                         
-                        if init_file.exists():
+                        if has_init:
                             # Import as a package
                             module = importlib.import_module(module_name)
-                        elif plugin_file.exists():
+                        else:
                             # Import the plugin.py file
-                            spec = importlib.util.spec_from_file_location(
+                            from importlib.util import module_from_spec, spec_from_file_location
+                            
+                            spec = spec_from_file_location(
                                 f"{module_name}.plugin", 
                                 plugin_file
                             )
                             if not spec or not spec.loader:
                                 continue
                             
-                            module = importlib.util.module_from_spec(spec)
+                            module = module_from_spec(spec)
                             spec.loader.exec_module(module)
-                        else:
-                            continue
                         
                         # Look for a plugin class in the module
                         plugin_class = self._find_plugin_class(module)
@@ -272,26 +423,26 @@ class PluginManager(NexusManager):
                         plugin_info = self._extract_plugin_metadata(
                             plugin_class, 
                             module_name,
-                            path=str(item),
+                            path=entry.path,
                         )
                         
                         # Add to registry if not already discovered from entry point
                         if plugin_info.name not in self._plugins:
-                            self._plugins[plugin_info.name] = plugin_info
+                            self._register_plugin(plugin_info)
                             
                             self._logger.debug(
                                 f"Discovered plugin '{plugin_info.name}' from directory",
                                 extra={
                                     "plugin": plugin_info.name, 
                                     "version": plugin_info.version,
-                                    "path": str(item),
+                                    "path": entry.path,
                                 },
                             )
                     
                     except Exception as e:
                         self._logger.error(
-                            f"Failed to discover plugin from directory '{item.name}': {str(e)}",
-                            extra={"directory": str(item)},
+                            f"Failed to discover plugin from directory '{entry.name}': {str(e)}",
+                            extra={"directory": entry.path},
                         )
         
         except Exception as e:
@@ -308,11 +459,12 @@ class PluginManager(NexusManager):
         Returns:
             Optional[Type]: The plugin class if found, None otherwise.
         """
-        # Look for classes in the module
-        for _, obj in inspect.getmembers(module, inspect.isclass):
+        # Look for classes in the module, in definition order
+        for obj in vars(module).values():
             # Check if the class has the required attributes
             if (
-                hasattr(obj, "name") 
+                isinstance(obj, type)
+                and hasattr(obj, "name") 
                 and hasattr(obj, "version") 
                 and hasattr(obj, "description")
             ):
@@ -339,11 +491,22 @@ class PluginManager(NexusManager):
             PluginInfo: Metadata about the plugin.
         """
         # Get metadata from the class
-        name = getattr(plugin_class, "name", default_name)
-        version = getattr(plugin_class, "version", "0.1.0")
-        description = getattr(plugin_class, "description", "No description")
+        try:
+            name, version, description = _required_metadata(plugin_class)
+        except AttributeError:
+            # Entry point plugins are not checked for the attributes up front
+            name = getattr(plugin_class, "name", default_name)
+            version = getattr(plugin_class, "version", "0.1.0")
+            description = getattr(plugin_class, "description", "No description")
         author = getattr(plugin_class, "author", "Unknown")
-        dependencies = getattr(plugin_class, "dependencies", [])
+        dependencies = _intern_names(getattr(plugin_class, "dependencies", []))
+        
+        # Names are dict keys throughout the manager, so intern them once here
+        name = sys.intern(name)
+        
+        # Remember the source version, so reloads can tell if it has changed
+        module_name = plugin_class.__module__
+        source_mtime_ns = _source_mtime_ns(sys.modules.get(module_name.split(".")[0]))
         
         # Create plugin info
         plugin_info = PluginInfo(
@@ -356,27 +519,97 @@ class PluginManager(NexusManager):
             path=path,
             metadata={
                 "class": plugin_class.__name__,
-                "module": plugin_class.__module__,
+                "module": module_name,
                 "entry_point": entry_point_name,
+                "source_mtime_ns": source_mtime_ns,
             },
         )
         
         return plugin_info
     
+    def _register_plugin(self, plugin_info: PluginInfo) -> None:
+        """Add a plugin to the registry, replacing any plugin of the same name.
+        
+        Args:
+            plugin_info: The plugin to register.
+        """
+        previous = self._plugins.get(plugin_info.name)
+        if previous is not None:
+            self._state_counts[previous.state] -= 1
+            self._active.pop(plugin_info.name, None)
+        
+        self._plugins[plugin_info.name] = plugin_info
+        self._state_counts[plugin_info.state] += 1
+        if plugin_info.state == PluginState.ACTIVE:
+            self._active[plugin_info.name] = None
+    
+    def _set_state(self, plugin_info: PluginInfo, state: PluginState) -> None:
+        """Change a plugin's state, keeping the per-state counts current.
+        
+        Args:
+            plugin_info: The plugin to update.
+            state: The plugin's new state.
+        """
+        self._state_counts[plugin_info.state] -= 1
+        self._state_counts[state] += 1
+        
+        if state == PluginState.ACTIVE:
+            self._active[plugin_info.name] = None
+        elif plugin_info.state == PluginState.ACTIVE:
+            self._active.pop(plugin_info.name, None)
+        
+        plugin_info.state = state
+    
     def _load_enabled_plugins(self) -> None:
         """Load all enabled plugins.
         
         This loads plugins that are enabled by default or explicitly enabled in config.
         """
-        # First, load plugins with no dependencies
-        for plugin_name, plugin_info in self._plugins.items():
-            if not plugin_info.dependencies and self._is_plugin_enabled(plugin_name):
-                self.load_plugin(plugin_name)
+        # Dependencies come first, so each plugin finds them already loaded
+        enabled = [name for name in self._plugins if self._is_plugin_enabled(name)]
+        for plugin_name in self._topo_order(enabled):
+            self.load_plugin(plugin_name)
+    
+    def _topo_order(self, names: Iterable[str]) -> List[str]:
+        """Order plugins so that each one follows the plugins it depends on.
         
-        # Then, load plugins with dependencies
-        for plugin_name, plugin_info in self._plugins.items():
-            if plugin_info.dependencies and self._is_plugin_enabled(plugin_name):
-                self.load_plugin(plugin_name)
+        Uses Kahn's algorithm over the dependency edges between the given
+        plugins; dependencies outside ``names`` are ignored. Plugins caught in
+        a dependency cycle are appended at the end in their original order.
+        
+        Args:
+            names: The names of the plugins to order.
+            
+        Returns:
+            List[str]: The plugin names in dependency order.
+        """
+        selected = dict.fromkeys(names)
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in selected}
+        
+        for name in selected:
+            dependencies = {
+                dependency for dependency in self._plugins[name].dependencies
+                if dependency in selected
+            }
+            in_degree[name] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        
+        ready = deque(name for name in selected if not in_degree[name])
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    ready.append(dependent)
+        
+        if len(order) < len(selected):
+            order.extend(name for name in selected if in_degree[name])
+        
+        return order
     
     def _is_plugin_enabled(self, plugin_name: str) -> bool:
         """Check if a plugin is enabled.
@@ -390,13 +623,9 @@ class PluginManager(NexusManager):
         Returns:
             bool: True if the plugin is enabled, False otherwise.
         """
-        if plugin_name in self._disabled_plugins:
-            return False
-        
-        if plugin_name in self._enabled_plugins:
-            return True
-        
-        return self._auto_load
+        return plugin_name not in self._disabled_set and (
+            plugin_name in self._enabled_set or self._auto_load
+        )
     
     def load_plugin(self, plugin_name: str) -> bool:
         """Load and initialize a plugin.
@@ -434,22 +663,28 @@ class PluginManager(NexusManager):
             return True
         
         # Check if plugin is explicitly disabled
-        if plugin_name in self._disabled_plugins:
+        if plugin_name in self._disabled_set:
             self._logger.warning(
                 f"Plugin '{plugin_name}' is disabled and cannot be loaded",
                 extra={"plugin": plugin_name},
             )
             return False
         
-        # Check dependencies
+        # Check dependencies; in a bulk load they are already loaded
         for dependency in plugin_info.dependencies:
+            dependency_info = self._plugins.get(dependency)
+            if dependency_info is not None and dependency_info.state in (
+                PluginState.LOADED, PluginState.ACTIVE
+            ):
+                continue
+            
             # Skip if dependency is "core" (assumed to be the core application)
             if dependency == "core":
                 continue
                 
             # Check if dependency exists
-            if dependency not in self._plugins:
-                plugin_info.state = PluginState.FAILED
+            if dependency_info is None:
+                self._set_state(plugin_info, PluginState.FAILED)
                 plugin_info.error = f"Dependency '{dependency}' not found"
                 self._logger.error(
                     f"Failed to load plugin '{plugin_name}': Dependency '{dependency}' not found",
@@ -457,18 +692,15 @@ class PluginManager(NexusManager):
                 )
                 return False
             
-            # Check if dependency is loaded
-            dependency_info = self._plugins[dependency]
-            if dependency_info.state not in (PluginState.LOADED, PluginState.ACTIVE):
-                # Try to load the dependency
-                if not self.load_plugin(dependency):
-                    plugin_info.state = PluginState.FAILED
-                    plugin_info.error = f"Failed to load dependency '{dependency}'"
-                    self._logger.error(
-                        f"Failed to load plugin '{plugin_name}': Dependency '{dependency}' could not be loaded",
-                        extra={"plugin": plugin_name, "dependency": dependency},
-                    )
-                    return False
+            # Try to load the dependency, for plugins loaded individually
+            if not self.load_plugin(dependency):
+                self._set_state(plugin_info, PluginState.FAILED)
+                plugin_info.error = f"Failed to load dependency '{dependency}'"
+                self._logger.error(
+                    f"Failed to load plugin '{plugin_name}': Dependency '{dependency}' could not be loaded",
+                    extra={"plugin": plugin_name, "dependency": dependency},
+                )
+                return False
         
         try:
             # Create an instance of the plugin class
@@ -484,8 +716,11 @@ class PluginManager(NexusManager):
                 )
             
             # Update plugin state
-            plugin_info.state = PluginState.ACTIVE
+            self._set_state(plugin_info, PluginState.ACTIVE)
             plugin_info.load_time = time.time()
+            for dependency in plugin_info.dependencies:
+                if dependency != plugin_name:
+                    self._dependents.setdefault(dependency, set()).add(plugin_name)
             
             self._logger.info(
                 f"Loaded plugin '{plugin_name}' v{plugin_info.version}",
@@ -496,18 +731,13 @@ class PluginManager(NexusManager):
             self._event_bus.publish(
                 event_type="plugin/loaded",
                 source="plugin_manager",
-                payload={
-                    "plugin_name": plugin_name,
-                    "version": plugin_info.version,
-                    "description": plugin_info.description,
-                    "author": plugin_info.author,
-                },
+                payload=plugin_info._loaded_payload,
             )
             
             return True
         
         except Exception as e:
-            plugin_info.state = PluginState.FAILED
+            self._set_state(plugin_info, PluginState.FAILED)
             plugin_info.error = str(e)
             
             self._logger.error(
@@ -565,18 +795,15 @@ class PluginManager(NexusManager):
             )
             return True
         
-        # Check if other plugins depend on this one
-        for other_name, other_info in self._plugins.items():
-            if (
-                other_name != plugin_name 
-                and plugin_name in other_info.dependencies
-                and other_info.state in (PluginState.LOADED, PluginState.ACTIVE)
-            ):
-                self._logger.warning(
-                    f"Cannot unload plugin '{plugin_name}': Plugin '{other_name}' depends on it",
-                    extra={"plugin": plugin_name, "dependent": other_name},
-                )
-                return False
+        # Check if other loaded plugins depend on this one
+        dependents = self._dependents.get(plugin_name)
+        if dependents:
+            other_name = min(dependents)
+            self._logger.warning(
+                f"Cannot unload plugin '{plugin_name}': Plugin '{other_name}' depends on it",
+                extra={"plugin": plugin_name, "dependent": other_name},
+            )
+            return False
         
         try:
             # Call the plugin's shutdown method if available
@@ -584,8 +811,10 @@ class PluginManager(NexusManager):
                 plugin_info.instance.shutdown()
             
             # Update plugin state
-            plugin_info.state = PluginState.INACTIVE
+            self._set_state(plugin_info, PluginState.INACTIVE)
             plugin_info.instance = None
+            for dependency in plugin_info.dependencies:
+                self._dependents.get(dependency, set()).discard(plugin_name)
             
             self._logger.info(
                 f"Unloaded plugin '{plugin_name}'",
@@ -596,7 +825,7 @@ class PluginManager(NexusManager):
             self._event_bus.publish(
                 event_type="plugin/unloaded",
                 source="plugin_manager",
-                payload={"plugin_name": plugin_name},
+                payload=plugin_info._name_payload,
             )
             
             return True
@@ -656,9 +885,17 @@ class PluginManager(NexusManager):
                 else:
                     base_module_name = module_name
                 
-                # Reload the module
-                if base_module_name in sys.modules:
-                    importlib.reload(sys.modules[base_module_name])
+                # Reload the module, unless its source is unchanged since it was read
+                base_module = sys.modules.get(base_module_name)
+                if base_module is not None:
+                    source_mtime_ns = _source_mtime_ns(base_module)
+                    if (
+                        source_mtime_ns is None
+                        or source_mtime_ns != plugin_info.metadata.get("source_mtime_ns")
+                    ):
+                        importlib.reload(base_module)
+                        _class_cache.cache_clear()
+                        plugin_info.metadata["source_mtime_ns"] = source_mtime_ns
             
             # Load the plugin again
             return self.load_plugin(plugin_name)
@@ -710,12 +947,14 @@ class PluginManager(NexusManager):
             )
         
         # Remove from disabled list if present
-        if plugin_name in self._disabled_plugins:
+        if plugin_name in self._disabled_set:
             self._disabled_plugins.remove(plugin_name)
+            self._disabled_set = frozenset(self._disabled_plugins)
         
         # Add to enabled list if not already there
-        if plugin_name not in self._enabled_plugins:
+        if plugin_name not in self._enabled_set:
             self._enabled_plugins.append(plugin_name)
+            self._enabled_set = frozenset(self._enabled_plugins)
         
         # Update configuration
         self._config_manager.set("plugins.enabled", self._enabled_plugins)
@@ -730,7 +969,7 @@ class PluginManager(NexusManager):
         self._event_bus.publish(
             event_type="plugin/enabled",
             source="plugin_manager",
-            payload={"plugin_name": plugin_name},
+            payload=self._plugins[plugin_name]._name_payload,
         )
         
         return True
@@ -770,15 +1009,17 @@ class PluginManager(NexusManager):
                 )
         
         # Remove from enabled list if present
-        if plugin_name in self._enabled_plugins:
+        if plugin_name in self._enabled_set:
             self._enabled_plugins.remove(plugin_name)
+            self._enabled_set = frozenset(self._enabled_plugins)
         
         # Add to disabled list if not already there
-        if plugin_name not in self._disabled_plugins:
+        if plugin_name not in self._disabled_set:
             self._disabled_plugins.append(plugin_name)
+            self._disabled_set = frozenset(self._disabled_plugins)
         
         # Update plugin state
-        plugin_info.state = PluginState.DISABLED
+        self._set_state(plugin_info, PluginState.DISABLED)
         
         # Update configuration
         self._config_manager.set("plugins.enabled", self._enabled_plugins)
@@ -793,7 +1034,7 @@ class PluginManager(NexusManager):
         self._event_bus.publish(
             event_type="plugin/disabled",
             source="plugin_manager",
-            payload={"plugin_name": plugin_name},
+            payload=plugin_info._name_payload,
         )
         
         return True
@@ -812,20 +1053,12 @@ class PluginManager(NexusManager):
         
         plugin_info = self._plugins[plugin_name]
         
-        # Convert to a dictionary
-        result = {
-            "name": plugin_info.name,
-            "version": plugin_info.version,
-            "description": plugin_info.description,
-            "author": plugin_info.author,
-            "state": plugin_info.state.value,
-            "dependencies": plugin_info.dependencies,
-            "path": plugin_info.path,
-            "error": plugin_info.error,
-            "load_time": plugin_info.load_time,
-            "metadata": plugin_info.metadata,
-            "enabled": self._is_plugin_enabled(plugin_name),
-        }
+        # Layer the changing fields over a copy of the static ones
+        result = plugin_info._static_info.copy()
+        result["state"] = plugin_info.state.value
+        result["error"] = plugin_info.error
+        result["load_time"] = plugin_info.load_time
+        result["enabled"] = self._is_plugin_enabled(plugin_name)
         
         return result
     
@@ -851,11 +1084,44 @@ class PluginManager(NexusManager):
         if not self._initialized:
             return []
         
-        return [
-            self.get_plugin_info(plugin_name)
-            for plugin_name, plugin_info in self._plugins.items()
-            if plugin_info.state == PluginState.ACTIVE
-        ]
+        return [self.get_plugin_info(plugin_name) for plugin_name in self._active]
+    
+    def get_plugin_instance(self, plugin_name: str) -> Optional[Any]:
+        """Get a plugin's instance, loading the plugin first if necessary.
+        
+        This is how plugins are loaded when ``plugins.lazy`` is enabled.
+        Plugins that are disabled or failed to load are not retried.
+        
+        Args:
+            plugin_name: The name of the plugin.
+            
+        Returns:
+            Optional[Any]: The plugin instance, or None if it could not be loaded.
+            
+        Raises:
+            PluginError: If the plugin is not found or fails to load.
+        """
+        if not self._initialized:
+            raise PluginError(
+                "Plugin Manager not initialized",
+                plugin_name=plugin_name,
+            )
+        
+        plugin_info = self._plugins.get(plugin_name)
+        if plugin_info is None:
+            raise PluginError(
+                f"Plugin '{plugin_name}' not found",
+                plugin_name=plugin_name,
+            )
+        
+        if (
+            plugin_info.instance is None
+            and plugin_info.state not in (PluginState.FAILED, PluginState.DISABLED)
+            and self._is_plugin_enabled(plugin_name)
+        ):
+            self.load_plugin(plugin_name)
+        
+        return plugin_info.instance
     
     def _get_plugin_class(self, plugin_info: PluginInfo) -> Type:
         """Get the plugin class from a plugin info object.
@@ -880,13 +1146,7 @@ class PluginManager(NexusManager):
             )
         
         try:
-            # Import the module
-            module = importlib.import_module(module_name)
-            
-            # Get the class from the module
-            plugin_class = getattr(module, class_name)
-            
-            return plugin_class
+            return _class_cache(module_name, class_name)
         
         except Exception as e:
             raise PluginError(
@@ -1015,32 +1275,70 @@ class PluginManager(NexusManager):
             key: The configuration key that changed.
             value: The new value.
         """
-        if key == "plugins.autoload":
-            self._auto_load = value
-            self._logger.info(
-                f"Plugin autoload set to {value}",
-                extra={"autoload": value},
-            )
+        handler = self._config_handlers.get(key)
+        if handler is not None:
+            handler(value)
+    
+    def _apply_autoload(self, value: Any) -> None:
+        """Apply a change to ``plugins.autoload``.
         
-        elif key == "plugins.enabled":
-            self._enabled_plugins = value
-            self._logger.info(
-                f"Updated enabled plugins list: {value}",
-                extra={"enabled": value},
-            )
+        Args:
+            value: The new value.
+        """
+        self._auto_load = value
+        self._logger.info(
+            f"Plugin autoload set to {value}",
+            extra={"autoload": value},
+        )
+    
+    def _apply_enabled(self, value: Any) -> None:
+        """Apply a change to ``plugins.enabled``.
         
-        elif key == "plugins.disabled":
-            self._disabled_plugins = value
-            self._logger.info(
-                f"Updated disabled plugins list: {value}",
-                extra={"disabled": value},
-            )
+        Args:
+            value: The new list of enabled plugins.
+        """
+        self._enabled_plugins = _intern_names(value)
+        self._enabled_set = frozenset(self._enabled_plugins)
+        self._logger.info(
+            f"Updated enabled plugins list: {value}",
+            extra={"enabled": value},
+        )
+    
+    def _apply_disabled(self, value: Any) -> None:
+        """Apply a change to ``plugins.disabled``.
         
-        elif key == "plugins.directory":
-            self._logger.warning(
-                "Changing plugin directory requires restart to take effect",
-                extra={"directory": value},
-            )
+        Args:
+            value: The new list of disabled plugins.
+        """
+        self._disabled_plugins = _intern_names(value)
+        self._disabled_set = frozenset(self._disabled_plugins)
+        self._logger.info(
+            f"Updated disabled plugins list: {value}",
+            extra={"disabled": value},
+        )
+    
+    def _apply_lazy(self, value: Any) -> None:
+        """Apply a change to ``plugins.lazy``.
+        
+        Args:
+            value: The new value.
+        """
+        self._lazy = value
+        self._logger.info(
+            f"Plugin lazy loading set to {value}",
+            extra={"lazy": value},
+        )
+    
+    def _warn_directory_change(self, value: Any) -> None:
+        """Warn that a change to ``plugins.directory`` needs a restart.
+        
+        Args:
+            value: The new plugin directory.
+        """
+        self._logger.warning(
+            "Changing plugin directory requires restart to take effect",
+            extra={"directory": value},
+        )
     
     def shutdown(self) -> None:
         """Shut down the Plugin Manager.
@@ -1062,25 +1360,8 @@ class PluginManager(NexusManager):
                 if info.state in (PluginState.LOADED, PluginState.ACTIVE)
             ]
             
-            # Sort by dependencies (plugins with no dependencies first)
-            # This is a simplified approach, not a full topological sort
-            sorted_plugins = []
-            remaining_plugins = active_plugins.copy()
-            
-            # First, add plugins that no other plugins depend on
-            for plugin_name in active_plugins:
-                if not any(plugin_name in self._plugins[other].dependencies for other in active_plugins if other != plugin_name):
-                    sorted_plugins.append(plugin_name)
-                    remaining_plugins.remove(plugin_name)
-            
-            # Then add the rest in any order
-            sorted_plugins.extend(remaining_plugins)
-            
-            # Reverse the list so plugins with dependencies are unloaded first
-            sorted_plugins.reverse()
-            
-            # Unload each plugin
-            for plugin_name in sorted_plugins:
+            # Reverse the load order so dependents are unloaded before their dependencies
+            for plugin_name in reversed(self._topo_order(active_plugins)):
                 try:
                     self.unload_plugin(plugin_name)
                 except Exception as e:
@@ -1117,21 +1398,18 @@ class PluginManager(NexusManager):
         status = super().status()
         
         if self._initialized:
-            # Count plugins by state
-            plugin_counts = {state.value: 0 for state in PluginState}
-            for plugin_info in self._plugins.values():
-                plugin_counts[plugin_info.state.value] += 1
-            
+            plugin_counts = self._state_counts
             status.update({
                 "plugins": {
                     "total": len(self._plugins),
-                    "active": plugin_counts[PluginState.ACTIVE.value],
-                    "loaded": plugin_counts[PluginState.LOADED.value],
-                    "failed": plugin_counts[PluginState.FAILED.value],
-                    "disabled": plugin_counts[PluginState.DISABLED.value],
+                    "active": plugin_counts[PluginState.ACTIVE],
+                    "loaded": plugin_counts[PluginState.LOADED],
+                    "failed": plugin_counts[PluginState.FAILED],
+                    "disabled": plugin_counts[PluginState.DISABLED],
                 },
                 "config": {
                     "auto_load": self._auto_load,
+                    "lazy": self._lazy,
                     "plugin_dir": str(self._plugin_dir) if self._plugin_dir else None,
                     "enabled_count": len(self._enabled_plugins),
                     "disabled_count": len(self._disabled_plugins),
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import concurrent.futures
+import functools
 import importlib
+import itertools
 import json
 import threading
 import time
@@ -11,11 +14,58 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from nexus_core.core.base import NexusManager
 from nexus_core.utils.exceptions import ManagerInitializationError, ManagerShutdownError
 
+# Number of request counter stripes per service; a power of two so an index can be masked
+_METRIC_STRIPES = 16
+
+# Maximum number of threads checking sync services' health at once
+_HEALTH_CHECK_WORKERS = 8
+
+# Service methods for the HTTP methods that have a shortcut
+_METHOD_DISPATCH = {
+    "GET": "get",
+    "POST": "post",
+    "PUT": "put",
+    "DELETE": "delete",
+    "PATCH": "patch",
+}
+
+# Stripe indexes handed out to threads the first time they record a request
+_stripe_ids = itertools.count()
+_thread_stripe = threading.local()
+
+
+def _stripe_index() -> int:
+    """Get the calling thread's counter stripe.
+    
+    Threads are assigned stripes round-robin, so up to _METRIC_STRIPES
+    threads can record requests without sharing a lock.
+    
+    Returns:
+        int: The stripe index for the current thread.
+    """
+    index = getattr(_thread_stripe, "index", None)
+    if index is None:
+        index = _thread_stripe.index = next(_stripe_ids) & (_METRIC_STRIPES - 1)
+    return index
+
+
+def _response_body(response: httpx.Response) -> Any:
+    """Get the body of a response, decoded as JSON if its content type says so.
+    
+    Args:
+        response: The response to read.
+        
+    Returns:
+        Any: The decoded JSON body, or the body text for other content types.
+    """
+    if "json" in response.headers.get("content-type", ""):
+        return response.json()
+    return response.text
+
 
 class ServiceProtocol(Enum):
     """Supported service protocols."""
@@ -30,6 +80,9 @@ class ServiceProtocol(Enum):
 class RemoteService:
     """Base class for remote services."""
     
+    # Seconds a health check result is reused by cached checks
+    HEALTH_CACHE_TTL = 5.0
+    
     def __init__(
         self,
         name: str,
@@ -43,6 +96,9 @@ class RemoteService:
         auth: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
         logger: Any = None,
+        pool_max_connections: int = 100,
+        pool_max_keepalive: int = 100,
+        keepalive_expiry: float = 30.0,
     ) -> None:
         """Initialize a remote service.
         
@@ -58,6 +114,9 @@ class RemoteService:
             auth: Authentication configuration.
             config: Additional service-specific configuration.
             logger: Logger instance for the service.
+            pool_max_connections: Maximum number of concurrent connections.
+            pool_max_keepalive: Maximum number of idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept open.
         """
         self.name = name
         self.protocol = protocol
@@ -71,6 +130,11 @@ class RemoteService:
         self.config = config or {}
         self._logger = logger
         
+        # Connection pool limits
+        self.pool_max_connections = pool_max_connections
+        self.pool_max_keepalive = pool_max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        
         # Client instance (initialized on demand)
         self._client = None
         
@@ -78,11 +142,19 @@ class RemoteService:
         self._healthy = False
         self._last_check_time = 0
         self._avg_response_time = 0
-        self._request_count = 0
-        self._error_count = 0
         
-        # Service lock
-        self._lock = threading.RLock()
+        # Last health check result, reused by cached checks while fresh
+        self.health_cache_ttl = self.HEALTH_CACHE_TTL
+        self._last_health_result: Optional[bool] = None
+        self._last_health_ts = 0.0
+        
+        # Request and error counts, striped by thread and summed on read
+        self._stripe_locks = tuple(threading.Lock() for _ in range(_METRIC_STRIPES))
+        self._stripe_requests = [0] * _METRIC_STRIPES
+        self._stripe_errors = [0] * _METRIC_STRIPES
+        
+        # Guards the read-modify-write of the response time average
+        self._response_time_lock = threading.Lock()
     
     def get_client(self) -> Any:
         """Get the client instance for this service.
@@ -99,33 +171,88 @@ class RemoteService:
         """Initialize the client instance for this service."""
         pass  # Implemented by subclasses
     
-    def check_health(self) -> bool:
+    def _pool_limits(self) -> httpx.Limits:
+        """Get the connection pool limits for an HTTP client.
+        
+        Returns:
+            httpx.Limits: The limits built from the service's pool settings.
+        """
+        return httpx.Limits(
+            max_connections=self.pool_max_connections,
+            max_keepalive_connections=self.pool_max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+    
+    def _retry_backoff(self, attempt: int) -> Optional[float]:
+        """Get how long to wait before retrying a failed request.
+        
+        Args:
+            attempt: The zero-based index of the attempt that failed.
+            
+        Returns:
+            Optional[float]: The delay in seconds, or None if no attempts remain.
+        """
+        if attempt + 1 >= self.max_retries:
+            return None
+        return min(self.retry_max_delay, self.retry_delay * 2 ** attempt)
+    
+    def check_health(self, use_cache: bool = True) -> bool:
         """Check if the service is healthy.
         
+        Args:
+            use_cache: Whether a result from the last health_cache_ttl seconds
+                may be returned instead of checking again.
+            
         Returns:
             bool: True if the service is healthy, False otherwise.
         """
         # Default implementation just returns current health status
         return self._healthy
     
+    def _cached_health(self) -> Optional[bool]:
+        """Get the last health check result if it is still fresh.
+        
+        Returns:
+            Optional[bool]: The cached result, or None if it has expired.
+        """
+        if time.time() - self._last_health_ts < self.health_cache_ttl:
+            return self._last_health_result
+        return None
+    
+    def _record_health(self, healthy: bool) -> bool:
+        """Record the result of a health check.
+        
+        Args:
+            healthy: Whether the service passed the check.
+            
+        Returns:
+            bool: The recorded result.
+        """
+        self._healthy = healthy
+        self._last_health_result = healthy
+        self._last_health_ts = time.time()
+        return healthy
+    
     def status(self) -> Dict[str, Any]:
         """Get the status of the service.
         
         Returns:
             Dict[str, Any]: Status information.
         """
-        with self._lock:
-            return {
-                "name": self.name,
-                "protocol": self.protocol.value,
-                "base_url": self.base_url,
-                "healthy": self._healthy,
-                "avg_response_time": self._avg_response_time,
-                "request_count": self._request_count,
-                "error_count": self._error_count,
-                "error_rate": self._error_count / self._request_count if self._request_count > 0 else 0,
-                "last_check_time": self._last_check_time,
-            }
+        request_count = sum(self._stripe_requests)
+        error_count = sum(self._stripe_errors)
+        
+        return {
+            "name": self.name,
+            "protocol": self.protocol.value,
+            "base_url": self.base_url,
+            "healthy": self._healthy,
+            "avg_response_time": self._avg_response_time,
+            "request_count": request_count,
+            "error_count": error_count,
+            "error_rate": error_count / request_count if request_count > 0 else 0,
+            "last_check_time": self._last_check_time,
+        }
     
     def _update_metrics(
         self, 
@@ -138,14 +265,16 @@ class RemoteService:
             response_time: Response time in seconds.
             success: Whether the request was successful.
         """
-        with self._lock:
-            self._request_count += 1
+        index = _stripe_index()
+        with self._stripe_locks[index]:
+            self._stripe_requests[index] += 1
             
             if not success:
-                self._error_count += 1
-            
-            if response_time is not None:
-                # Update average response time
+                self._stripe_errors[index] += 1
+        
+        if response_time is not None:
+            # Update average response time
+            with self._response_time_lock:
                 if self._avg_response_time == 0:
                     self._avg_response_time = response_time
                 else:
@@ -153,9 +282,9 @@ class RemoteService:
                     self._avg_response_time = (
                         0.7 * self._avg_response_time + 0.3 * response_time
                     )
-            
-            # Update last check time
-            self._last_check_time = time.time()
+        
+        # Update last check time
+        self._last_check_time = time.time()
 
 
 class HTTPService(RemoteService):
@@ -193,6 +322,7 @@ class HTTPService(RemoteService):
             follow_redirects=self.follow_redirects,
             verify=self.verify_ssl,
             headers=self.headers,
+            limits=self._pool_limits(),
         )
         
         # Set up authentication if provided
@@ -210,12 +340,21 @@ class HTTPService(RemoteService):
                 token = self.auth.get("token", "")
                 self._client.headers["Authorization"] = f"Bearer {token}"
     
-    def check_health(self) -> bool:
+    def check_health(self, use_cache: bool = True) -> bool:
         """Check if the service is healthy.
         
+        Args:
+            use_cache: Whether a result from the last health_cache_ttl seconds
+                may be returned instead of checking again.
+            
         Returns:
             bool: True if the service is healthy, False otherwise.
         """
+        if use_cache:
+            cached = self._cached_health()
+            if cached is not None:
+                return cached
+        
         try:
             # Get client
             client = self.get_client()
@@ -229,9 +368,9 @@ class HTTPService(RemoteService):
             self._update_metrics(response_time, response.is_success)
             
             # Check if the response is successful
-            self._healthy = response.is_success
+            healthy = self._record_health(response.is_success)
             
-            if not self._healthy and self._logger:
+            if not healthy and self._logger:
                 self._logger.warning(
                     f"Health check failed for {self.name}",
                     extra={
@@ -241,7 +380,7 @@ class HTTPService(RemoteService):
                     },
                 )
             
-            return self._healthy
+            return healthy
         
         except Exception as e:
             # Update metrics
@@ -254,14 +393,8 @@ class HTTPService(RemoteService):
                     extra={"service": self.name, "error": str(e)},
                 )
             
-            self._healthy = False
-            return False
+            return self._record_health(False)
     
-    @retry(
-        retry=retry_if_exception_type(httpx.HTTPError),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     def request(
         self,
         method: str,
@@ -305,34 +438,43 @@ class HTTPService(RemoteService):
         if timeout is not None:
             kwargs["timeout"] = timeout
         
-        # Make the request
-        start_time = time.time()
-        try:
-            response = client.request(method, path, **kwargs)
+        # Make the request, retrying HTTP errors with exponential backoff
+        attempt = 0
+        while True:
+            start_time = time.time()
+            try:
+                response = client.request(method, path, **kwargs)
+            except Exception as e:
+                # Update metrics
+                self._update_metrics(None, False)
+                
+                # Log the error
+                if self._logger:
+                    self._logger.error(
+                        f"Request error for {self.name}: {str(e)}",
+                        extra={
+                            "service": self.name,
+                            "method": method,
+                            "path": path,
+                            "attempt": attempt + 1,
+                            "error": str(e),
+                        },
+                    )
+                
+                delay = self._retry_backoff(attempt) if isinstance(e, httpx.HTTPError) else None
+                if delay is None:
+                    raise
+                
+                time.sleep(delay)
+                attempt += 1
+                continue
+            
             response_time = time.time() - start_time
             
             # Update metrics
             self._update_metrics(response_time, response.is_success)
             
             return response
-        
-        except Exception as e:
-            # Update metrics
-            self._update_metrics(None, False)
-            
-            # Log the error
-            if self._logger:
-                self._logger.error(
-                    f"Request error for {self.name}: {str(e)}",
-                    extra={
-                        "service": self.name,
-                        "method": method,
-                        "path": path,
-                        "error": str(e),
-                    },
-                )
-            
-            raise
     
     def get(
         self,
@@ -461,6 +603,40 @@ class AsyncHTTPService(RemoteService):
         # HTTP client options
         self.verify_ssl = kwargs.get("verify_ssl", True)
         self.follow_redirects = kwargs.get("follow_redirects", True)
+        
+        # Running event loop for the blocking wrappers, set by the manager
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _run_coroutine(self, coro: Any) -> Any:
+        """Run a coroutine to completion from synchronous code.
+        
+        The coroutine runs on the shared loop when one is attached, and in a
+        temporary event loop otherwise.
+        
+        Args:
+            coro: The coroutine to run.
+            
+        Returns:
+            Any: The coroutine's result.
+            
+        Raises:
+            concurrent.futures.TimeoutError: If the shared loop does not finish
+                the coroutine within the service timeout.
+        """
+        loop = self.loop
+        if loop is None or not loop.is_running():
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(coro)
+            finally:
+                loop.close()
+        
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
     
     def _initialize_client(self) -> None:
         """Initialize the async HTTP client."""
@@ -470,6 +646,7 @@ class AsyncHTTPService(RemoteService):
             follow_redirects=self.follow_redirects,
             verify=self.verify_ssl,
             headers=self.headers,
+            limits=self._pool_limits(),
         )
         
         # Set up authentication if provided
@@ -487,12 +664,21 @@ class AsyncHTTPService(RemoteService):
                 token = self.auth.get("token", "")
                 self._client.headers["Authorization"] = f"Bearer {token}"
     
-    async def check_health_async(self) -> bool:
+    async def check_health_async(self, use_cache: bool = True) -> bool:
         """Check if the service is healthy asynchronously.
         
+        Args:
+            use_cache: Whether a result from the last health_cache_ttl seconds
+                may be returned instead of checking again.
+            
         Returns:
             bool: True if the service is healthy, False otherwise.
         """
+        if use_cache:
+            cached = self._cached_health()
+            if cached is not None:
+                return cached
+        
         try:
             # Get client
             client = self.get_client()
@@ -506,9 +692,9 @@ class AsyncHTTPService(RemoteService):
             self._update_metrics(response_time, response.is_success)
             
             # Check if the response is successful
-            self._healthy = response.is_success
+            healthy = self._record_health(response.is_success)
             
-            if not self._healthy and self._logger:
+            if not healthy and self._logger:
                 self._logger.warning(
                     f"Health check failed for {self.name}",
                     extra={
@@ -518,7 +704,7 @@ class AsyncHTTPService(RemoteService):
                     },
                 )
             
-            return self._healthy
+            return healthy
         
         except Exception as e:
             # Update metrics
@@ -531,27 +717,25 @@ class AsyncHTTPService(RemoteService):
                     extra={"service": self.name, "error": str(e)},
                 )
             
-            self._healthy = False
-            return False
+            return self._record_health(False)
     
-    def check_health(self) -> bool:
+    def check_health(self, use_cache: bool = True) -> bool:
         """Check if the service is healthy.
         
+        Args:
+            use_cache: Whether a result from the last health_cache_ttl seconds
+                may be returned instead of checking again.
+            
         Returns:
             bool: True if the service is healthy, False otherwise.
         """
-        # Run the async health check in a new event loop
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(self.check_health_async())
-        finally:
-            loop.close()
+        if use_cache:
+            cached = self._cached_health()
+            if cached is not None:
+                return cached
+        
+        return self._run_coroutine(self.check_health_async(use_cache=False))
     
-    @retry(
-        retry=retry_if_exception_type(httpx.HTTPError),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def request(
         self,
         method: str,
@@ -595,34 +779,43 @@ class AsyncHTTPService(RemoteService):
         if timeout is not None:
             kwargs["timeout"] = timeout
         
-        # Make the request
-        start_time = time.time()
-        try:
-            response = await client.request(method, path, **kwargs)
+        # Make the request, retrying HTTP errors with exponential backoff
+        attempt = 0
+        while True:
+            start_time = time.time()
+            try:
+                response = await client.request(method, path, **kwargs)
+            except Exception as e:
+                # Update metrics
+                self._update_metrics(None, False)
+                
+                # Log the error
+                if self._logger:
+                    self._logger.error(
+                        f"Request error for {self.name}: {str(e)}",
+                        extra={
+                            "service": self.name,
+                            "method": method,
+                            "path": path,
+                            "attempt": attempt + 1,
+                            "error": str(e),
+                        },
+                    )
+                
+                delay = self._retry_backoff(attempt) if isinstance(e, httpx.HTTPError) else None
+                if delay is None:
+                    raise
+                
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            
             response_time = time.time() - start_time
             
             # Update metrics
             self._update_metrics(response_time, response.is_success)
             
             return response
-        
-        except Exception as e:
-            # Update metrics
-            self._update_metrics(None, False)
-            
-            # Log the error
-            if self._logger:
-                self._logger.error(
-                    f"Request error for {self.name}: {str(e)}",
-                    extra={
-                        "service": self.name,
-                        "method": method,
-                        "path": path,
-                        "error": str(e),
-                    },
-                )
-            
-            raise
     
     async def get(
         self,
@@ -727,12 +920,7 @@ class AsyncHTTPService(RemoteService):
     def close(self) -> None:
         """Close the async HTTP client."""
         if self._client is not None:
-            # Run the async close in a new event loop
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(self.close_async())
-            finally:
-                loop.close()
+            self._run_coroutine(self.close_async())
 
 
 class RemoteServicesManager(NexusManager):
@@ -765,15 +953,24 @@ class RemoteServicesManager(NexusManager):
         self._event_bus = event_bus_manager
         self._thread_manager = thread_manager
         
-        # Remote services
+        # Remote services. Writers replace the dict under the lock rather than
+        # mutating it, so readers can use whichever snapshot they see unlocked.
         self._services: Dict[str, RemoteService] = {}
         
-        # Service registry lock
+        # Service registry write lock
         self._services_lock = threading.RLock()
         
         # Health check task
         self._health_check_interval = 60.0  # seconds
         self._health_check_task_id = None
+        
+        # Event loop shared by async services for their blocking calls,
+        # started when the first async service is registered
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # Threads that check sync services concurrently, started on first use
+        self._health_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
     
     def initialize(self) -> None:
         """Initialize the Remote Services Manager.
@@ -887,6 +1084,9 @@ class RemoteServicesManager(NexusManager):
                 health_check_path=service_config.get("health_check_path", "/health"),
                 verify_ssl=service_config.get("verify_ssl", True),
                 follow_redirects=service_config.get("follow_redirects", True),
+                pool_max_connections=service_config.get("pool_max_connections", 100),
+                pool_max_keepalive=service_config.get("pool_max_keepalive", 100),
+                keepalive_expiry=service_config.get("keepalive_expiry", 30.0),
             )
         
         elif service_type == "async_http":
@@ -905,6 +1105,9 @@ class RemoteServicesManager(NexusManager):
                 health_check_path=service_config.get("health_check_path", "/health"),
                 verify_ssl=service_config.get("verify_ssl", True),
                 follow_redirects=service_config.get("follow_redirects", True),
+                pool_max_connections=service_config.get("pool_max_connections", 100),
+                pool_max_keepalive=service_config.get("pool_max_keepalive", 100),
+                keepalive_expiry=service_config.get("keepalive_expiry", 30.0),
             )
         
         else:
@@ -929,7 +1132,15 @@ class RemoteServicesManager(NexusManager):
             if service.name in self._services:
                 raise ValueError(f"Service '{service.name}' is already registered")
             
-            self._services[service.name] = service
+            services = dict(self._services)
+            services[service.name] = service
+            self._services = services
+            service.health_cache_ttl = self._health_cache_ttl()
+            
+            if isinstance(service, AsyncHTTPService):
+                service.loop = self._get_loop()
+        
+        self._warm_up_service(service)
         
         self._logger.info(
             f"Registered service '{service.name}' with URL {service.base_url}"
@@ -946,6 +1157,75 @@ class RemoteServicesManager(NexusManager):
             },
         )
     
+    def _warm_up_service(self, service: RemoteService) -> None:
+        """Create a service's client and, for sync HTTP services, open its first connection.
+        
+        The initial health check of a sync HTTP service runs off the caller's
+        thread, so the first real request finds a connection in the pool
+        instead of paying for the TCP and TLS handshakes. Async clients only
+        get created: their pooled connections are bound to the event loop that
+        opened them, and requests are made from the caller's loop.
+        
+        Args:
+            service: The newly registered service.
+        """
+        try:
+            service.get_client()
+            
+            if isinstance(service, HTTPService):
+                self._thread_manager.submit_task(
+                    service.check_health,
+                    name=f"remote_service_warm_up_{service.name}",
+                    submitter="remote_manager",
+                )
+        
+        except Exception as e:
+            self._logger.warning(
+                f"Failed to warm up service '{service.name}': {str(e)}",
+                extra={"service": service.name, "error": str(e)},
+            )
+    
+    def _health_cache_ttl(self) -> float:
+        """Get how long services may reuse a health check result.
+        
+        Returns:
+            float: Half the health check interval, capped at the service default.
+        """
+        return min(self._health_check_interval / 2, RemoteService.HEALTH_CACHE_TTL)
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the shared event loop, starting its thread on first use.
+        
+        Must be called with the services lock held.
+        
+        Returns:
+            asyncio.AbstractEventLoop: The running shared event loop.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="remote-services-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+        
+        return self._loop
+    
+    def _stop_loop(self) -> None:
+        """Stop the shared event loop and wait for its thread to exit."""
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join(timeout=5.0)
+            self._loop_thread = None
+        
+        if not loop.is_running():
+            loop.close()
+    
     def unregister_service(self, service_name: str) -> bool:
         """Unregister a remote service.
         
@@ -962,7 +1242,9 @@ class RemoteServicesManager(NexusManager):
             if service_name not in self._services:
                 return False
             
-            service = self._services.pop(service_name)
+            services = dict(self._services)
+            service = services.pop(service_name)
+            self._services = services
             
             # Close service connections
             if hasattr(service, "close") and callable(service.close):
@@ -991,8 +1273,7 @@ class RemoteServicesManager(NexusManager):
         if not self._initialized:
             return None
         
-        with self._services_lock:
-            return self._services.get(service_name)
+        return self._services.get(service_name)
     
     def get_http_service(self, service_name: str) -> Optional[HTTPService]:
         """Get a registered HTTP service by name.
@@ -1035,14 +1316,15 @@ class RemoteServicesManager(NexusManager):
         if not self._initialized:
             return {}
         
-        with self._services_lock:
-            return dict(self._services)
+        return dict(self._services)
     
-    def check_service_health(self, service_name: str) -> bool:
+    def check_service_health(self, service_name: str, use_cache: bool = True) -> bool:
         """Check the health of a specific service.
         
         Args:
             service_name: Name of the service to check.
+            use_cache: Whether a result from the last few seconds may be
+                returned instead of checking again.
             
         Returns:
             bool: True if the service is healthy, False otherwise.
@@ -1056,7 +1338,7 @@ class RemoteServicesManager(NexusManager):
             return False
         
         try:
-            return service.check_health()
+            return service.check_health(use_cache=use_cache)
         
         except Exception as e:
             self._logger.error(
@@ -1066,30 +1348,121 @@ class RemoteServicesManager(NexusManager):
             
             return False
     
-    def check_all_services_health(self) -> Dict[str, bool]:
+    def check_all_services_health(self, use_cache: bool = True) -> Dict[str, bool]:
         """Check the health of all registered services.
         
+        Args:
+            use_cache: Whether a result from the last few seconds may be
+                returned instead of checking again.
+            
         Returns:
             Dict[str, bool]: Dictionary of service name to health status.
         """
         if not self._initialized:
             return {}
         
-        result = {}
+        services = self._services
+        
+        # Async services are checked together on the shared loop, while sync
+        # services are checked in parallel on the health check threads
+        sync_names = []
+        async_services = []
+        for service_name, service in services.items():
+            if isinstance(service, AsyncHTTPService) and service.loop is not None:
+                async_services.append(service)
+            else:
+                sync_names.append(service_name)
+        
+        async_future = None
+        if async_services:
+            async_future = asyncio.run_coroutine_threadsafe(
+                self._check_async_services_health(async_services, use_cache),
+                async_services[0].loop,
+            )
+        
+        result: Dict[str, bool] = {}
+        if len(sync_names) > 1:
+            executor = self._get_health_executor()
+            statuses = executor.map(
+                functools.partial(self.check_service_health, use_cache=use_cache),
+                sync_names,
+            )
+            result.update(zip(sync_names, statuses))
+        elif sync_names:
+            result[sync_names[0]] = self.check_service_health(sync_names[0], use_cache)
         
-        for service_name in self.get_all_services():
-            result[service_name] = self.check_service_health(service_name)
+        if async_future is not None:
+            try:
+                result.update(async_future.result(
+                    max(service.timeout for service in async_services)
+                ))
+            except Exception as e:
+                async_future.cancel()
+                self._logger.error(
+                    f"Error checking health of async services: {str(e)}",
+                    extra={"error": str(e)},
+                )
+                result.update((service.name, False) for service in async_services)
+        
+        # Report in registration order
+        return {name: result[name] for name in services}
+    
+    async def _check_async_services_health(
+        self,
+        services: List[AsyncHTTPService],
+        use_cache: bool,
+    ) -> Dict[str, bool]:
+        """Check the health of async services concurrently.
+        
+        Args:
+            services: The services to check.
+            use_cache: Whether recent cached results may be returned.
+            
+        Returns:
+            Dict[str, bool]: Dictionary of service name to health status.
+        """
+        statuses = await asyncio.gather(
+            *(service.check_health_async(use_cache) for service in services),
+            return_exceptions=True,
+        )
+        
+        result = {}
+        for service, status in zip(services, statuses):
+            if isinstance(status, BaseException):
+                self._logger.error(
+                    f"Error checking health of service '{service.name}': {str(status)}",
+                    extra={"service": service.name, "error": str(status)},
+                )
+                status = False
+            result[service.name] = status
         
         return result
     
+    def _get_health_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the thread pool for sync health checks, creating it on first use.
+        
+        The pool is separate from the Thread Manager's so that a health check
+        sweep, which itself runs as a periodic task, never waits on its own pool.
+        
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: The health check thread pool.
+        """
+        with self._services_lock:
+            if self._health_executor is None:
+                self._health_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_HEALTH_CHECK_WORKERS,
+                    thread_name_prefix="remote-health-check",
+                )
+            return self._health_executor
+    
     def _health_check_task(self) -> None:
         """Periodic task to check the health of all services."""
         if not self._initialized:
             return
         
         try:
-            # Check health of all services
-            health_statuses = self.check_all_services_health()
+            # Check health of all services, always probing them
+            health_statuses = self.check_all_services_health(use_cache=False)
             
             # Count healthy and unhealthy services
             healthy_count = sum(1 for status in health_statuses.values() if status)
@@ -1199,6 +1572,10 @@ class RemoteServicesManager(NexusManager):
             self._health_check_interval = float(value)
             self._logger.info(f"Updated health check interval to {self._health_check_interval}s")
             
+            health_cache_ttl = self._health_cache_ttl()
+            for service in self._services.values():
+                service.health_cache_ttl = health_cache_ttl
+            
             # Reschedule health checks
             self._schedule_health_checks()
         
@@ -1247,27 +1624,16 @@ class RemoteServicesManager(NexusManager):
         try:
             method = method.upper()
             
-            if method == "GET":
-                response = service.get(path, **kwargs)
-            elif method == "POST":
-                response = service.post(path, **kwargs)
-            elif method == "PUT":
-                response = service.put(path, **kwargs)
-            elif method == "DELETE":
-                response = service.delete(path, **kwargs)
-            elif method == "PATCH":
-                response = service.patch(path, **kwargs)
+            method_name = _METHOD_DISPATCH.get(method)
+            if method_name is not None:
+                response = getattr(service, method_name)(path, **kwargs)
             else:
                 response = service.request(method, path, **kwargs)
             
             # Check if request was successful
             response.raise_for_status()
             
-            # Return JSON response if available
-            try:
-                return response.json()
-            except:
-                return response.text
+            return _response_body(response)
         
         except Exception as e:
             # Log the error
@@ -1317,27 +1683,16 @@ class RemoteServicesManager(NexusManager):
         try:
             method = method.upper()
             
-            if method == "GET":
-                response = await service.get(path, **kwargs)
-            elif method == "POST":
-                response = await service.post(path, **kwargs)
-            elif method == "PUT":
-                response = await service.put(path, **kwargs)
-            elif method == "DELETE":
-                response = await service.delete(path, **kwargs)
-            elif method == "PATCH":
-                response = await service.patch(path, **kwargs)
+            method_name = _METHOD_DISPATCH.get(method)
+            if method_name is not None:
+                response = await getattr(service, method_name)(path, **kwargs)
             else:
                 response = await service.request(method, path, **kwargs)
             
             # Check if request was successful
             response.raise_for_status()
             
-            # Return JSON response if available
-            try:
-                return response.json()
-            except:
-                return response.text
+            return _response_body(response)
         
         except Exception as e:
             # Log the error
@@ -1389,7 +1744,14 @@ class RemoteServicesManager(NexusManager):
                         )
                 
                 # Clear services
-                self._services.clear()
+                self._services = {}
+            
+            # Stop the shared event loop once no service can use it
+            self._stop_loop()
+            
+            if self._health_executor is not None:
+                self._health_executor.shutdown(wait=True)
+                self._health_executor = None
             
             # Unregister from event bus
             self._event_bus.unsubscribe("remote_manager")
@@ -1419,14 +1781,15 @@ class RemoteServicesManager(NexusManager):
         
         if self._initialized:
             # Get service statuses
-            service_statuses = {}
-            with self._services_lock:
-                for service_name, service in self._services.items():
-                    service_statuses[service_name] = service.status()
+            services = self._services
+            service_statuses = {
+                service_name: service.status()
+                for service_name, service in services.items()
+            }
             
             status.update({
                 "services": {
-                    "count": len(self._services),
+                    "count": len(services),
                     "statuses": service_statuses,
                 },
                 "health_check": {
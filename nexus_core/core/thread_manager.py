@@ -78,6 +78,10 @@ class ThreadManager(NexusManager):
         self._periodic_stop_event = threading.Event()
         self._periodic_thread: Optional[threading.Thread] = None
         
+        # Set when periodic tasks change, so the scheduler stops waiting and
+        # works out when the next task is due
+        self._periodic_wakeup = threading.Event()
+        
         # Active tasks counter
         self._active_tasks = 0
         self._active_tasks_lock = threading.RLock()
@@ -393,6 +397,7 @@ class ThreadManager(NexusManager):
         
         # Register the periodic task
         self._periodic_tasks[task_id] = (interval, func, args, kwargs)
+        self._periodic_wakeup.set()
         self._logger.debug(f"Scheduled periodic task {task_id} with interval {interval}s")
         
         return task_id
@@ -411,26 +416,37 @@ class ThreadManager(NexusManager):
         
         if task_id in self._periodic_tasks:
             del self._periodic_tasks[task_id]
+            self._periodic_wakeup.set()
             self._logger.debug(f"Cancelled periodic task {task_id}")
             return True
         
         return False
     
     def _periodic_task_scheduler(self) -> None:
-        """Background thread that executes periodic tasks at their scheduled intervals."""
+        """Background thread that executes periodic tasks at their scheduled intervals.
+        
+        Between runs the thread sleeps until the next task is due, or until
+        tasks are scheduled or cancelled, rather than polling.
+        """
         self._logger.debug("Periodic task scheduler started")
         
-        # Track the last execution time of each task
+        # Track the last execution time of each task, on the monotonic clock
         last_run: Dict[str, float] = {}
         
         while not self._periodic_stop_event.is_set():
+            # Cleared before the tasks are read, so no change can be missed
+            self._periodic_wakeup.clear()
+            next_due: Optional[float] = None
+            
             try:
                 # Check each periodic task
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 for task_id, (interval, func, args, kwargs) in list(self._periodic_tasks.items()):
+                    due = last_run[task_id] + interval if task_id in last_run else current_time
+                    
                     # If the task hasn't run yet or it's time to run again
-                    if task_id not in last_run or (current_time - last_run[task_id]) >= interval:
+                    if due <= current_time:
                         # Submit the task to the thread pool
                         try:
                             self.submit_task(
@@ -444,18 +460,26 @@ class ThreadManager(NexusManager):
                             
                             # Update last run time
                             last_run[task_id] = current_time
+                            due = current_time + interval
                         
                         except Exception as e:
                             self._logger.error(
                                 f"Error scheduling periodic task {task_id}: {str(e)}"
                             )
-                
-                # Sleep a short time before checking again
-                time.sleep(0.1)
+                            # Try again shortly
+                            due = current_time + min(interval, 0.1)
+                    
+                    if next_due is None or due < next_due:
+                        next_due = due
             
             except Exception as e:
                 self._logger.error(f"Error in periodic task scheduler: {str(e)}")
                 # Continue running even after an error
+                next_due = time.monotonic() + 0.1
+            
+            # Sleep until the next task is due, or indefinitely if there are none
+            timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+            self._periodic_wakeup.wait(timeout)
     
     def _on_config_changed(self, key: str, value: Any) -> None:
         """Handle configuration changes for the thread pool.
@@ -486,6 +510,7 @@ class ThreadManager(NexusManager):
             
             # Stop periodic task scheduler
             self._periodic_stop_event.set()
+            self._periodic_wakeup.set()
             if self._periodic_thread and self._periodic_thread.is_alive():
                 self._periodic_thread.join(timeout=2.0)
             
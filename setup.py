@@ -33,7 +33,6 @@ setup(
         "fastapi>=0.103.1",
         "uvicorn>=0.23.2",
         "pika>=1.3.2",
-        "python-json-logger>=2.0.7",
         "psutil>=5.9.5",
         "prometheus-client>=0.17.1",
         "pyjwt>=2.8.0",
@@ -7,6 +7,7 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -321,7 +322,7 @@ def test_config_manager_nested_listener(config_manager: ConfigManager) -> None:
     assert database_changes[1] == ("database.port", 5433)
 
 
-def test_listener_exception_handling(config_manager: ConfigManager, capfd: pytest.CaptureFixture[str]) -> None:
+def test_listener_exception_handling(config_manager: ConfigManager, caplog: pytest.LogCaptureFixture) -> None:
     """Test that exceptions in listeners are caught and don't affect other listeners."""
     def buggy_listener(key: str, value: Any) -> None:
         raise RuntimeError("Intentional error in listener")
@@ -341,10 +342,9 @@ def test_listener_exception_handling(config_manager: ConfigManager, capfd: pytes
     assert len(changes) == 1
     assert changes[0] == ("app.name", "Exception Test")
 
-    # Check that error was logged (printed in this implementation)
-    captured = capfd.readouterr()
-    assert "Error in config listener" in captured.out
-    assert "Intentional error in listener" in captured.out
+    # Check that error was logged
+    assert "Error in config listener" in caplog.text
+    assert "Intentional error in listener" in caplog.text
 
 
 def test_config_schema_monitoring_validation() -> None:
@@ -373,7 +373,7 @@ def test_config_schema_monitoring_validation() -> None:
     assert schema.monitoring["prometheus"]["port"] == "9090"
 
 
-def test_config_manager_save_validation_error(tmp_path: Path, capfd: pytest.CaptureFixture[str]) -> None:
+def test_config_manager_save_validation_error(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
     """Test save behavior when the config file can't be written."""
     config_file = tmp_path / "readonly.yaml"
 
@@ -389,18 +389,16 @@ def test_config_manager_save_validation_error(tmp_path: Path, capfd: pytest.Capt
     manager = ConfigManager(config_path=config_file)
     manager.initialize()
 
-    # Try to save after making the file read-only
-    os.chmod(config_file, 0o444)  # Read-only
+    # Try to save while the file can't be opened for writing (a plain chmod
+    # is not enough here since it is ignored when running as root)
+    with patch.object(Path, "open", side_effect=PermissionError("Read-only")):
+        # The method catches exceptions and logs them rather than raising
+        manager._save_to_file()
 
-    # The method catches exceptions and prints them rather than raising
-    manager._save_to_file()
-
-    # Check that an error message was printed
-    captured = capfd.readouterr()
-    assert "Error saving configuration" in captured.out
+    # Check that an error message was logged
+    assert "Error saving configuration" in caplog.text
+    assert "Read-only" in caplog.text
 
-    # Restore permissions for cleanup
-    os.chmod(config_file, 0o644)
     manager.shutdown()
 
 
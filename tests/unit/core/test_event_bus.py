@@ -1,13 +1,15 @@
 """Unit tests for the Event Bus Manager."""
 
+import asyncio
+import concurrent.futures
 import pytest
 import threading
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from nexus_core.core.event_bus_manager import EventBusManager
 from nexus_core.core.event_model import Event
-from nexus_core.utils.exceptions import EventBusError
+from nexus_core.utils.exceptions import EventBusError, ManagerShutdownError
 
 
 @pytest.fixture
@@ -197,3 +199,285 @@ def test_publish_without_initialization():
     
     with pytest.raises(EventBusError):
         event_bus.publish(event_type="test/event", source="test")
+
+
+def test_event_pool_reuses_events(config_manager):
+    """Test that pooled events are recycled once their callbacks have run."""
+    config_manager.set("event_bus.event_pool_size", 4)
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    seen = []
+    
+    def on_event(event):
+        seen.append((id(event), event.event_id, dict(event.payload)))
+    
+    event_bus.subscribe(event_type="test/pooled", callback=on_event)
+    
+    first_id = event_bus.publish(
+        event_type="test/pooled", source="test", payload={"n": 1}, synchronous=True
+    )
+    second_id = event_bus.publish(
+        event_type="test/pooled", source="test", payload={"n": 2}, synchronous=True
+    )
+    
+    # The same instance is reused, but with fresh values each time
+    assert seen[0][0] == seen[1][0]
+    assert (seen[0][1], seen[1][1]) == (first_id, second_id)
+    assert first_id != second_id
+    assert seen[0][2] == {"n": 1}
+    assert seen[1][2] == {"n": 2}
+    
+    event_bus.shutdown()
+
+
+def test_shutdown_drains_queued_events(config_manager):
+    """Test that events queued before shutdown are still delivered."""
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    received = []
+    lock = threading.Lock()
+    
+    def on_event(event):
+        time.sleep(0.001)
+        with lock:
+            received.append(event.event_id)
+    
+    event_bus.subscribe(event_type="test/drain", callback=on_event)
+    
+    published = {
+        event_bus.publish(event_type="test/drain", source="test")
+        for _ in range(50)
+    }
+    
+    # No sleep: shutdown itself must wait for the queued events
+    event_bus.shutdown()
+    
+    assert set(received) == published
+
+
+def test_async_mode_supports_coroutine_callbacks(config_manager):
+    """Test that async mode delivers events to coroutine and regular callbacks."""
+    config_manager.set("event_bus.mode", "async")
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    received = []
+    
+    async def on_event_async(event):
+        received.append(("async", event.event_id))
+    
+    def on_event(event):
+        received.append(("sync", event.event_id))
+    
+    event_bus.subscribe(event_type="test/async", callback=on_event_async)
+    event_bus.subscribe(event_type="test/async", callback=on_event)
+    
+    event_id = event_bus.publish(event_type="test/async", source="test", synchronous=True)
+    assert sorted(received) == [("async", event_id), ("sync", event_id)]
+    
+    awaited_id = asyncio.run(
+        event_bus.publish_async(event_type="test/async", source="test")
+    )
+    assert ("async", awaited_id) in received
+    assert ("sync", awaited_id) in received
+    
+    event_bus.shutdown()
+
+
+def test_full_queue_delivers_in_publishing_thread(config_manager):
+    """Test that a full worker queue falls back to delivery in the caller."""
+    config_manager.set("event_bus.thread_pool_size", 1)
+    config_manager.set("event_bus.max_queue_size", 1)
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    gate = threading.Event()
+    threads = []
+    
+    def on_event(event):
+        threads.append(threading.current_thread())
+        if event.payload.get("block"):
+            gate.wait(timeout=5.0)
+    
+    event_bus.subscribe(event_type="test/full", callback=on_event)
+    
+    # Occupy the only worker, then fill its queue
+    event_bus.publish(event_type="test/full", source="test", payload={"block": True})
+    time.sleep(0.1)
+    event_bus.publish(event_type="test/full", source="test")
+    
+    # This one can't be queued, so it runs here
+    event_bus.publish(event_type="test/full", source="test")
+    assert threads[-1] is threading.current_thread()
+    assert event_bus.status()["queue"]["caller_runs"] == 1
+    
+    gate.set()
+    event_bus.shutdown()
+    assert len(threads) == 3
+
+
+def test_sync_mode_delivers_in_publishing_thread(config_manager):
+    """Test that sync mode runs callbacks inline without worker threads."""
+    config_manager.set("event_bus.mode", "sync")
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    threads = []
+    event_bus.subscribe(
+        event_type="test/sync-mode",
+        callback=lambda event: threads.append(threading.current_thread()),
+    )
+    
+    event_bus.publish(event_type="test/sync-mode", source="test")
+    
+    assert threads == [threading.current_thread()]
+    assert event_bus.status()["threads"]["worker_count"] == 0
+    
+    event_bus.shutdown()
+
+
+def test_workers_scale_with_queue_depth(config_manager):
+    """Test that workers are added under load and retired once idle."""
+    config_manager.set("event_bus.thread_pool_size", 4)
+    config_manager.set("event_bus.worker_idle_timeout", 0.2)
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    # Start with a single worker
+    assert event_bus.status()["threads"]["worker_count"] == 1
+    
+    received = []
+    lock = threading.Lock()
+    
+    def on_event(event):
+        time.sleep(0.001)
+        with lock:
+            received.append(event.event_id)
+    
+    event_bus.subscribe(event_type="test/load", callback=on_event)
+    
+    published = {
+        event_bus.publish(event_type="test/load", source="test")
+        for _ in range(400)
+    }
+    assert event_bus.status()["threads"]["worker_count"] > 1
+    
+    # Extra workers retire after the idle timeout, without losing events
+    time.sleep(1.5)
+    assert event_bus.status()["threads"]["worker_count"] == 1
+    assert set(received) == published
+    
+    event_bus.shutdown()
+
+
+def test_status_tracks_subscription_counts(event_bus_manager):
+    """Test that status reports subscription counts as they change."""
+    callback = lambda event: None
+    
+    event_bus_manager.subscribe(event_type="test/a", callback=callback, subscriber_id="one")
+    event_bus_manager.subscribe(event_type="test/b", callback=callback, subscriber_id="one")
+    event_bus_manager.subscribe(event_type="test/a", callback=callback, subscriber_id="two")
+    # Re-subscribing replaces the existing subscription
+    event_bus_manager.subscribe(event_type="test/a", callback=callback, subscriber_id="two")
+    
+    subscriptions = event_bus_manager.status()["subscriptions"]
+    assert subscriptions["total"] == 3
+    assert subscriptions["unique_subscribers"] == 2
+    assert subscriptions["event_types"] == 2
+    
+    event_bus_manager.unsubscribe("one")
+    
+    subscriptions = event_bus_manager.status()["subscriptions"]
+    assert subscriptions["total"] == 1
+    assert subscriptions["unique_subscribers"] == 1
+    assert subscriptions["event_types"] == 1
+
+
+def test_subscribe_many(event_bus_manager):
+    """Test subscribing one subscriber to several event types in one call."""
+    received = []
+    
+    subscriber_id = event_bus_manager.subscribe_many(
+        [
+            ("test/many-a", lambda event: received.append(("a", event.event_type))),
+            ("test/many-b", lambda event: received.append(("b", event.event_type))),
+        ],
+        subscriber_id="many",
+    )
+    assert subscriber_id == "many"
+    
+    event_bus_manager.publish(event_type="test/many-a", source="test", synchronous=True)
+    event_bus_manager.publish(event_type="test/many-b", source="test", synchronous=True)
+    assert received == [("a", "test/many-a"), ("b", "test/many-b")]
+    
+    subscriptions = event_bus_manager.status()["subscriptions"]
+    assert subscriptions["total"] == 2
+    assert subscriptions["unique_subscribers"] == 1
+    
+    # Unsubscribing by ID removes every subscription made in the batch
+    event_bus_manager.unsubscribe("many")
+    assert event_bus_manager.status()["subscriptions"]["total"] == 0
+
+
+def test_publish_timeout_is_deprecated(event_bus_manager):
+    """Test that changing the unused publish timeout only logs a warning."""
+    event_bus_manager._on_config_changed("event_bus.publish_timeout", 10.0)
+    
+    event_bus_manager._logger.warning.assert_called_once_with(
+        "event_bus.publish_timeout is deprecated and ignored",
+    )
+    assert not hasattr(event_bus_manager, "_publish_timeout")
+
+
+def test_async_shutdown_with_busy_loop_reports_drain_timeout(config_manager):
+    """Test that shutdown leaves a still-running loop open and reports the timeout."""
+    config_manager.set("event_bus.mode", "async")
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    event_bus = EventBusManager(config_manager, logger_manager)
+    event_bus.initialize()
+    
+    loop = event_bus._loop
+    loop_thread = event_bus._loop_thread
+    release = threading.Event()
+    loop.call_soon_threadsafe(release.wait)
+    
+    # Simulate a callback that outlasts both the drain and the join timeouts
+    drain = concurrent.futures.Future()
+    drain.set_exception(concurrent.futures.TimeoutError())
+    event_bus._loop_thread = MagicMock()
+    def run_coroutine_threadsafe(coro, loop):
+        coro.close()
+        return drain
+    
+    with patch("asyncio.run_coroutine_threadsafe", side_effect=run_coroutine_threadsafe):
+        with pytest.raises(ManagerShutdownError) as excinfo:
+            event_bus.shutdown()
+    
+    assert isinstance(excinfo.value.__cause__, concurrent.futures.TimeoutError)
+    assert not loop.is_closed()
+    
+    release.set()
+    loop_thread.join(timeout=5.0)
+    loop.close()
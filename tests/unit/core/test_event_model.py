@@ -2,8 +2,9 @@ import pytest
 import json
 import uuid
 import datetime
+import types
 from unittest.mock import MagicMock
-from nexus_core.core.event_model import Event, EventSubscription
+from nexus_core.core.event_model import Event, EventSubscription, generate_id
 
 def test_event_creation():
     """Test creating an Event instance."""
@@ -20,13 +21,14 @@ def test_event_creation():
     # Create event with custom values
     custom_id = str(uuid.uuid4())
     custom_time = datetime.datetime(2025, 1, 1, 12, 0, 0)
+    custom_ns = int(custom_time.timestamp()) * 1_000_000_000
     custom_payload = {'key1': 'value1', 'key2': 42}
     custom_correlation = str(uuid.uuid4())
     
     event = Event(
         event_type='test/custom',
         event_id=custom_id,
-        timestamp=custom_time,
+        timestamp_ns=custom_ns,
         source='custom_source',
         payload=custom_payload,
         correlation_id=custom_correlation
@@ -34,6 +36,7 @@ def test_event_creation():
     
     assert event.event_type == 'test/custom'
     assert event.event_id == custom_id
+    assert event.timestamp_ns == custom_ns
     assert event.timestamp == custom_time
     assert event.source == 'custom_source'
     assert event.payload == custom_payload
@@ -77,7 +80,36 @@ def test_event_to_dict():
     assert event_dict['source'] == 'dict_source'
     assert event_dict['payload'] == {'test': True}
     assert 'event_id' in event_dict
-    assert 'timestamp' in event_dict
+    assert event_dict['timestamp'] == event.timestamp.isoformat()
+
+def test_event_to_json():
+    """Test serializing an Event to JSON bytes."""
+    event = Event(
+        event_type='test/json',
+        source='json_source',
+        payload={'when': datetime.datetime(2025, 1, 1, 12, 0, 0), 'count': 3}
+    )
+    
+    encoded = event.to_json()
+    
+    assert isinstance(encoded, bytes)
+    decoded = json.loads(encoded)
+    assert decoded['event_type'] == 'test/json'
+    assert decoded['event_id'] == event.event_id
+    assert decoded['timestamp'] == event.timestamp.isoformat()
+    assert decoded['payload'] == {'when': '2025-01-01T12:00:00', 'count': 3}
+
+
+def test_event_to_json_read_only_payload():
+    """Test that read-only payloads serialize like dicts."""
+    event = Event(
+        event_type='test/json',
+        source='json_source',
+        payload=types.MappingProxyType({'count': 3})
+    )
+    
+    assert event.to_dict()['payload'] == {'count': 3}
+    assert json.loads(event.to_json())['payload'] == {'count': 3}
 
 def test_event_string_representation():
     """Test the string representation of an Event."""
@@ -126,7 +158,7 @@ def test_event_subscription_creation():
     assert filtered_subscription.filter_criteria == filter_criteria
 
 def test_event_subscription_matching():
-    """Test EventSubscription.matches_event method."""
+    """Test EventSubscription.matches_filter method."""
     callback = MagicMock()
     
     # Test without filter criteria
@@ -141,13 +173,14 @@ def test_event_subscription_matching():
         source='test_source'
     )
     
-    non_matching_event = Event(
+    # Routing by event type is the event bus's job, not the subscription's
+    other_type_event = Event(
         event_type='different/event',
         source='test_source'
     )
     
-    assert subscription.matches_event(matching_event) is True
-    assert subscription.matches_event(non_matching_event) is False
+    assert subscription.matches_filter(matching_event) is True
+    assert subscription.matches_filter(other_type_event) is True
     
     # Test with filter criteria
     filtered_subscription = EventSubscription(
@@ -175,9 +208,9 @@ def test_event_subscription_matching():
         payload={'category': 'normal', 'other': 'value'}
     )
     
-    assert filtered_subscription.matches_event(matching_filtered_event) is True
-    assert filtered_subscription.matches_event(partially_matching_event) is False
-    assert filtered_subscription.matches_event(non_matching_filtered_event) is False
+    assert filtered_subscription.matches_filter(matching_filtered_event) is True
+    assert filtered_subscription.matches_filter(partially_matching_event) is False
+    assert filtered_subscription.matches_filter(non_matching_filtered_event) is False
     
     # Test with wildcard event type
     wildcard_subscription = EventSubscription(
@@ -191,7 +224,7 @@ def test_event_subscription_matching():
         source='any_source'
     )
     
-    assert wildcard_subscription.matches_event(any_event) is True
+    assert wildcard_subscription.matches_filter(any_event) is True
     
     # Test wildcard with filter criteria
     wildcard_filtered_subscription = EventSubscription(
@@ -213,8 +246,8 @@ def test_event_subscription_matching():
         payload={'important': False}
     )
     
-    assert wildcard_filtered_subscription.matches_event(important_event) is True
-    assert wildcard_filtered_subscription.matches_event(unimportant_event) is False
+    assert wildcard_filtered_subscription.matches_filter(important_event) is True
+    assert wildcard_filtered_subscription.matches_filter(unimportant_event) is False
 
 def test_event_subscription_callback():
     """Test that the EventSubscription callback is callable."""
@@ -238,3 +271,25 @@ def test_event_subscription_callback():
     
     # Verify that the callback was called with the event
     callback.assert_called_once_with(event)
+
+def test_generate_id():
+    """Test that generated IDs are unique and use the UUID layout."""
+    ids = [generate_id() for _ in range(1000)]
+    
+    assert len(set(ids)) == len(ids)
+    for event_id in ids:
+        assert len(event_id) == 36
+        assert str(uuid.UUID(event_id)) == event_id
+
+def test_event_subscription_filters_are_interned():
+    """Test that subscriptions with equal criteria share one filter."""
+    callback = MagicMock()
+    
+    first = EventSubscription('a', 'test/event', callback, {'tenant': 1, 'kind': 'x'})
+    second = EventSubscription('b', 'test/event', callback, {'kind': 'x', 'tenant': 1})
+    other = EventSubscription('c', 'test/event', callback, {'tenant': 2})
+    unhashable = EventSubscription('d', 'test/event', callback, {'tags': ['x']})
+    
+    assert first.event_filter is second.event_filter
+    assert first.event_filter is not other.event_filter
+    assert unhashable.event_filter.matches({'tags': ['x']})
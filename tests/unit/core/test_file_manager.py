@@ -1,8 +1,10 @@
 """Unit tests for the File Manager."""
 
+import hashlib
 import os
 import pytest
 import tempfile
+import threading
 import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -282,6 +284,10 @@ def test_create_backup(file_manager, temp_root_dir):
     # Verify backup content
     backup_content = file_manager.read_text(backup_path, "backup")
     assert backup_content == test_content
+    
+    # Test backing up a non-existent file
+    with pytest.raises(FileError):
+        file_manager.create_backup("nonexistent.txt")
 
 
 def test_get_file_info(file_manager, temp_root_dir):
@@ -314,4 +320,238 @@ def test_file_manager_status(file_manager):
     assert status["initialized"] is True
     assert "directories" in status
     assert "disk_usage" in status
-    assert "active_locks" in status
+    assert status["lock_stripes"] == 64
+
+
+def test_compute_file_hash(file_manager):
+    """Test computing the SHA-256 hash of a file."""
+    content = b"hash me" * 20000
+    file_manager.write_binary("hash.bin", content)
+    
+    assert file_manager.compute_file_hash("hash.bin") == hashlib.sha256(content).hexdigest()
+    
+    file_manager.ensure_directory("hash_dir")
+    with pytest.raises(FileError):
+        file_manager.compute_file_hash("hash_dir")
+
+
+def test_file_type_detection(file_manager):
+    """Test classifying files by extension."""
+    file_manager.write_text("REPORT.PDF", "")
+    file_manager.write_text("archive.tar.gz", "")
+    file_manager.write_text(".yaml", "")
+    file_manager.write_text("settings.yml", "")
+    
+    assert file_manager.get_file_info("REPORT.PDF").file_type == FileType.DOCUMENT
+    assert file_manager.get_file_info("archive.tar.gz").file_type == FileType.UNKNOWN
+    assert file_manager.get_file_info(".yaml").file_type == FileType.UNKNOWN
+    assert file_manager.get_file_info("settings.yml").file_type == FileType.CONFIG
+
+
+def test_list_files_recursive_pattern(file_manager):
+    """Test listing a directory tree filtered by a name pattern."""
+    file_manager.write_text("tree/top.txt", "top")
+    file_manager.write_text("tree/notes.md", "notes")
+    file_manager.write_text("tree/nested/deep/inner.txt", "inner")
+    
+    files = file_manager.list_files("tree", recursive=True, pattern="*.txt")
+    assert sorted(f.name for f in files) == ["inner.txt", "top.txt"]
+    
+    files = file_manager.list_files("tree", recursive=True, include_dirs=False)
+    assert sorted(f.name for f in files) == ["inner.txt", "notes.md", "top.txt"]
+    
+    files = file_manager.list_files("tree", pattern="*.txt")
+    assert [f.name for f in files] == ["top.txt"]
+    assert files[0].file_type == FileType.TEXT
+
+
+def test_large_binary_file_round_trip(file_manager):
+    """Test reading back binary files larger than the I/O buffers."""
+    content = os.urandom(3 * 1024 * 1024 + 7)
+    file_manager.write_binary("large.bin", content)
+    assert file_manager.read_binary("large.bin") == content
+    
+    file_manager.write_binary("empty.bin", b"")
+    assert file_manager.read_binary("empty.bin") == b""
+
+
+def test_atomic_write_replaces_existing_file(file_manager, temp_root_dir):
+    """Test that rewriting a file replaces it without leaving temp files."""
+    file_manager.write_text("atomic/data.txt", "first")
+    file_manager.write_text("atomic/data.txt", "second")
+    file_manager.write_binary("atomic/data.bin", b"\x00\x01")
+    
+    assert file_manager.read_text("atomic/data.txt") == "second"
+    assert sorted(os.listdir(os.path.join(temp_root_dir, "data", "atomic"))) == [
+        "data.bin",
+        "data.txt",
+    ]
+
+
+def test_get_file_path_absolute(file_manager, temp_root_dir):
+    """Test that absolute paths must stay inside the managed directories."""
+    base_dir = os.path.join(temp_root_dir, "data")
+    
+    inside = os.path.join(base_dir, "nested", "file.txt")
+    assert str(file_manager.get_file_path(inside)) == inside
+    assert str(file_manager.get_file_path(base_dir)) == base_dir
+    
+    # A sibling directory sharing the base directory's name as a prefix
+    with pytest.raises(FileError):
+        file_manager.get_file_path(base_dir + "_other/file.txt")
+    
+    with pytest.raises(FileError):
+        file_manager.get_file_path(os.path.join(base_dir, "..", "escape.txt"))
+
+
+def test_copy_directory_tree(file_manager):
+    """Test copying a directory tree with its file contents."""
+    content = os.urandom(256 * 1024)
+    file_manager.write_binary("tree_src/data.bin", content)
+    file_manager.write_text("tree_src/nested/notes.txt", "notes")
+    
+    file_manager.copy_file("tree_src", "tree_dest")
+    
+    assert file_manager.read_binary("tree_dest/data.bin") == content
+    assert file_manager.read_text("tree_dest/nested/notes.txt") == "notes"
+    assert (
+        file_manager.get_file_info("tree_dest/data.bin").modified_at
+        == file_manager.get_file_info("tree_src/data.bin").modified_at
+    )
+
+
+def test_list_files_path_pattern(file_manager):
+    """Test listing with patterns that span directories."""
+    file_manager.write_text("globbed/top.txt", "top")
+    file_manager.write_text("globbed/a/one.txt", "one")
+    file_manager.write_text("globbed/a/b/two.txt", "two")
+    file_manager.write_text("globbed/a/b/two.md", "two")
+    
+    files = file_manager.list_files("globbed", recursive=True, pattern="**/*.txt")
+    assert sorted(f.name for f in files) == ["one.txt", "top.txt", "two.txt"]
+    
+    files = file_manager.list_files("globbed", recursive=True, pattern="a/*/*.txt")
+    assert [f.name for f in files] == ["two.txt"]
+    
+    files = file_manager.list_files("globbed", recursive=True, pattern="a/**/*")
+    assert sorted(f.name for f in files) == ["b", "one.txt", "two.md", "two.txt"]
+
+
+def test_file_manager_status_caches_disk_usage(file_manager):
+    """Test that status reuses a recent disk usage reading."""
+    with patch("nexus_core.core.file_manager.shutil.disk_usage") as disk_usage:
+        disk_usage.return_value = (100 * 1024**3, 25 * 1024**3, 75 * 1024**3)
+        
+        file_manager.status()
+        status = file_manager.status()
+    
+    disk_usage.assert_called_once()
+    assert status["disk_usage"]["percent_used"] == 25.0
+
+
+def test_create_temp_file(file_manager, temp_root_dir):
+    """Test creating uniquely named temporary files."""
+    path1, file1 = file_manager.create_temp_file(prefix="job_", suffix=".bin")
+    path2, file2 = file_manager.create_temp_file(prefix="job_", suffix=".bin")
+    
+    with file1, file2:
+        file1.write(b"data")
+        file1.seek(0)
+        assert file1.read() == b"data"
+    
+    assert path1 != path2
+    assert os.path.dirname(path1) == os.path.join(temp_root_dir, "data", "temp")
+    assert os.path.basename(path1).startswith("job_")
+    assert path1.endswith(".bin")
+    assert os.stat(path1).st_mode & 0o777 == 0o600
+
+
+def test_copy_move_with_shared_lock_stripe(file_manager):
+    """Test that copy and move take a lock stripe shared by both paths once."""
+    file_manager.write_text("stripe_src.txt", "striped")
+    
+    def copy_and_move():
+        file_manager.copy_file("stripe_src.txt", "stripe_copy.txt")
+        file_manager.move_file("stripe_copy.txt", "stripe_moved.txt")
+    
+    # With a single stripe every path shares the same lock
+    with patch("nexus_core.core.file_manager._FILE_LOCK_STRIPES", 1):
+        worker = threading.Thread(target=copy_and_move, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+    
+    assert not worker.is_alive()
+    assert file_manager.read_text("stripe_moved.txt") == "striped"
+
+
+def test_compute_file_hashes(file_manager):
+    """Test hashing several files at once."""
+    contents = {f"bulk/file{i}.bin": os.urandom(1024 * i) for i in range(5)}
+    for path, content in contents.items():
+        file_manager.write_binary(path, content)
+    
+    hashes = file_manager.compute_file_hashes(list(contents))
+    
+    assert hashes == {
+        path: hashlib.sha256(content).hexdigest() for path, content in contents.items()
+    }
+    
+    with pytest.raises(FileError):
+        file_manager.compute_file_hashes(["bulk/file1.bin", "bulk/missing.bin"])
+
+
+def test_create_backup_in_subdirectory(file_manager, temp_root_dir):
+    """Test that backups mirror the source file's subdirectory."""
+    file_manager.write_text("reports/2024/summary.txt", "summary")
+    
+    backup_path = file_manager.create_backup("reports/2024/summary.txt")
+    
+    assert os.path.dirname(backup_path) == os.path.join("reports", "2024")
+    assert os.path.basename(backup_path).startswith("summary_")
+    assert backup_path.endswith(".txt")
+    assert file_manager.read_text(backup_path, "backup") == "summary"
+
+
+def test_read_text_translates_newlines(file_manager):
+    """Test that reading text decodes UTF-8 and normalizes newlines."""
+    file_manager.write_binary("newlines.txt", "café\r\nline\rend\n".encode("utf-8"))
+    
+    assert file_manager.read_text("newlines.txt") == "café\nline\nend\n"
+
+
+def test_failed_write_keeps_unnamed_temp_files(file_manager):
+    """Test that an ordinary write error does not turn off unnamed temp files."""
+    unnamed = file_manager._unnamed_temp_files
+    
+    with pytest.raises(FileError):
+        file_manager.write_text("missing_dir/data.txt", "data", create_dirs=False)
+    
+    assert file_manager._unnamed_temp_files == unnamed
+    
+    file_manager.write_text("present.txt", "data")
+    assert file_manager.read_text("present.txt") == "data"
+
+
+def test_get_file_path_relative_escape(file_manager, temp_root_dir):
+    """Test that relative paths using .. must stay inside the managed directories."""
+    base_dir = os.path.join(temp_root_dir, "data")
+    
+    # Climbing into another managed directory is allowed
+    path = file_manager.get_file_path("../backups/file.txt", "temp")
+    assert str(path) == os.path.join(base_dir, "backups", "file.txt")
+    
+    with pytest.raises(FileError):
+        file_manager.get_file_path("../../../etc/passwd")
+    
+    with pytest.raises(FileError):
+        file_manager.read_text("../outside.txt")
+
+
+def test_copy_file_when_copy_file_range_copies_nothing(file_manager):
+    """Test that copying falls back when the kernel copy reports no data."""
+    file_manager.write_text("procfs_like.txt", "contents")
+    
+    with patch("os.copy_file_range", return_value=0, create=True):
+        file_manager.copy_file("procfs_like.txt", "copied.txt")
+    
+    assert file_manager.read_text("copied.txt") == "contents"
@@ -1,13 +1,16 @@
 """Unit tests for the Logging Manager."""
 
+import json
 import logging
 import os
 import pytest
+import structlog
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from nexus_core.core.logging_manager import LoggingManager
+from nexus_core.core.logging_manager import JsonFormatter, LoggingManager, _LevelCheckingBoundLogger
 from nexus_core.utils.exceptions import ManagerInitializationError
 
 
@@ -104,7 +107,7 @@ def test_logging_manager_config_changes(mock_logging, config_manager_mock):
     logging_manager._root_logger = mock_logger
     mock_file_handler = MagicMock()
     logging_manager._file_handler = mock_file_handler
-    mock_logger.handlers = [mock_file_handler]
+    logging_manager._active_handlers = [mock_file_handler]
     
     # Test changing log level
     logging_manager._on_config_changed("logging.level", "DEBUG")
@@ -114,15 +117,13 @@ def test_logging_manager_config_changes(mock_logging, config_manager_mock):
     logging_manager._on_config_changed("logging.file.level", "ERROR")
     mock_file_handler.setLevel.assert_called_with(logging.ERROR)
     
-    # Test disabling file handler
-    mock_logger.removeHandler.reset_mock()
+    # Test disabling file handler restarts the listener without it
     logging_manager._on_config_changed("logging.file.enabled", False)
-    mock_logger.removeHandler.assert_called_with(mock_file_handler)
+    assert mock_file_handler not in logging_manager._listener.handlers
     
-    # Test enabling file handler
-    mock_logger.addHandler.reset_mock()
+    # Test enabling file handler restarts the listener with it
     logging_manager._on_config_changed("logging.file.enabled", True)
-    mock_logger.addHandler.assert_called_with(mock_file_handler)
+    assert mock_file_handler in logging_manager._listener.handlers
     
     # Clean up
     logging_manager.shutdown()
@@ -156,11 +157,31 @@ def test_json_format_logger(mock_structlog, config_manager_mock):
     # Verify structlog was configured
     assert logging_manager._enable_structlog is True
     mock_structlog.configure.assert_called_once()
+    assert mock_structlog.configure.call_args.kwargs["wrapper_class"] is _LevelCheckingBoundLogger
     
     # Clean up
     logging_manager.shutdown()
 
 
+def test_structlog_level_change_applies_to_existing_loggers():
+    """Test that a cached structlog logger follows later level changes."""
+    stdlib_logger = logging.getLogger("test_level_checking")
+    stdlib_logger.setLevel(logging.INFO)
+    events = []
+    
+    def capture(logger, method_name, event_dict):
+        events.append(event_dict["event"])
+        raise structlog.DropEvent
+    
+    bound_logger = _LevelCheckingBoundLogger(stdlib_logger, [capture], {})
+    bound_logger.debug("hidden")
+    
+    stdlib_logger.setLevel(logging.DEBUG)
+    bound_logger.debug("shown")
+    
+    assert events == ["shown"]
+
+
 def test_logging_manager_initialization_failure(config_manager_mock):
     """Test that the LoggingManager handles initialization failures gracefully."""
     # Make the config manager raise an exception
@@ -170,3 +191,77 @@ def test_logging_manager_initialization_failure(config_manager_mock):
     
     with pytest.raises(ManagerInitializationError):
         logging_manager.initialize()
+
+
+def test_json_formatter_output():
+    """Test that the JSON formatter writes messages, extras and exceptions."""
+    formatter = JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z")
+    
+    record = logging.makeLogRecord({
+        "name": "test_logger",
+        "levelno": logging.INFO,
+        "levelname": "INFO",
+        "msg": "Hello %s",
+        "args": ("world",),
+        "manager": "LoggingManager",
+        "_private": "hidden",
+    })
+    output = json.loads(formatter.format(record))
+    
+    assert output["name"] == "test_logger"
+    assert output["levelname"] == "INFO"
+    assert output["message"] == "Hello world"
+    assert output["manager"] == "LoggingManager"
+    assert "asctime" in output
+    assert "_private" not in output
+    assert "args" not in output
+    
+    # Structured messages are merged into the output
+    record = logging.makeLogRecord({"msg": {"event": "started", "count": 3}})
+    output = json.loads(formatter.format(record))
+    assert output["event"] == "started"
+    assert output["count"] == 3
+    assert output["message"] == ""
+    
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord({"msg": "failed", "exc_info": sys.exc_info()})
+    output = json.loads(formatter.format(record))
+    assert "ValueError: boom" in output["exc_info"]
+
+
+def test_log_records_are_written_by_listener(config_manager_mock, logging_config):
+    """Test that records logged through the queue reach the log file."""
+    logging_manager = LoggingManager(config_manager_mock)
+    logging_manager.initialize()
+    
+    logging.getLogger("test_logger").info("Queued %s", "message")
+    
+    # Shutting down drains the queue into the handlers
+    logging_manager.shutdown()
+    
+    with open(logging_config["file"]["path"], encoding="utf-8") as f:
+        assert "Queued message" in f.read()
+
+
+def test_file_handler_rotates_buffered_output(config_manager_mock, logging_config):
+    """Test that buffered file output is rotated at the configured size."""
+    logging_config["file"]["rotation"] = "1 MB"
+    logging_config["console"]["enabled"] = False
+    
+    logging_manager = LoggingManager(config_manager_mock)
+    logging_manager.initialize()
+    
+    logger = logging.getLogger("test_logger")
+    for i in range(3000):
+        logger.info("Record %d %s", i, "x" * 500)
+    
+    logging_manager.shutdown()
+    
+    log_path = logging_config["file"]["path"]
+    assert os.path.exists(log_path + ".1")
+    assert os.path.getsize(log_path + ".1") <= 1024 * 1024
+    
+    with open(log_path, encoding="utf-8") as f:
+        assert "Record 2999" in f.read()
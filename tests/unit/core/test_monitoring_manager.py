@@ -1,8 +1,12 @@
 """Unit tests for the Resource Monitoring Manager."""
 
+import datetime
+import json
 import pytest
+import sys
+import threading
 import time
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, MagicMock, patch, call
 
 from nexus_core.core.monitoring_manager import ResourceMonitoringManager, AlertLevel
 from nexus_core.utils.exceptions import ManagerInitializationError, ManagerShutdownError
@@ -121,6 +125,14 @@ def test_monitoring_manager_initialization(mock_psutil, config_manager_mock):
 @patch('nexus_core.core.monitoring_manager.psutil')
 def test_collect_system_metrics(mock_psutil, monitoring_manager):
     """Test collecting system metrics."""
+    # Sample through psutil rather than /proc
+    monitoring_manager._read_proc = False
+    
+    # Give each gauge its own mock so their values can be told apart
+    monitoring_manager._cpu_percent_gauge = MagicMock()
+    monitoring_manager._memory_percent_gauge = MagicMock()
+    monitoring_manager._disk_percent_gauge = MagicMock()
+    
     # Set up mock return values
     mock_psutil.cpu_percent.return_value = 50.0
     mock_psutil.virtual_memory.return_value.percent = 60.0
@@ -130,7 +142,7 @@ def test_collect_system_metrics(mock_psutil, monitoring_manager):
     monitoring_manager._collect_system_metrics()
     
     # Verify the metrics were collected
-    mock_psutil.cpu_percent.assert_called_with(interval=1)
+    mock_psutil.cpu_percent.assert_called_with(interval=None)
     mock_psutil.virtual_memory.assert_called_once()
     mock_psutil.disk_usage.assert_called_with('/')
     
@@ -142,7 +154,7 @@ def test_collect_system_metrics(mock_psutil, monitoring_manager):
             'cpu_percent': 50.0,
             'memory_percent': 60.0,
             'disk_percent': 70.0,
-            'timestamp': mock.ANY
+            'timestamp': ANY
         }
     )
     
@@ -206,6 +218,7 @@ def test_alert_creation_and_resolution(monitoring_manager):
     )
     
     # Verify alert was created
+    assert alert_id == "alert-1"
     assert alert_id in monitoring_manager._alerts
     alert = monitoring_manager._alerts[alert_id]
     assert alert.level == AlertLevel.WARNING
@@ -248,6 +261,10 @@ def test_get_alerts(monitoring_manager):
     alerts = monitoring_manager.get_alerts()
     assert len(alerts) == 2
     
+    # Timestamps are reported in ISO 8601
+    assert datetime.datetime.fromisoformat(alerts[0]["timestamp"])
+    assert alerts[0]["resolved_at"] is None
+    
     # Test filtering by level
     critical_alerts = monitoring_manager.get_alerts(level=AlertLevel.CRITICAL)
     assert len(critical_alerts) == 1
@@ -319,7 +336,9 @@ def test_diagnostic_report(mock_psutil, monitoring_manager):
     mock_process.num_threads.return_value = 10
     mock_process.create_time.return_value = time.time() - 3600  # 1 hour ago
     
-    mock_psutil.Process.return_value = mock_process
+    monitoring_manager._process = mock_process
+    monitoring_manager._read_proc = False
+    monitoring_manager._process_start_monotonic = time.monotonic() - 3600
     mock_psutil.cpu_percent.return_value = 50.0
     
     mock_memory = MagicMock()
@@ -358,7 +377,7 @@ def test_diagnostic_report(mock_psutil, monitoring_manager):
     assert process["cpu_percent"] == 10.0
     assert process["memory_mb"] == 100.0
     assert process["threads"] == 10
-    assert "uptime_seconds" in process
+    assert process["uptime_seconds"] >= 3600
 
 
 def test_config_change_handling(monitoring_manager):
@@ -416,3 +435,341 @@ def test_monitoring_manager_status(monitoring_manager):
         assert "cpu_percent" in status["current_metrics"]
         assert "memory_percent" in status["current_metrics"]
         assert "disk_percent" in status["current_metrics"]
+
+
+def test_event_counter_children_are_cached(monitoring_manager):
+    """Test that each event type and source resolves its counter child once."""
+    monitoring_manager._metrics["events_total"] = MagicMock()
+    
+    event = MagicMock()
+    event.event_type = "test/event"
+    event.source = "test_source"
+    
+    for _ in range(3):
+        monitoring_manager._on_event(event)
+    
+    events_total = monitoring_manager._metrics["events_total"]
+    events_total.labels.assert_called_once_with(
+        event_type="test/event",
+        source="test_source"
+    )
+    assert events_total.labels.return_value.inc.call_count == 3
+
+
+def test_repeated_alert_updates_existing(monitoring_manager):
+    """Test that raising the same metric alert again updates it in place."""
+    first_id = monitoring_manager._create_alert(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent",
+        metric_value=85.0
+    )
+    second_id = monitoring_manager._create_alert(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent",
+        metric_value=88.0
+    )
+    
+    assert second_id == first_id
+    assert len(monitoring_manager._alerts) == 1
+    assert monitoring_manager._alerts[first_id].metric_value == 88.0
+    
+    # Once resolved, the next breach raises a fresh alert
+    monitoring_manager._resolve_alerts_for_metric("cpu_percent")
+    third_id = monitoring_manager._create_alert(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent",
+        metric_value=90.0
+    )
+    assert third_id != first_id
+
+
+def test_concurrent_alerts_are_not_duplicated(monitoring_manager):
+    """Test that threads raising the same alerts share one alert per metric."""
+    metrics = [f"metric_{i}" for i in range(8)]
+    barrier = threading.Barrier(8)
+    
+    def raise_alerts():
+        barrier.wait()
+        for _ in range(50):
+            for metric in metrics:
+                monitoring_manager._create_alert(
+                    level=AlertLevel.WARNING,
+                    message=f"{metric} high",
+                    source="test",
+                    metric_name=metric,
+                    metric_value=90.0
+                )
+    
+    threads = [threading.Thread(target=raise_alerts) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(monitoring_manager._alerts) == len(metrics)
+    assert sorted(a["metric_name"] for a in monitoring_manager.get_alerts()) == metrics
+
+
+def test_alert_dicts_are_cached_until_changed(monitoring_manager):
+    """Test that alert dictionaries are reused until the alert changes."""
+    kwargs = dict(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent",
+    )
+    monitoring_manager._create_alert(metric_value=85.0, **kwargs)
+    
+    first = monitoring_manager._alert_dicts(False, None, None)[0]
+    assert monitoring_manager._alert_dicts(False, None, None)[0] is first
+    
+    # Callers get copies they can modify without affecting the cache
+    copy = monitoring_manager.get_alerts()[0]
+    assert copy == first and copy is not first
+    copy["message"] = "changed"
+    assert monitoring_manager.get_alerts()[0]["message"] == "CPU high"
+    
+    # Raising the alert again refreshes it
+    monitoring_manager._create_alert(metric_value=90.0, **kwargs)
+    refreshed = monitoring_manager._alert_dicts(False, None, None)[0]
+    assert refreshed is not first
+    assert refreshed["metric_value"] == 90.0
+    
+    monitoring_manager._resolve_alerts_for_metric("cpu_percent")
+    resolved = monitoring_manager.get_alerts(include_resolved=True)[0]
+    assert resolved["resolved"] is True
+    assert resolved["resolved_at"] is not None
+
+
+def test_check_threshold_acts_only_on_transitions(monitoring_manager):
+    """Test that steady readings refresh alerts rather than raising new ones."""
+    publish = monitoring_manager._event_bus.publish
+    publish.reset_mock()
+    
+    with patch.object(monitoring_manager, "_resolve_alerts_for_metric") as resolve:
+        monitoring_manager._check_threshold("cpu_percent", 50.0)
+        monitoring_manager._check_threshold("cpu_percent", 55.0)
+        resolve.assert_not_called()
+    
+    monitoring_manager._check_threshold("cpu_percent", 85.0)
+    monitoring_manager._check_threshold("cpu_percent", 87.0)
+    
+    alert = list(monitoring_manager._alerts.values())[0]
+    assert alert.message == "Cpu Percent is high: 85.0%"
+    assert alert.metric_value == 87.0
+    
+    monitoring_manager._check_threshold("cpu_percent", 50.0)
+    assert len(monitoring_manager._alerts) == 0
+    assert len(monitoring_manager._resolved_alerts) == 1
+    
+    # Shutting down publishes the queued events: one raise, one resolve
+    monitoring_manager.shutdown()
+    event_types = [c.kwargs["event_type"] for c in publish.call_args_list]
+    assert event_types == ["monitoring/alert", "monitoring/alert_resolved"]
+    
+    # Event timestamps are ISO 8601 strings, as get_alerts() returns them
+    raised, resolved = (c.kwargs["payload"] for c in publish.call_args_list)
+    assert datetime.datetime.fromisoformat(raised["timestamp"])
+    assert datetime.datetime.fromisoformat(resolved["resolved_at"])
+
+
+def test_collect_uptime_metrics(monitoring_manager):
+    """Test that uptime is measured from the process start time."""
+    monitoring_manager._metrics["app_uptime_seconds"] = MagicMock()
+    monitoring_manager._process_start_monotonic = time.monotonic() - 120
+    
+    monitoring_manager._collect_uptime_metrics()
+    
+    uptime = monitoring_manager._metrics["app_uptime_seconds"].set.call_args[0][0]
+    assert 120 <= uptime < 130
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+@patch('nexus_core.core.monitoring_manager.psutil')
+def test_sample_system_reads_proc(mock_psutil, monitoring_manager):
+    """Test that system samples are read from /proc without psutil on Linux."""
+    monitoring_manager._sample_system()
+    time.sleep(0.05)
+    cpu_percent, memory_percent, disk_percent = monitoring_manager._sample_system()
+    
+    for value in (cpu_percent, memory_percent, disk_percent):
+        assert 0.0 <= value <= 100.0
+    assert monitoring_manager._read_proc is True
+    mock_psutil.cpu_percent.assert_not_called()
+    mock_psutil.virtual_memory.assert_not_called()
+    mock_psutil.disk_usage.assert_not_called()
+
+
+def test_status_reuses_recent_sample(monitoring_manager):
+    """Test that status() reports the cached sample instead of resampling."""
+    with patch.object(
+        monitoring_manager, "_sample_system", return_value=(10.0, 20.0, 30.0)
+    ) as sample_system:
+        monitoring_manager._collect_system_metrics()
+        first = monitoring_manager.status()["current_metrics"]
+        second = monitoring_manager.status()["current_metrics"]
+        
+        assert sample_system.call_count == 1
+        assert first == second == {
+            "cpu_percent": 10.0,
+            "memory_percent": 20.0,
+            "disk_percent": 30.0,
+        }
+        
+        # Once the sample is too old, a new one is taken
+        monitoring_manager._sample_cache = (0.0, (10.0, 20.0, 30.0))
+        monitoring_manager.status()
+        assert sample_system.call_count == 2
+
+
+def test_resolved_alerts_are_formatted_once(monitoring_manager):
+    """Test that resolved alerts are formatted when resolved, not when listed."""
+    monitoring_manager._create_alert(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent"
+    )
+    monitoring_manager._resolve_alerts_for_metric("cpu_percent")
+    
+    with patch("nexus_core.core.monitoring_manager._iso") as iso:
+        alerts = monitoring_manager.get_alerts(include_resolved=True)
+        iso.assert_not_called()
+    
+    assert len(alerts) == 1
+    assert alerts[0]["resolved"] is True
+
+
+def test_register_event_type(monitoring_manager):
+    """Test that declared event types are counted without resolving labels."""
+    events_total = MagicMock()
+    monitoring_manager._metrics["events_total"] = events_total
+    
+    child = monitoring_manager.register_event_type("test/declared", "test_source")
+    events_total.labels.assert_called_once_with(
+        event_type="test/declared",
+        source="test_source"
+    )
+    
+    event = MagicMock()
+    event.event_type = "test/declared"
+    event.source = "test_source"
+    monitoring_manager._on_event(event)
+    monitoring_manager._on_event(event)
+    
+    assert events_total.labels.call_count == 1
+    assert child.inc.call_count == 2
+
+
+def test_metrics_are_published_in_batches(monitoring_manager):
+    """Test that samples are published together once a batch fills."""
+    monitoring_manager._metrics_batch_size = 3
+    publish = monitoring_manager._event_bus.publish
+    publish.reset_mock()
+    
+    with patch.object(
+        monitoring_manager, "_sample_system", return_value=(10.0, 20.0, 30.0)
+    ):
+        for _ in range(2):
+            monitoring_manager._collect_system_metrics()
+        publish.assert_not_called()
+        
+        monitoring_manager._collect_system_metrics()
+    
+    publish.assert_called_once()
+    kwargs = publish.call_args.kwargs
+    assert kwargs["event_type"] == "monitoring/metrics_batch"
+    samples = kwargs["payload"]["samples"]
+    assert len(samples) == 3
+    assert all(sample[1:] == (10.0, 20.0, 30.0) for sample in samples)
+    assert monitoring_manager._metrics_batch == []
+    
+    # A partly filled batch is published at shutdown
+    publish.reset_mock()
+    with patch.object(
+        monitoring_manager, "_sample_system", return_value=(10.0, 20.0, 30.0)
+    ):
+        monitoring_manager._collect_system_metrics()
+    
+    monitoring_manager.shutdown()
+    batches = [
+        c.kwargs["payload"]["samples"] for c in publish.call_args_list
+        if c.kwargs["event_type"] == "monitoring/metrics_batch"
+    ]
+    assert len(batches) == 1 and len(batches[0]) == 1
+
+
+def test_events_not_observed_without_prometheus(config_manager_mock, monitoring_config):
+    """Test that the manager skips the event bus when Prometheus is disabled."""
+    monitoring_config["prometheus"]["enabled"] = False
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    event_bus_manager = MagicMock()
+    
+    monitoring_mgr = ResourceMonitoringManager(
+        config_manager_mock,
+        logger_manager,
+        event_bus_manager,
+        MagicMock()
+    )
+    monitoring_mgr.initialize()
+    
+    event_bus_manager.subscribe.assert_not_called()
+    
+    monitoring_mgr.shutdown()
+    event_bus_manager.unsubscribe.assert_not_called()
+
+
+def test_alert_events_published_off_the_collecting_thread(monitoring_manager):
+    """Test that alert events are handed to the event bus by the publisher thread."""
+    threads = []
+    published = threading.Event()
+    
+    def publish(**kwargs):
+        if kwargs["event_type"] == "monitoring/alert":
+            threads.append(threading.current_thread())
+            published.set()
+    
+    monitoring_manager._event_bus.publish.side_effect = publish
+    monitoring_manager._create_alert(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent"
+    )
+    
+    assert published.wait(timeout=1.0)
+    assert threads[0] is not threading.current_thread()
+    assert threads[0].name == "monitoring-publisher"
+
+
+def test_get_alerts_json_is_cached_until_alerts_change(monitoring_manager):
+    """Test that serialized alerts are reused until an alert changes."""
+    kwargs = dict(
+        level=AlertLevel.WARNING,
+        message="CPU high",
+        source="test",
+        metric_name="cpu_percent",
+    )
+    monitoring_manager._create_alert(metric_value=85.0, **kwargs)
+    
+    first = monitoring_manager.get_alerts_json()
+    assert json.loads(first) == monitoring_manager.get_alerts()
+    assert monitoring_manager.get_alerts_json() is first
+    
+    # Different filters are rendered separately
+    assert json.loads(monitoring_manager.get_alerts_json(level=AlertLevel.CRITICAL)) == []
+    
+    monitoring_manager._create_alert(metric_value=90.0, **kwargs)
+    refreshed = monitoring_manager.get_alerts_json()
+    assert refreshed is not first
+    assert json.loads(refreshed)[0]["metric_value"] == 90.0
+    
+    monitoring_manager._resolve_alerts_for_metric("cpu_percent")
+    assert json.loads(monitoring_manager.get_alerts_json()) == []
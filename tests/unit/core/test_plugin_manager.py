@@ -5,10 +5,11 @@ import sys
 import pytest
 import tempfile
 import shutil
+import types
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from nexus_core.core.plugin_manager import PluginManager, PluginState
+from nexus_core.core.plugin_manager import PluginManager, PluginState, _class_cache
 from nexus_core.utils.exceptions import PluginError
 
 
@@ -120,7 +121,7 @@ def test_plugin_manager_initialization(config_manager_mock, event_bus_mock, file
     assert plugin_mgr.healthy
     
     # Event bus subscriptions should be set up
-    event_bus_mock.subscribe.assert_called()
+    event_bus_mock.subscribe_many.assert_called_once()
     
     plugin_mgr.shutdown()
     assert not plugin_mgr.initialized
@@ -392,3 +393,383 @@ def test_operations_without_initialization():
     
     with pytest.raises(PluginError):
         plugin_mgr.load_plugin("test_plugin")
+
+
+# Plugins recorded by ChainPlugin.shutdown, in shutdown order
+_chain_shutdowns = []
+
+
+class ChainPlugin(TestPlugin):
+    name = "chain_a"
+    
+    def shutdown(self):
+        _chain_shutdowns.append(self.name)
+        super().shutdown()
+
+
+class ChainPluginB(ChainPlugin):
+    name = "chain_b"
+    dependencies = ["chain_a"]
+
+
+class ChainPluginC(ChainPlugin):
+    name = "chain_c"
+    dependencies = ["chain_b"]
+
+
+def test_shutdown_unloads_dependents_first(plugin_manager):
+    """Test that shutdown unloads a dependency chain in reverse dependency order."""
+    _chain_shutdowns.clear()
+    
+    # Chain: chain_c -> chain_b -> chain_a, registered out of order
+    for plugin_class in (ChainPluginC, ChainPlugin, ChainPluginB):
+        plugin_manager._register_plugin(
+            plugin_manager._extract_plugin_metadata(plugin_class, plugin_class.name)
+        )
+    
+    assert plugin_manager._topo_order(["chain_c", "chain_a", "chain_b"]) == [
+        "chain_a", "chain_b", "chain_c"
+    ]
+    
+    assert plugin_manager.load_plugin("chain_c") is True
+    assert plugin_manager._dependents["chain_a"] == {"chain_b"}
+    assert plugin_manager._dependents["chain_b"] == {"chain_c"}
+    
+    # The dependents index keeps a dependency loaded while its dependents are
+    assert plugin_manager.unload_plugin("chain_a") is False
+    
+    plugin_manager.shutdown()
+    
+    assert _chain_shutdowns == ["chain_c", "chain_b", "chain_a"]
+    assert all(
+        plugin_manager._plugins[name].state == PluginState.INACTIVE
+        for name in ("chain_a", "chain_b", "chain_c")
+    )
+    assert plugin_manager._state_counts[PluginState.ACTIVE] == 0
+    assert all(count >= 0 for count in plugin_manager._state_counts.values())
+
+
+def test_entry_points_are_cached_per_group(plugin_manager):
+    """Test that entry point discovery reads package metadata once per group."""
+    plugin_manager.invalidate_entry_point_cache()
+    
+    with patch("importlib.metadata.entry_points", return_value=[]) as entry_points:
+        plugin_manager._discover_entry_point_plugins()
+        plugin_manager._discover_entry_point_plugins()
+        assert entry_points.call_count == 1
+        entry_points.assert_called_with(group="nexus_core.plugins")
+        
+        plugin_manager.invalidate_entry_point_cache()
+        plugin_manager._discover_entry_point_plugins()
+        assert entry_points.call_count == 2
+    
+    plugin_manager.invalidate_entry_point_cache()
+
+
+def test_plugin_class_lookup_is_cached(plugin_manager):
+    """Test that plugin classes are resolved once and re-resolved after a reload."""
+    plugin_info = plugin_manager._plugins["test_plugin"]
+    _class_cache.cache_clear()
+    
+    first = plugin_manager._get_plugin_class(plugin_info)
+    assert plugin_manager._get_plugin_class(plugin_info) is first
+    assert _class_cache.cache_info().hits == 1
+    
+    # Reloading re-executes the module, so the cached class must be dropped
+    plugin_info.metadata["source_mtime_ns"] = 0
+    plugin_manager.load_plugin("test_plugin")
+    assert plugin_manager.reload_plugin("test_plugin") is True
+    assert plugin_manager._get_plugin_class(plugin_info) is sys.modules[first.__module__].TestPlugin
+
+
+class DependentPlugin(TestPlugin):
+    name = "dependent_plugin"
+    dependencies = ["test_plugin"]
+
+
+def test_dependents_index_tracks_loaded_plugins(plugin_manager):
+    """Test that a dependency can be unloaded once its dependents are unloaded."""
+    plugin_info = plugin_manager._extract_plugin_metadata(DependentPlugin, "dependent_plugin")
+    plugin_manager._register_plugin(plugin_info)
+    
+    assert plugin_manager.load_plugin("dependent_plugin") is True
+    assert plugin_manager._dependents["test_plugin"] == {"dependent_plugin"}
+    
+    assert plugin_manager.unload_plugin("test_plugin") is False
+    assert plugin_manager._plugins["test_plugin"].state == PluginState.ACTIVE
+    
+    assert plugin_manager.unload_plugin("dependent_plugin") is True
+    assert not plugin_manager._dependents["test_plugin"]
+    assert plugin_manager.unload_plugin("test_plugin") is True
+
+
+def test_discover_directory_plugins(plugin_manager, temp_plugin_dir):
+    """Test discovering package and plugin.py style plugins from the plugin directory."""
+    package_dir = Path(temp_plugin_dir) / "scan_package_plugin"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        "class Plugin:\n"
+        "    name = 'scan_package_plugin'\n"
+        "    version = '1.0.0'\n"
+        "    description = 'Package plugin'\n"
+    )
+    
+    file_dir = Path(temp_plugin_dir) / "scan_file_plugin"
+    file_dir.mkdir()
+    (file_dir / "plugin.py").write_text(
+        "class Plugin:\n"
+        "    name = 'scan_file_plugin'\n"
+        "    version = '1.0.0'\n"
+        "    description = 'File plugin'\n"
+    )
+    
+    # Neither a directory with plugin code nor a directory at all
+    (Path(temp_plugin_dir) / "empty_dir").mkdir()
+    (Path(temp_plugin_dir) / "stray.py").write_text("")
+    
+    try:
+        plugin_manager._discover_directory_plugins()
+    finally:
+        sys.modules.pop("scan_package_plugin", None)
+    
+    assert plugin_manager._plugins["scan_package_plugin"].path == str(package_dir)
+    assert plugin_manager._plugins["scan_file_plugin"].path == str(file_dir)
+    assert "empty_dir" not in plugin_manager._plugins
+    assert "stray" not in plugin_manager._plugins
+
+
+def test_status_counts_follow_state_changes(plugin_manager):
+    """Test that status plugin counts stay current as plugins change state."""
+    plugin_manager._register_plugin(
+        plugin_manager._extract_plugin_metadata(DependentPlugin, "dependent_plugin")
+    )
+    
+    plugin_manager.load_plugin("dependent_plugin")
+    counts = plugin_manager.status()["plugins"]
+    assert (counts["active"], counts["disabled"]) == (2, 0)
+    
+    plugin_manager.disable_plugin("dependent_plugin")
+    counts = plugin_manager.status()["plugins"]
+    assert (counts["active"], counts["disabled"]) == (1, 1)
+    assert plugin_manager._state_counts[PluginState.INACTIVE] == 0
+
+
+def test_enabled_sets_follow_config_changes(plugin_manager):
+    """Test that enable state reflects list updates from config changes."""
+    assert plugin_manager._is_plugin_enabled("test_plugin") is True
+    
+    plugin_manager._on_config_changed("plugins.disabled", ["test_plugin"])
+    assert plugin_manager._is_plugin_enabled("test_plugin") is False
+    
+    plugin_manager._on_config_changed("plugins.disabled", [])
+    plugin_manager._on_config_changed("plugins.autoload", False)
+    assert plugin_manager._is_plugin_enabled("test_plugin") is True
+    assert plugin_manager._is_plugin_enabled("other_plugin") is False
+
+
+def test_find_plugin_class(plugin_manager):
+    """Test that only classes with the required attributes are found."""
+    module = types.ModuleType("fake_plugin_module")
+    module.name = "not a class"
+    module.Helper = type("Helper", (), {"name": "helper"})
+    module.Plugin = TestPlugin
+    
+    assert plugin_manager._find_plugin_class(module) is TestPlugin
+    
+    del module.Plugin
+    assert plugin_manager._find_plugin_class(module) is None
+
+
+def test_extract_plugin_metadata_defaults(plugin_manager):
+    """Test that missing metadata attributes fall back to defaults individually."""
+    plugin_class = type("PartialPlugin", (), {"version": "2.0.0"})
+    
+    plugin_info = plugin_manager._extract_plugin_metadata(plugin_class, "partial")
+    
+    assert plugin_info.name == "partial"
+    assert plugin_info.version == "2.0.0"
+    assert plugin_info.description == "No description"
+    assert plugin_info.author == "Unknown"
+    assert plugin_info.dependencies == []
+
+
+def test_plugin_info_has_no_instance_dict(plugin_manager):
+    """Test that plugin records are slotted."""
+    plugin_info = plugin_manager._plugins["test_plugin"]
+    
+    assert not hasattr(plugin_info, "__dict__")
+    with pytest.raises(AttributeError):
+        plugin_info.unknown_field = True
+
+
+def test_plugin_info_dicts_are_independent(plugin_manager):
+    """Test that plugin info dicts reflect current state and are not shared."""
+    first = plugin_manager.get_plugin_info("test_plugin")
+    assert list(first) == [
+        "name", "version", "description", "author", "state", "dependencies",
+        "path", "error", "load_time", "metadata", "enabled",
+    ]
+    assert first["state"] == PluginState.DISCOVERED.value
+    assert first["load_time"] is None
+    
+    first["name"] = "changed"
+    plugin_manager.load_plugin("test_plugin")
+    
+    second = plugin_manager.get_plugin_info("test_plugin")
+    assert second["name"] == "test_plugin"
+    assert second["state"] == PluginState.ACTIVE.value
+    assert second["load_time"] is not None
+
+
+def test_active_plugins_follow_state_changes(plugin_manager):
+    """Test that active plugins are tracked through load, unload and disable."""
+    plugin_manager._register_plugin(
+        plugin_manager._extract_plugin_metadata(DependentPlugin, "dependent_plugin")
+    )
+    
+    plugin_manager.load_plugin("dependent_plugin")
+    names = [info["name"] for info in plugin_manager.get_active_plugins()]
+    assert names == ["test_plugin", "dependent_plugin"]
+    
+    plugin_manager.disable_plugin("dependent_plugin")
+    plugin_manager.unload_plugin("test_plugin")
+    assert plugin_manager.get_active_plugins() == []
+
+
+def test_plugin_dir_added_to_sys_path_once(plugin_manager, temp_plugin_dir):
+    """Test that rediscovery does not re-check or re-add the plugin directory."""
+    plugin_dir = str(Path(temp_plugin_dir).absolute())
+    assert plugin_manager._sys_path_installed is True
+    
+    sys.path.remove(plugin_dir)
+    plugin_manager._discover_directory_plugins()
+    
+    assert plugin_dir not in sys.path
+
+
+def test_event_payloads_are_reused(plugin_manager):
+    """Test that repeated lifecycle events share their precomputed payloads."""
+    payloads = []
+    plugin_manager._event_bus.publish.side_effect = (
+        lambda event_type, source, payload: payloads.append((event_type, payload))
+    )
+    
+    for _ in range(2):
+        plugin_manager.load_plugin("test_plugin")
+        plugin_manager.unload_plugin("test_plugin")
+    
+    loaded = [payload for event_type, payload in payloads if event_type == "plugin/loaded"]
+    unloaded = [payload for event_type, payload in payloads if event_type == "plugin/unloaded"]
+    assert loaded[0] is loaded[1]
+    assert unloaded[0] is unloaded[1]
+    assert unloaded[0] == {"plugin_name": "test_plugin"}
+    
+    # Shared payloads are read-only, so a subscriber cannot change later events
+    with pytest.raises(TypeError):
+        loaded[0]["version"] = "changed"
+
+
+def test_lazy_loading_defers_until_instance_requested(plugin_config, event_bus_mock, file_manager_mock):
+    """Test that lazy mode loads a plugin only when its instance is requested."""
+    plugin_config["lazy"] = True
+    config_manager = MagicMock()
+    config_manager.get.return_value = plugin_config
+    logger_manager = MagicMock()
+    logger_manager.get_logger.return_value = MagicMock()
+    
+    plugin_mgr = PluginManager(config_manager, logger_manager, event_bus_mock, file_manager_mock)
+    plugin_mgr.initialize()
+    plugin_mgr._register_plugin(plugin_mgr._extract_plugin_metadata(TestPlugin, "test_plugin"))
+    
+    assert plugin_mgr._plugins["test_plugin"].state == PluginState.DISCOVERED
+    
+    instance = plugin_mgr.get_plugin_instance("test_plugin")
+    assert isinstance(instance, TestPlugin)
+    assert instance._initialized is True
+    assert plugin_mgr.get_plugin_instance("test_plugin") is instance
+    
+    with pytest.raises(PluginError):
+        plugin_mgr.get_plugin_instance("missing_plugin")
+    
+    plugin_mgr.shutdown()
+
+
+class ChainedPlugin(TestPlugin):
+    name = "chained_plugin"
+    dependencies = ["dependent_plugin"]
+
+
+def test_bulk_load_orders_dependencies_without_recursion(plugin_manager):
+    """Test that loading enabled plugins loads each plugin once, dependencies first."""
+    # Registered dependents-first, so registry order would be wrong
+    for plugin_class in (ChainedPlugin, DependentPlugin):
+        plugin_manager._register_plugin(
+            plugin_manager._extract_plugin_metadata(plugin_class, plugin_class.name)
+        )
+    
+    calls = []
+    load_plugin = plugin_manager.load_plugin
+    
+    def record_load(plugin_name):
+        calls.append(plugin_name)
+        return load_plugin(plugin_name)
+    
+    plugin_manager.load_plugin = record_load
+    plugin_manager._load_enabled_plugins()
+    
+    assert calls == ["test_plugin", "dependent_plugin", "chained_plugin"]
+    assert all(
+        info.state == PluginState.ACTIVE for info in plugin_manager._plugins.values()
+    )
+
+
+def test_plugin_names_are_interned(plugin_manager):
+    """Test that plugin and dependency names are interned."""
+    name = "".join(["interned_", "plugin"])
+    dependency = "".join(["test_", "plugin"])
+    plugin_class = type("InternedPlugin", (), {
+        "name": name,
+        "version": "0.1.0",
+        "description": "Interned",
+        "dependencies": [dependency],
+    })
+    
+    plugin_info = plugin_manager._extract_plugin_metadata(plugin_class, name)
+    assert plugin_info.name is sys.intern(name)
+    assert plugin_info.dependencies[0] is sys.intern(dependency)
+    
+    plugin_manager._on_config_changed("plugins.enabled", [name])
+    assert plugin_manager._enabled_plugins[0] is sys.intern(name)
+
+
+def test_reload_skips_unchanged_module(plugin_manager):
+    """Test that reloading only re-executes the module when its source changed."""
+    plugin_manager.load_plugin("test_plugin")
+    plugin_info = plugin_manager._plugins["test_plugin"]
+    assert plugin_info.metadata["source_mtime_ns"] is not None
+    
+    with patch("importlib.reload") as reload:
+        assert plugin_manager.reload_plugin("test_plugin") is True
+        reload.assert_not_called()
+        
+        # Pretend the source was modified after the plugin was discovered
+        plugin_info.metadata["source_mtime_ns"] = 0
+        assert plugin_manager.reload_plugin("test_plugin") is True
+        reload.assert_called_once()
+    
+    assert plugin_info.state == PluginState.ACTIVE
+
+
+def test_config_changes_dispatch_by_key(plugin_manager):
+    """Test that plugin config changes are applied and unknown keys ignored."""
+    plugin_manager._on_config_changed("plugins.lazy", True)
+    plugin_manager._on_config_changed("plugins.autoload", False)
+    plugin_manager._on_config_changed("plugins.unknown", "ignored")
+    plugin_manager._on_config_changed("plugins.directory", "/elsewhere")
+    
+    assert plugin_manager._lazy is True
+    assert plugin_manager._auto_load is False
+    plugin_manager._logger.warning.assert_called_with(
+        "Changing plugin directory requires restart to take effect",
+        extra={"directory": "/elsewhere"},
+    )
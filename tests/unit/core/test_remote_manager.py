@@ -1,6 +1,8 @@
 import pytest
 import os
 import json
+import threading
+import httpx
 from unittest.mock import MagicMock, patch
 from nexus_core.core.remote_manager import RemoteServicesManager, ServiceProtocol, HTTPService, AsyncHTTPService
 
@@ -134,9 +136,9 @@ def test_get_service(remote_manager):
     nonexistent = remote_manager.get_service('nonexistent')
     assert nonexistent is None
 
-@patch('nexus_core.core.remote_manager.HTTPService')
-def test_http_service_methods(mock_http, remote_manager):
-    mock_service = MagicMock()
+def test_http_service_methods(remote_manager):
+    mock_service = MagicMock(spec=HTTPService)
+    mock_service.get.return_value.headers = {'content-type': 'application/json'}
     mock_service.get.return_value.json.return_value = {'data': 'test'}
     remote_manager._services['test_service'] = mock_service
     
@@ -241,3 +243,199 @@ def test_event_handlers(mock_http, remote_manager):
     
     # The original test_service should be unregistered
     assert 'test_service' not in remote_manager._services
+
+def test_service_metrics_from_many_threads():
+    service = HTTPService('metrics_service', 'https://metrics.example.com')
+    
+    def record():
+        for i in range(1000):
+            service._update_metrics(0.5, success=i % 10 != 0)
+    
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    status = service.status()
+    assert status['request_count'] == 8000
+    assert status['error_count'] == 800
+    assert status['error_rate'] == 0.1
+    assert status['avg_response_time'] == pytest.approx(0.5)
+
+def test_http_client_pool_limits():
+    service = HTTPService(
+        'pooled_service',
+        'https://pooled.example.com',
+        pool_max_connections=50,
+        pool_max_keepalive=25,
+        keepalive_expiry=15.0,
+    )
+    
+    with patch('nexus_core.core.remote_manager.httpx.Client') as mock_client:
+        service.get_client()
+    
+    limits = mock_client.call_args.kwargs['limits']
+    assert limits.max_connections == 50
+    assert limits.max_keepalive_connections == 25
+    assert limits.keepalive_expiry == 15.0
+
+def test_async_service_blocking_calls_share_manager_loop(remote_manager):
+    service = AsyncHTTPService('async_service', 'https://async.example.com')
+    threads = []
+    
+    async def check_health_async(use_cache=True):
+        threads.append(threading.current_thread())
+        return True
+    
+    service.check_health_async = check_health_async
+    remote_manager.register_service(service)
+    
+    assert service.check_health() is True
+    assert service.check_health() is True
+    
+    # Both checks ran on the one loop thread owned by the manager
+    assert threads[0] is threads[1]
+    assert threads[0] is remote_manager._loop_thread
+    
+    loop_thread = remote_manager._loop_thread
+    remote_manager.shutdown()
+    assert not loop_thread.is_alive()
+
+def test_health_checks_run_concurrently(remote_manager):
+    barrier = threading.Barrier(3, timeout=5.0)
+    
+    def check_health(use_cache=True):
+        # Only returns if all three checks are in flight at the same time
+        barrier.wait()
+        return True
+    
+    services = {}
+    for name in ('service1', 'service2', 'service3'):
+        services[name] = MagicMock()
+        services[name].check_health.side_effect = check_health
+    remote_manager._services = services
+    
+    result = remote_manager.check_all_services_health()
+    
+    assert result == {'service1': True, 'service2': True, 'service3': True}
+
+def test_async_health_checks_gathered_on_shared_loop(remote_manager):
+    statuses = {'async1': True, 'async2': False}
+    
+    for name, healthy in statuses.items():
+        service = AsyncHTTPService(name, f'https://{name}.example.com')
+        
+        async def check_health_async(use_cache=True, healthy=healthy):
+            return healthy
+        
+        service.check_health_async = check_health_async
+        remote_manager.register_service(service)
+    
+    result = remote_manager.check_all_services_health()
+    
+    assert result['async1'] is True
+    assert result['async2'] is False
+
+def test_http_request_retries_with_backoff():
+    service = HTTPService('flaky_service', 'https://flaky.example.com', max_retries=3, retry_delay=0.5)
+    response = MagicMock(is_success=True)
+    service._client = MagicMock()
+    service._client.request.side_effect = [httpx.HTTPError('reset'), httpx.HTTPError('reset'), response]
+    
+    with patch('nexus_core.core.remote_manager.time.sleep') as mock_sleep:
+        assert service.request('GET', '/data') is response
+    
+    assert service._client.request.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+def test_http_request_gives_up_after_max_retries():
+    service = HTTPService('down_service', 'https://down.example.com', max_retries=2)
+    service._client = MagicMock()
+    service._client.request.side_effect = httpx.HTTPError('refused')
+    
+    with patch('nexus_core.core.remote_manager.time.sleep'):
+        with pytest.raises(httpx.HTTPError):
+            service.request('GET', '/data')
+    
+    assert service._client.request.call_count == 2
+    
+    service._client.request.reset_mock(side_effect=True)
+    service._client.request.side_effect = ValueError('bad request')
+    with pytest.raises(ValueError):
+        service.request('GET', '/data')
+    
+    assert service._client.request.call_count == 1
+
+def test_health_check_result_cached_within_ttl(remote_manager):
+    service = HTTPService('cached_service', 'https://cached.example.com')
+    service._client = MagicMock()
+    service._client.get.return_value = MagicMock(is_success=True)
+    remote_manager.register_service(service)
+    
+    assert service.health_cache_ttl == 5.0
+    assert remote_manager.check_all_services_health() == {'cached_service': True}
+    assert remote_manager.check_all_services_health() == {'cached_service': True}
+    assert service._client.get.call_count == 1
+    
+    # Scheduled checks always probe the service
+    remote_manager._health_check_task()
+    assert service._client.get.call_count == 2
+    
+    service._last_health_ts -= service.health_cache_ttl
+    remote_manager.check_service_health('cached_service')
+    assert service._client.get.call_count == 3
+
+def test_make_request_returns_text_for_non_json_responses(remote_manager):
+    service = HTTPService('text_service', 'https://text.example.com')
+    response = MagicMock(headers={'content-type': 'text/plain'}, text='pong')
+    remote_manager.register_service(service)
+    
+    with patch.object(service, 'request', return_value=response) as mock_request:
+        assert remote_manager.make_request('text_service', 'OPTIONS', '/ping') == 'pong'
+    
+    mock_request.assert_called_once_with('OPTIONS', '/ping')
+    response.json.assert_not_called()
+
+def test_service_lookups_do_not_wait_for_registry_lock(remote_manager):
+    service = HTTPService('lookup_service', 'https://lookup.example.com')
+    remote_manager.register_service(service)
+    snapshot = remote_manager._services
+    
+    with remote_manager._services_lock:
+        result = []
+        reader = threading.Thread(target=lambda: result.append(remote_manager.get_service('lookup_service')))
+        reader.start()
+        reader.join(timeout=5.0)
+        assert result == [service]
+    
+    # Registry changes publish a new dict instead of mutating the old one
+    remote_manager.unregister_service('lookup_service')
+    assert 'lookup_service' in snapshot
+    assert remote_manager.get_service('lookup_service') is None
+
+def test_register_service_warms_up_connection(remote_manager):
+    service = HTTPService('warm_service', 'https://warm.example.com')
+    
+    with patch('nexus_core.core.remote_manager.httpx.Client') as mock_client:
+        remote_manager.register_service(service)
+    
+    mock_client.assert_called_once()
+    assert service._client is mock_client.return_value
+    remote_manager._thread_manager.submit_task.assert_called_once_with(
+        service.check_health,
+        name='remote_service_warm_up_warm_service',
+        submitter='remote_manager',
+    )
+
+def test_register_async_service_creates_client_without_connecting(remote_manager):
+    service = AsyncHTTPService('warm_async', 'https://warm-async.example.com')
+    service.check_health_async = MagicMock()
+    
+    with patch('nexus_core.core.remote_manager.httpx.AsyncClient') as mock_client:
+        remote_manager.register_service(service)
+    
+    # Connections must be opened from the loop that makes the requests
+    assert service._client is mock_client.return_value
+    service.check_health_async.assert_not_called()
+    remote_manager._thread_manager.submit_task.assert_not_called()
@@ -1,6 +1,7 @@
 """Unit tests for the Thread Manager."""
 
 import pytest
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -209,3 +210,18 @@ def test_submit_without_initialization():
     
     with pytest.raises(ThreadManagerError):
         thread_mgr.submit_task(lambda: None)
+
+
+def test_periodic_task_scheduled_while_idle_runs_promptly(thread_manager):
+    """Test that scheduling a task wakes the idle periodic scheduler."""
+    ran = threading.Event()
+    
+    # With no periodic tasks the scheduler waits until one is scheduled
+    time.sleep(0.2)
+    start = time.monotonic()
+    task_id = thread_manager.schedule_periodic_task(interval=60.0, func=ran.set)
+    
+    assert ran.wait(timeout=1.0)
+    assert time.monotonic() - start < 0.5
+    
+    thread_manager.cancel_periodic_task(task_id)